@@ -0,0 +1,94 @@
+"""Measures the memory used by the cache of a synthetic guild.
+
+Builds one guild with ``--members`` members and ``--channels`` text channels,
+feeds ``--messages`` MESSAGE_CREATE payloads through the connection state and
+prints the process RSS before and after, together with
+:meth:`discord.Client.cache_stats`.
+
+    python benchmarks/cache_memory.py --members 100000 --messages 10000
+"""
+
+import argparse
+import gc
+import os
+import resource
+import sys
+
+# run from a checkout without installing the library
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import discord
+
+
+def rss():
+    # current RSS in bytes; falls back to the peak RSS where /proc is not available
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def user(i):
+    return {'id': str(i), 'username': 'user%d' % i, 'discriminator': '%04d' % (i % 10000), 'avatar': None}
+
+
+def guild_payload(guild_id, members, channels):
+    return {
+        'id': str(guild_id),
+        'name': 'benchmark',
+        'member_count': members,
+        'roles': [{'id': str(guild_id), 'name': '@everyone', 'permissions': '104324673', 'position': 0}],
+        'channels': [{'id': str(guild_id + 1 + i), 'type': 0, 'name': 'channel-%d' % i, 'position': i}
+                     for i in range(channels)],
+        'members': [{'user': user(guild_id + 1000 + i), 'roles': [], 'joined_at': '2021-01-01T00:00:00+00:00'}
+                    for i in range(members)],
+    }
+
+
+def message_payload(message_id, channel_id, author):
+    return {
+        'id': str(message_id), 'channel_id': str(channel_id), 'type': 0, 'content': 'hello %d' % message_id,
+        'author': author, 'attachments': [], 'embeds': [], 'mentions': [], 'mention_roles': [],
+        'edited_timestamp': None, 'pinned': False, 'mention_everyone': False, 'tts': False,
+    }
+
+
+def mib(n):
+    return '%.1f MiB' % (n / 1024 / 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--members', type=int, default=100000)
+    parser.add_argument('--messages', type=int, default=10000)
+    parser.add_argument('--channels', type=int, default=50)
+    parser.add_argument('--message-cache-bytes', type=int, default=None)
+    args = parser.parse_args()
+
+    client = discord.Client(intents=discord.Intents.all(), max_messages=args.messages,
+                            message_cache_bytes=args.message_cache_bytes)
+    state = client._connection
+    state.dispatch = lambda *args, **kwargs: None
+
+    guild_id = 1 << 22
+    gc.collect()
+    before = rss()
+
+    state._add_guild_from_data(guild_payload(guild_id, args.members, args.channels))
+    for i in range(args.messages):
+        author = user(guild_id + 1000 + i % max(args.members, 1))
+        state.parse_message_create(message_payload((guild_id << 1) + i, guild_id + 1 + i % args.channels, author))
+
+    gc.collect()
+    after = rss()
+
+    print('members: %d, messages: %d' % (args.members, args.messages))
+    print('RSS before: %s, after: %s, delta: %s' % (mib(before), mib(after), mib(after - before)))
+    for section, stats in client.cache_stats(sample=1000).items():
+        print('  %-16s %8d objects %12s' % (section, stats['count'], mib(stats['size'])))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""Compares waiting for the clicks of many messages with wait_for and with ComponentSessions.
+
+Starts waiting for the clicks of ``--messages`` messages and then parses
+``--clicks`` button clicks on some of them, printing the set-up time and the
+time per click for both.
+
+    python benchmarks/component_sessions.py --messages 100000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import types
+
+# run from a checkout without installing the library
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import discord
+
+
+COMPONENTS = [discord.ActionRow(discord.Button(label='x', custom_id='a'))]
+CHANNEL = types.SimpleNamespace(id=1)
+
+
+def message(message_id):
+    return types.SimpleNamespace(id=message_id, channel=CHANNEL, components=COMPONENTS)
+
+
+def click(message_id):
+    return {
+        'type': 3, 'id': '5', 'token': 'token', 'application_id': '9', 'channel_id': '1',
+        'user': {'id': '7', 'username': 'user', 'discriminator': '0001', 'avatar': None},
+        'message': {'id': str(message_id), 'channel_id': '1', 'content': '',
+                    'components': [{'type': 1, 'components': [{'type': 2, 'style': 1, 'label': 'x', 'custom_id': 'a'}]}]},
+        'data': {'component_type': 2, 'custom_id': 'a'},
+    }
+
+
+async def clicks(client, messages, count):
+    state = client._connection
+    payloads = [click(messages - 1 - i) for i in range(count)]
+    start = time.perf_counter()
+    for data in payloads:
+        state.parse_interaction_create(data)
+    elapsed = (time.perf_counter() - start) / count
+    await asyncio.sleep(0)
+    return elapsed
+
+
+async def bench_wait_for(messages, count):
+    client = discord.Client()
+    start = time.perf_counter()
+    waiters = [asyncio.ensure_future(client.wait_for('raw_button_click', timeout=1000,
+                                                     check=lambda i, c, m=m: i.message_id == m))
+               for m in range(messages)]
+    await asyncio.sleep(0)
+    setup = time.perf_counter() - start
+    per_click = await clicks(client, messages, count)
+    for waiter in waiters:
+        waiter.cancel()
+    await asyncio.sleep(0)
+    return setup, per_click
+
+
+async def bench_sessions(messages, count):
+    client = discord.Client()
+
+    async def on_click(interaction, component):
+        pass
+
+    start = time.perf_counter()
+    sessions = discord.ComponentSessions(client, timeout=1000)
+    for m in range(messages):
+        sessions.add(message(m), on_click=on_click)
+    setup = time.perf_counter() - start
+    per_click = await clicks(client, messages, count)
+    sessions.close()
+    return setup, per_click
+
+
+async def run(args):
+    for name, bench in (('wait_for', bench_wait_for), ('sessions', bench_sessions)):
+        setup, per_click = await bench(args.messages, args.clicks)
+        print('%-8s set up %d messages in %.3fs, %.3fms per click'
+              % (name, args.messages, setup, per_click * 1e3))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--messages', type=int, default=100000)
+    parser.add_argument('--clicks', type=int, default=10)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""Compares building received action rows fresh against interning them.
+
+Uses messages with five rows of five buttons each and prints the time per
+message and the memory held by ``--messages`` messages' worth of rows.
+
+    python benchmarks/components.py
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+# run from a checkout without installing the library
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from discord.components import ActionRow, _ComponentCache
+
+
+def rows_payload():
+    return [{'type': 1, 'components': [{'type': 2, 'style': 1, 'label': 'button %d-%d' % (r, i),
+                                        'custom_id': 'id-%d-%d' % (r, i), 'disabled': False,
+                                        'emoji': {'name': 'x', 'id': None}}
+                                       for i in range(5)]}
+            for r in range(5)]
+
+
+def fresh(rows, cache):
+    return [ActionRow.from_dict(row) for row in rows]
+
+
+def interned(rows, cache):
+    return [cache.get(row) for row in rows]
+
+
+def timeit(build, rows, cache, number, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            build(rows, cache)
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def memory(build, rows, cache, messages):
+    tracemalloc.start()
+    kept = [build(rows, cache) for _ in range(messages)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--messages', type=int, default=1000)
+    args = parser.parse_args()
+
+    rows = rows_payload()
+    for name, build in (('fresh', fresh), ('interned', interned)):
+        cache = _ComponentCache(100)
+        elapsed = timeit(build, rows, cache, args.number, args.repeat)
+        size = memory(build, rows, cache, args.messages)
+        print('%-8s %7.1fus per message, %7.1f KiB for %d messages'
+              % (name, elapsed * 1e6, size / 1024, args.messages))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""Measures how long it takes to parse a button click INTERACTION_CREATE.
+
+The click comes from a cached guild and nothing listens to the interaction
+events, so the time is spent in the parser only.
+
+    python benchmarks/interactions.py
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# run from a checkout without installing the library
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import discord
+
+
+GUILD_ID = 3
+
+INTERACTION = {
+    'type': 3, 'id': '5', 'token': 'token', 'application_id': '9', 'channel_id': '1', 'guild_id': str(GUILD_ID),
+    'member': {'user': {'id': '7', 'username': 'user', 'discriminator': '0001', 'avatar': None},
+               'roles': [], 'joined_at': '2021-01-01T00:00:00+00:00'},
+    'message': {'id': '11', 'channel_id': '1', 'content': '',
+                'components': [{'type': 1, 'components': [{'type': 2, 'custom_id': 'a', 'label': 'x', 'style': 1}]}]},
+    'data': {'component_type': 2, 'custom_id': 'a'},
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    client = discord.Client()
+    state = client._connection
+    state.dispatch = lambda *args, **kwargs: None
+    state._add_guild_from_data({
+        'id': str(GUILD_ID), 'name': 'benchmark', 'member_count': 1, 'channels': [],
+        'roles': [{'id': str(GUILD_ID), 'name': '@everyone', 'permissions': '0', 'position': 0}],
+    })
+
+    best = float('inf')
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        for _ in range(args.number):
+            state.parse_interaction_create(INTERACTION)
+        best = min(best, (time.perf_counter() - start) / args.number)
+    print('parse_interaction_create: %.2fus per interaction' % (best * 1e6))
+
+
+if __name__ == '__main__':
+    main()
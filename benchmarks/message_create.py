@@ -0,0 +1,94 @@
+"""Measures how long it takes to build a Message from a typical MESSAGE_CREATE.
+
+Also checks that ``on_message_edit`` receives a ``before`` message that still
+shows the pre-edit payload, for every ``update_snapshots`` mode and with both
+the plain and the compressed message cache.
+
+    python benchmarks/message_create.py
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# run from a checkout without installing the library
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import discord
+
+
+def user(i):
+    return {'id': str(i), 'username': 'user%d' % i, 'discriminator': '0001', 'avatar': None}
+
+
+def message_payload(message_id):
+    return {
+        'id': str(message_id), 'channel_id': '9', 'type': 0, 'content': 'hello <@5>',
+        'author': user(5), 'mentions': [user(6)], 'mention_roles': [],
+        'attachments': [{'id': '10', 'filename': 'a.png', 'size': 1, 'url': 'https://x/a.png',
+                         'proxy_url': 'https://x/a.png'}],
+        'embeds': [{'title': 'before', 'description': 'embed', 'fields': [{'name': 'a', 'value': 'b'}]}],
+        'reactions': [{'count': 1, 'me': False, 'emoji': {'id': None, 'name': 'x'}}],
+        'components': [{'type': 1, 'components': [{'type': 2, 'style': 1, 'label': 'x', 'custom_id': 'a'}]}],
+        'edited_timestamp': None, 'timestamp': '2021-01-01T00:00:00+00:00',
+        'pinned': False, 'mention_everyone': False, 'tts': False,
+    }
+
+
+def bench_create(number, repeat):
+    client = discord.Client()
+    state = client._connection
+    data = message_payload(7)
+    channel, _ = state._get_guild_channel(data)
+
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            discord.Message(state=state, channel=channel, data=data)
+        best = min(best, (time.perf_counter() - start) / number)
+    print('Message(): %.2fus per MESSAGE_CREATE' % (best * 1e6))
+
+
+async def check_edit(update_snapshots, message_cache_bytes):
+    client = discord.Client(update_snapshots=update_snapshots, message_cache_bytes=message_cache_bytes)
+    state = client._connection
+    state.user = discord.ClientUser(state=state, data=user(1))
+    edits = []
+
+    @client.event
+    async def on_message_edit(before, after):
+        edits.append((before, after))
+
+    state.parse_message_create(message_payload(7))
+    state.parse_message_update({'id': '7', 'channel_id': '9', 'content': 'edited',
+                                'embeds': [{'title': 'after'}]})
+    await asyncio.sleep(0)
+
+    (before, after), = edits
+    assert before.content != after.content, (before.content, after.content)
+    assert before.embeds[0].title != after.embeds[0].title, (before.embeds[0].title, after.embeds[0].title)
+    print('on_message_edit(update_snapshots=%r, message_cache_bytes=%r): before %r, after %r'
+          % (update_snapshots, message_cache_bytes, before.embeds[0].title, after.embeds[0].title))
+
+
+async def check_edits():
+    for update_snapshots in ('copy', 'diff'):
+        for message_cache_bytes in (None, 1 << 20):
+            await check_edit(update_snapshots, message_cache_bytes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    bench_create(args.number, args.repeat)
+    asyncio.run(check_edits())
+
+
+if __name__ == '__main__':
+    main()
@@ -43,7 +43,7 @@ from .role import Role, RoleTags
 from .file import File
 from .colour import Color, Colour
 from .integrations import Integration, IntegrationAccount, BotIntegration, IntegrationApplication, StreamIntegration
-from .interactions import Interaction, ButtonClick, SelectionSelect
+from .interactions import Interaction, InteractionLatency, ButtonClick, SelectionSelect
 from .invite import Invite, PartialInviteChannel, PartialInviteGuild
 from .template import Template
 from .widget import Widget, WidgetMember, WidgetChannel
@@ -53,6 +53,11 @@ from . import utils, opus, abc
 from .enums import *
 from .embeds import Embed
 from .mentions import AllowedMentions
+from .gcpolicy import GCPolicy
+from .prepared import PreparedMessage
+from .interaction_server import InteractionServer
+from .custom_id import CustomID
+from .sessions import ComponentSession, ComponentSessions
 from .shard import AutoShardedClient, ShardInfo
 from .player import *
 from .webhook import *
@@ -41,7 +41,7 @@ from .permissions import PermissionOverwrite, Permissions
 from .role import Role
 from .invite import Invite
 from .file import File
-from .components import Button, SelectMenu, ActionRow
+from .components import _components_to_dict
 from .voice_client import VoiceClient, VoiceProtocol
 from . import utils
 
@@ -248,6 +248,7 @@ class GuildChannel:
         self.position = position
         if parent_id is not _undefined:
             self.category_id = int(parent_id) if parent_id else None
+        self.guild._channels_changed()
 
     async def _edit(self, options, reason):
         try:
@@ -321,6 +322,7 @@ class GuildChannel:
         if options:
             data = await self._state.http.edit_channel(self.id, reason=reason, **options)
             self._update(self.guild, data)
+            self.guild._channels_changed()
 
     def _fill_overwrites(self, data):
         self._overwrites = []
@@ -469,6 +471,9 @@ class GuildChannel:
         - Channel overrides
         - Member overrides
 
+        The result is cached by the roles of the member until a role
+        or a channel of the guild changes.
+
         Parameters
         ----------
         member: :class:`~discord.Member`
@@ -497,6 +502,75 @@ class GuildChannel:
         if self.guild.owner_id == member.id:
             return Permissions.all()
 
+        # The result only depends on the roles of the member, unless the
+        # member has an overwrite of their own, so it is cached by role set.
+        cache = self._permissions_cache()
+        if cache is None:
+            return self._resolve_permissions(member)
+
+        overwrite_ids, resolved = cache
+        key = member._roles.tobytes()
+        if member.id in overwrite_ids:
+            key = (member.id, key)
+        try:
+            value = resolved[key]
+        except KeyError:
+            value = resolved[key] = self._resolve_permissions(member).value
+        return Permissions(value)
+
+    def _permissions_cache(self):
+        # returns the IDs of the members with an overwrite and the resolved permission
+        # values of this channel, which are dropped once a role or channel changes
+        guild = self.guild
+        if guild._channels.get(self.id) is not self:
+            # e.g. the snapshot passed to on_guild_channel_update
+            return None
+
+        def build():
+            return {o.id for o in self._overwrites if o.type == 'member'}, {}
+
+        version = (guild._roles_version, guild._channels_version)
+        return guild._cached_view(('permissions', self.id), version, build)
+
+    def _permission_values(self, members):
+        # resolves the permission values of many members at once, members with the same
+        # roles share them so permissions_for is only called once for every role set
+        cache = self._permissions_cache()
+        overwrite_ids = cache[0] if cache is not None else ()
+        owner_id = self.guild.owner_id
+        resolved = {}
+        for member in members:
+            member_id = member.id
+            key = member_id if member_id == owner_id or member_id in overwrite_ids else member._roles.tobytes()
+            try:
+                value = resolved[key]
+            except KeyError:
+                value = resolved[key] = self.permissions_for(member).value
+            yield member, value
+
+    def permissions_for_members(self, members=None):
+        """Resolves the permissions of many members at once.
+
+        This is equivalent to calling :meth:`permissions_for` for every member,
+        except that the permissions are only resolved once for every distinct
+        combination of roles.
+
+        Parameters
+        ----------
+        members: Optional[Iterable[:class:`~discord.Member`]]
+            The members to resolve permissions for.
+            Defaults to the cached members of the guild.
+
+        Returns
+        -------
+        Dict[:class:`~discord.Member`, :class:`~discord.Permissions`]
+            The resolved permissions by member.
+        """
+        if members is None:
+            members = self.guild._members.values()
+        return {member: Permissions(value) for member, value in self._permission_values(members)}
+
+    def _resolve_permissions(self, member):
         default = self.guild.default_role
         base = Permissions(default.permissions.value)
         roles = member._roles
@@ -686,7 +760,7 @@ class GuildChannel:
         obj = cls(state=self._state, guild=self.guild, data=data)
 
         # temporarily add it to the cache
-        self.guild._channels[obj.id] = obj
+        self.guild._add_channel(obj)
         return obj
 
     async def clone(self, *, name=None, reason=None):
@@ -939,7 +1013,7 @@ class Messageable(metaclass=abc.ABCMeta):
     async def send(self, content=None, *, tts=False, embed=None, embeds=None, components=None, file=None,
                                           files=None, delete_after=None, nonce=None,
                                           allowed_mentions=None, reference=None,
-                                          mention_author=None, hidden=None, **kwargs):
+                                          mention_author=None, hidden=None, prepared=None, **kwargs):
         """|coro|
 
         Sends a message to the destination with the content given.
@@ -1005,6 +1079,11 @@ class Messageable(metaclass=abc.ABCMeta):
         hidden: Optional[:class:`bool`]
             If :bool:`True` the message will be only bee visible for the performer of the interaction.
             If this isnt called within an :class:`RawInteractionCreateEvent` it will be ignored
+        prepared: Optional[:class:`~discord.PreparedMessage`]
+            A message whose embeds, components and allowed mentions were serialized
+            beforehand. If ``content`` is passed it replaces the content of the
+            prepared message. This cannot be mixed with ``tts``, ``embed``, ``embeds``,
+            ``components`` or ``allowed_mentions``.
 
         Raises
         --------
@@ -1015,6 +1094,7 @@ class Messageable(metaclass=abc.ABCMeta):
         ~discord.InvalidArgument
             The ``files`` list is not of the appropriate size,
             you specified both ``file`` and ``files``,
+            you mixed ``prepared`` with the arguments it replaces,
             or the ``reference`` object is not a :class:`~discord.Message`
             or :class:`~discord.MessageReference`.
 
@@ -1028,38 +1108,34 @@ class Messageable(metaclass=abc.ABCMeta):
         state = self._state
         content = str(content) if content is not None else None
 
-        if embed is not None:
-            embed = embed.to_dict()
-        embed_list = []
-        if embed:
-            embed_list.append(embed)
-        if embeds:
-            embed_list.extend([e.to_dict() for e in embeds])
-        embeds = embed_list
-        if len(embeds) > 10:
-            raise InvalidArgument(f'The maximum number of embeds that can be send with a message is 10, got: {len(embeds)}')
-        if components:
-            _components = []
-            for component in ([components] if not isinstance(components, list) else components):
-                if isinstance(component, (Button, SelectMenu)):
-                    _components.extend(ActionRow(component).to_dict())
-                elif isinstance(component, ActionRow):
-                    _components.extend(component.to_dict())
-                elif isinstance(component, list):
-                    _components.extend(ActionRow(*[obj for obj in component if isinstance(obj, (Button, SelectMenu))]).to_dict())
-            components = _components
-
-        if allowed_mentions is not None:
-            if state.allowed_mentions is not None:
-                allowed_mentions = state.allowed_mentions.merge(allowed_mentions).to_dict()
-            else:
-                allowed_mentions = allowed_mentions.to_dict()
+        if prepared is not None:
+            if tts or embed is not None or embeds or components or allowed_mentions is not None:
+                raise InvalidArgument('cannot mix prepared with tts, embed, embeds, components or allowed_mentions')
         else:
-            allowed_mentions = state.allowed_mentions and state.allowed_mentions.to_dict()
+            if embed is not None:
+                embed = embed.to_dict()
+            embed_list = []
+            if embed:
+                embed_list.append(embed)
+            if embeds:
+                embed_list.extend([e.to_dict() for e in embeds])
+            embeds = embed_list
+            if len(embeds) > 10:
+                raise InvalidArgument(f'The maximum number of embeds that can be send with a message is 10, got: {len(embeds)}')
+            if components:
+                components = _components_to_dict(components)
+
+            if allowed_mentions is not None:
+                if state.allowed_mentions is not None:
+                    allowed_mentions = state.allowed_mentions.merge(allowed_mentions).to_dict()
+                else:
+                    allowed_mentions = allowed_mentions.to_dict()
+            else:
+                allowed_mentions = state.allowed_mentions and state.allowed_mentions.to_dict()
 
-        if mention_author is not None:
-            allowed_mentions = allowed_mentions or AllowedMentions().to_dict()
-            allowed_mentions['replied_user'] = bool(mention_author)
+            if mention_author is not None:
+                allowed_mentions = allowed_mentions or AllowedMentions().to_dict()
+                allowed_mentions['replied_user'] = bool(mention_author)
 
         if reference is not None:
             try:
@@ -1067,6 +1143,11 @@ class Messageable(metaclass=abc.ABCMeta):
             except AttributeError:
                 raise InvalidArgument('reference parameter must be Message or MessageReference') from None
 
+        if prepared is not None:
+            prepared = prepared._to_payload(state.allowed_mentions, content=content, mention_author=mention_author,
+                                            nonce=nonce or None, message_reference=reference,
+                                            flags=64 if hidden is True else None)
+
         if file is not None and files is not None:
             raise InvalidArgument('cannot pass both file and files parameter to send()')
 
@@ -1096,11 +1177,11 @@ class Messageable(metaclass=abc.ABCMeta):
                                                                       components=components,
                                                                       nonce=nonce, message_reference=reference,
                                                                       flags=64 if hidden is True else None,
-                                                                      followup=followup)
+                                                                      followup=followup, payload=prepared)
                 else:
                     data = await state.http.send_files(channel.id, files=[file], allowed_mentions=allowed_mentions,
                                                        content=content, tts=tts, embeds=embeds, components=components,
-                                                       nonce=nonce, message_reference=reference)
+                                                       nonce=nonce, message_reference=reference, payload=prepared)
             finally:
                 file.close()
 
@@ -1122,11 +1203,13 @@ class Messageable(metaclass=abc.ABCMeta):
                                                                       components=components,
                                                                       nonce=nonce, message_reference=reference,
                                                                       flags=64 if hidden is True else None,
-                                                                      followup=followup or deferred)
+                                                                      followup=followup or deferred,
+                                                                      payload=prepared)
                 else:
                     data = await state.http.send_files(channel.id, files=files, content=content, tts=tts,
                                                        embeds=embeds, components=components, nonce=nonce,
-                                                       allowed_mentions=allowed_mentions, message_reference=reference)
+                                                       allowed_mentions=allowed_mentions, message_reference=reference,
+                                                       payload=prepared)
             finally:
                 for f in files:
                     f.close()
@@ -1141,11 +1224,11 @@ class Messageable(metaclass=abc.ABCMeta):
                                                                   components=components,
                                                                   nonce=nonce, message_reference=reference,
                                                                   flags=64 if hidden is True else None,
-                                                                  followup=followup)
+                                                                  followup=followup, payload=prepared)
             else:
                 data = await state.http.send_message(channel.id, content, tts=tts, embeds=embeds, components=components,
                                                                           nonce=nonce, allowed_mentions=allowed_mentions,
-                                                                          message_reference=reference)
+                                                                          message_reference=reference, payload=prepared)
         if not hidden is True:
             if not isinstance(data, dict) and not hidden is None:
                 """Thanks Discord that they dont return the message when we send the interaction callback"""
@@ -174,7 +174,9 @@ class TextChannel(discord.abc.Messageable, discord.abc.GuildChannel, Hashable):
     @property
     def members(self):
         """List[:class:`Member`]: Returns all members that can see this channel."""
-        return [m for m in self.guild.members if self.permissions_for(m).read_messages]
+        read_messages = Permissions.read_messages.flag
+        members = self.guild._members.values()
+        return [m for m, value in self._permission_values(members) if value & read_messages]
 
     def is_nsfw(self):
         """:class:`bool`: Checks if the channel is NSFW."""
@@ -184,6 +186,13 @@ class TextChannel(discord.abc.Messageable, discord.abc.GuildChannel, Hashable):
         """:class:`bool`: Checks if the channel is a news channel."""
         return self._type == ChannelType.news.value
 
+    @property
+    def cached_messages(self):
+        """Sequence[:class:`Message`]: Read-only list of the messages of this channel
+        that are in the internal message cache, oldest first.
+        """
+        return self._state._get_channel_messages(self.id)
+
     @property
     def last_message(self):
         """Fetches the last message from this channel in cache.
@@ -1259,6 +1268,13 @@ class DMChannel(discord.abc.Messageable, Hashable):
         """:class:`ChannelType`: The channel's Discord type."""
         return ChannelType.private
 
+    @property
+    def cached_messages(self):
+        """Sequence[:class:`Message`]: Read-only list of the messages of this channel
+        that are in the internal message cache, oldest first.
+        """
+        return self._state._get_channel_messages(self.id)
+
     @property
     def created_at(self):
         """:class:`datetime.datetime`: Returns the direct message channel's creation time in UTC."""
@@ -1395,6 +1411,13 @@ class GroupChannel(discord.abc.Messageable, Hashable):
         """:class:`ChannelType`: The channel's Discord type."""
         return ChannelType.group
 
+    @property
+    def cached_messages(self):
+        """Sequence[:class:`Message`]: Read-only list of the messages of this channel
+        that are in the internal message cache, oldest first.
+        """
+        return self._state._get_channel_messages(self.id)
+
     @property
     def icon_url(self):
         """:class:`Asset`: Returns the channel's icon asset if available.
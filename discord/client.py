@@ -25,7 +25,10 @@ DEALINGS IN THE SOFTWARE.
 """
 
 import asyncio
+import functools
+import io
 import logging
+import os
 import signal
 import sys
 import traceback
@@ -53,6 +56,7 @@ from .backoff import ExponentialBackoff
 from .webhook import Webhook
 from .iterators import GuildIterator
 from .appinfo import AppInfo
+from .custom_id import CustomID
 
 log = logging.getLogger(__name__)
 
@@ -94,12 +98,35 @@ def _cleanup_loop(loop):
         log.info('Closing the event loop.')
         loop.close()
 
+def _component_listener(custom_id, func):
+    # Returns the ``(handler, condition)`` pair used to route a component
+    # interaction to ``func``; shared with the commands extension.
+    if isinstance(custom_id, CustomID):
+        codec = custom_id
+
+        @functools.wraps(func)
+        async def handler(i, c):
+            await func(i, c, **codec.decode(c.custom_id))
+
+        condition = lambda i, c: codec.matches(c.custom_id)
+    else:
+        _custom_id = str(custom_id if custom_id is not None else func.__name__)
+        handler = func
+        condition = lambda i, c: str(c.custom_id) == _custom_id
+
+    condition.custom_id = custom_id
+    return handler, condition
+
 class _ClientEventTask(asyncio.Task):
     def __init__(self, original_coro, event_name, coro, *, loop):
         super().__init__(coro, loop=loop)
         self.__event_name = event_name
         self.__original_coro = original_coro
 
+    @property
+    def handler(self):
+        return self.__original_coro
+
     def __repr__(self):
         info = [
             ('state', self._state.lower()),
@@ -124,6 +151,33 @@ class Client:
 
         .. versionchanged:: 1.3
             Allow disabling the message cache and change the default size to ``1000``.
+    message_cache_bytes: Optional[:class:`int`]
+        The approximate number of bytes the compressed cold tier of the message cache may use.
+        If set, messages that no longer fit into the ``max_messages`` most recent ones are
+        kept as compressed gateway payloads and turned back into :class:`.Message` objects
+        when they are looked up, e.g. by :func:`.on_message_delete` or :func:`.on_message_edit`.
+        Reactions and other changes that are not part of an edit are not kept for these messages.
+        Defaults to ``None``, which drops the messages instead.
+    max_channel_messages: Optional[:class:`int`]
+        The maximum number of messages to store per channel. If a channel reaches it,
+        its oldest message is evicted instead of the oldest message of all channels.
+        Defaults to ``None``, which only applies the ``max_messages`` limit.
+    max_guild_messages: Optional[:class:`int`]
+        Like ``max_channel_messages`` but for all channels of a guild combined.
+        Defaults to ``None``.
+    message_cache_ttl: Optional[:class:`float`]
+        The number of seconds after their creation that messages are dropped
+        from the message cache. Defaults to ``None``, which keeps them until they
+        are evicted.
+    component_cache_size: Optional[:class:`int`]
+        The number of distinct action rows to keep for deduplicating the components of
+        received messages. Messages with identical components then share the same
+        frozen :class:`ActionRow` objects, use :meth:`ActionRow.copy` to modify them.
+        Defaults to ``None``, which creates new components for every message.
+    auto_defer: Optional[:class:`float`]
+        The number of seconds after which interactions that were not responded to
+        are deferred automatically, see :meth:`Interaction.set_auto_defer`.
+        Should be lower than 3. Defaults to ``None``, which disables this.
     loop: Optional[:class:`asyncio.AbstractEventLoop`]
         The :class:`asyncio.AbstractEventLoop` to use for asynchronous operations.
         Defaults to ``None``, in which case the default event loop is used via
@@ -150,6 +204,10 @@ class Client:
         currently selected intents.
 
         .. versionadded:: 1.5
+    cache_flags: :class:`CacheFlags`
+        Allows to opt out of caching emojis, voice states, presences, private channels,
+        stickers, member roles and referenced messages. Disabled entities are not
+        created from gateway events at all. Defaults to caching everything.
     fetch_offline_members: :class:`bool`
         A deprecated alias of ``chunk_guilds_at_startup``.
     chunk_guilds_at_startup: :class:`bool`
@@ -159,6 +217,14 @@ class Client:
         is ``True``.
 
         .. versionadded:: 1.5
+    chunk_concurrency: :class:`int`
+        The maximum number of guild chunk requests that are in flight per shard while
+        chunking guilds at start-up. Requests are additionally held back while the
+        gateway rate limit of the shard is close to being exhausted. Defaults to ``2``.
+    chunk_priority: Optional[Callable[[:class:`.Guild`], Any]]
+        A key function used to order the guilds waiting to be chunked at start-up,
+        lower values are chunked first. :func:`.on_guild_available` is dispatched as soon
+        as each guild is chunked. Defaults to chunking the smallest guilds first.
     status: Optional[:class:`.Status`]
         A status to start your presence with upon logging on to Discord.
     activity: Optional[:class:`.BaseActivity`]
@@ -216,6 +282,40 @@ class Client:
         sync your system clock to Google's NTP server.
 
         .. versionadded:: 1.3
+    update_snapshots: :class:`str`
+        How the ``before`` argument of update events like :func:`.on_member_update`,
+        :func:`.on_message_edit` or :func:`.on_guild_update` is created.
+        ``'copy'``, the default, passes a full copy of the object from before the update.
+        ``'diff'`` passes an :class:`.UpdateDiff` instead that only records the changed
+        fields with their old and new values, which is cheaper for large caches.
+
+        Regardless of this setting no snapshot is taken at all if nothing listens
+        to the corresponding event.
+    reconcile_cache: :class:`bool`
+        Whether to keep the internal cache when a session can not be resumed and
+        a new READY is received. Cached guilds, channels, roles and members are
+        updated in place from the new data, only the ones that no longer exist
+        are removed and the message cache is kept, so references held to these
+        objects stay valid across reconnects. Defaults to ``False``, which clears
+        the cache and rebuilds it from scratch.
+    gc_policy: Optional[:class:`.GCPolicy`]
+        Controls how the client interacts with the garbage collector, e.g. freezing
+        the cache once it is built so collections do not have to traverse it anymore.
+        Defaults to ``None``, which only runs a full collection after large parts
+        of the cache are deallocated.
+    raw_events_only: :class:`bool`
+        Whether to skip building models from gateway events entirely. Every event
+        is dispatched as ``on_raw_<event name>`` with the decoded payload :class:`dict`
+        instead, e.g. ``on_raw_message_create`` or ``on_raw_interaction_create``.
+        Only the :attr:`user` and the IDs of the joined guilds (:attr:`raw_guild_ids`)
+        are cached and :func:`.on_ready` is dispatched right after READY without waiting
+        for the guilds. Useful for clients that only forward events. Defaults to ``False``.
+
+        .. note::
+
+            In this mode the regular (raw) events like :func:`.on_message` or
+            :func:`.on_raw_message_delete` are not dispatched, and events that
+            share a name with a raw event receive the payload :class:`dict` instead.
 
     Attributes
     -----------
@@ -251,6 +351,7 @@ class Client:
         self._ready = asyncio.Event()
         self._connection._get_websocket = self._get_websocket
         self._connection._get_client = lambda: self
+        self._connection._has_listeners = self._has_listeners
 
         if VoiceClient.warn_nacl:
             VoiceClient.warn_nacl = False
@@ -271,6 +372,9 @@ class Client:
     def _handle_ready(self):
         self._ready.set()
 
+    def _has_listeners(self, event):
+        return bool(self._listeners.get(event)) or hasattr(self, 'on_' + event)
+
     @property
     def latency(self):
         """:class:`float`: Measures latency between a HEARTBEAT and a HEARTBEAT_ACK in seconds.
@@ -302,6 +406,23 @@ class Client:
         """List[:class:`.Guild`]: The guilds that the connected client is a member of."""
         return self._connection.guilds
 
+    @property
+    def raw_guild_ids(self):
+        """FrozenSet[:class:`int`]: The IDs of the guilds that the connected client is a member of.
+
+        This is only populated if ``raw_events_only`` is enabled.
+        """
+        return frozenset(self._connection._raw_guild_ids)
+
+    @property
+    def interaction_latencies(self):
+        """Dict[Optional[:class:`str`], :class:`.InteractionLatency`]: The response times of the
+        interaction handlers by their qualified name.
+
+        Responses that were not made in an event handler, like automatic deferrals, are recorded under ``None``.
+        """
+        return dict(self._connection.interaction_latencies)
+
     @property
     def emojis(self):
         """List[:class:`.Emoji`]: The emojis that the connected client has."""
@@ -563,6 +684,9 @@ class Client:
             'initial': True,
             'shard_id': self.shard_id,
         }
+        session = self._connection._restored_sessions.pop(self.shard_id, None)
+        if session is not None:
+            ws_params.update(session=session[0], sequence=session[1], resume=True)
         while not self.is_closed():
             try:
                 coro = DiscordWebSocket.from_client(self, **ws_params)
@@ -636,9 +760,123 @@ class Client:
                 pass
 
         if self.ws is not None and self.ws.open:
-            await self.ws.close(code=1000)
+            # a non-1000 close code keeps the session resumable
+            await self.ws.close(code=4000 if self._connection._keep_session else 1000)
 
         self._ready.clear()
+        self._connection._gc_detach()
+
+    def _get_gateway_sessions(self):
+        ws = self.ws
+        if ws is None:
+            return {}
+        return {self.shard_id: (ws.session_id, ws.sequence)}
+
+    def save_cache_snapshot(self, fp, *, keep_session=True):
+        """Saves the internal cache to a compact binary snapshot that can be
+        restored with :meth:`load_cache_snapshot` after a restart.
+
+        The snapshot contains the guilds with their channels, roles, emojis and
+        members, the users and private channels as well as the gateway session,
+        so the restarted client can try to RESUME it instead of waiting for
+        READY and chunking again. The message cache is not saved.
+
+        .. warning::
+
+            Snapshots are stored using :mod:`pickle`, never load a snapshot
+            from an untrusted source.
+
+        Parameters
+        -----------
+        fp: Union[:class:`str`, :class:`os.PathLike`, :term:`py:file object`]
+            The file to save the snapshot to. If this is a file object it
+            must be opened in binary mode.
+        keep_session: :class:`bool`
+            Whether :meth:`close` should keep the gateway session resumable,
+            which is required for the restarted client to RESUME it.
+            Defaults to ``True``.
+        """
+        self._connection._keep_session = keep_session
+        sessions = self._get_gateway_sessions()
+        if isinstance(fp, io.IOBase):
+            self._connection.dump_snapshot(fp, sessions)
+            return
+
+        # write to a temporary file first so a crash can't leave a broken snapshot behind
+        tmp = '%s.tmp' % os.fspath(fp)
+        with open(tmp, 'wb') as f:
+            self._connection.dump_snapshot(f, sessions)
+        os.replace(tmp, fp)
+
+    def load_cache_snapshot(self, fp):
+        """Restores the internal cache from a snapshot created by :meth:`save_cache_snapshot`.
+
+        This must be called before connecting. The restored cache can be used
+        right away and the client tries to RESUME the saved gateway session.
+        If that works :func:`on_ready` is dispatched once the session is resumed,
+        or once every shard resumed its session for an :class:`AutoShardedClient`.
+        Otherwise the client identifies and rebuilds its cache from the new
+        READY like it normally would.
+
+        .. warning::
+
+            Snapshots are stored using :mod:`pickle`, never load a snapshot
+            from an untrusted source.
+
+        Parameters
+        -----------
+        fp: Union[:class:`str`, :class:`os.PathLike`, :term:`py:file object`]
+            The file to load the snapshot from. If this is a file object it
+            must be opened in binary mode.
+
+        Raises
+        -------
+        :exc:`.ClientException`
+            The client is already connected.
+        ValueError
+            The file is not a valid cache snapshot.
+        """
+        if self.ws is not None:
+            raise ClientException('Cache snapshots can only be loaded before connecting.')
+
+        if isinstance(fp, io.IOBase):
+            self._connection.load_snapshot(fp)
+        else:
+            with open(fp, 'rb') as f:
+                self._connection.load_snapshot(f)
+
+    def cache_stats(self, *, guild=None, sample=None):
+        """Returns an estimate of the memory used by the internal cache.
+
+        The cache is split into sections (``users``, ``guilds``, ``members``,
+        ``channels``, ``roles``, ``emojis``, ``voice_states``, ``messages`` and
+        ``private_channels``). Each cached object is only accounted for in its own
+        section, e.g. the size of a member does not include the size of its user.
+
+        .. note::
+
+            This walks the whole cache and can take a while for large bots.
+            Pass ``sample`` to only measure a random sample of each section.
+
+        Parameters
+        -----------
+        guild: Optional[:class:`.Guild`]
+            Only account for the cache of this guild. The ``users`` and
+            ``private_channels`` sections are omitted in this case.
+        sample: Optional[:class:`int`]
+            The number of randomly picked objects to measure per section.
+            The size of the whole section is extrapolated from them.
+
+        Returns
+        --------
+        Dict[:class:`str`, Dict[:class:`str`, :class:`int`]]
+            A mapping of section name to a dict with the ``count`` of cached
+            objects and their estimated ``size`` in bytes.
+        """
+        if sample is not None and sample <= 0:
+            raise ValueError('sample must be a positive integer')
+
+        return self._connection.cache_stats(guild=guild, sample=sample)
 
     def clear(self):
         """Clears the internal state of the bot.
@@ -650,6 +888,7 @@ class Client:
         self._closed = False
         self._ready.clear()
         self._connection.clear()
+        self._connection._gc_attach()
         self.http.recreate()
 
     async def start(self, *args, **kwargs):
@@ -1035,9 +1274,11 @@ class Client:
 
         Parameters
         ----------
-        custom_id: Optional[str]
+        custom_id: Optional[Union[str, :class:`discord.CustomID`]]
             If the :attr:`custom_id` of the :class:`discord.Button` could not use as an function name
             or you want to give the function a different name then the custom_id use this one to set the custom_id.
+            If a :class:`discord.CustomID` is passed, the function is called for every custom_id created by it
+            and gets the decoded arguments passed as keyword arguments.
 
         Example
         -------
@@ -1060,19 +1301,7 @@ class Client:
             The coroutine passed is not actually a coroutine.
         """
         def decorator(func):
-            if not asyncio.iscoroutinefunction(func):
-                raise TypeError('event registered must be a coroutine function')
-
-            _name = custom_id if custom_id is not None else func.__name__
-
-            try:
-                listeners = self._listeners['raw_button_click']
-            except KeyError:
-                listeners = []
-                self._listeners['raw_button_click'] = listeners
-
-            listeners.append((func, lambda i, c: str(c.custom_id) == str(custom_id)))
-            return func
+            return self._add_component_listener('raw_button_click', custom_id, func)
 
         return decorator
     
@@ -1088,9 +1317,11 @@ class Client:
 
         Parameters
         -----------
-        custom_id: Optional[str]
+        custom_id: Optional[Union[str, :class:`discord.CustomID`]]
             If the :attr:`custom_id` of the :class:`discord.SelectMenu` could not use as an function name
             or you want to give the function a different name then the custom_id use this one to set the custom_id.
+            If a :class:`discord.CustomID` is passed, the function is called for every custom_id created by it
+            and gets the decoded arguments passed as keyword arguments.
 
 
         Example
@@ -1117,21 +1348,24 @@ class Client:
             The coroutine passed is not actually a coroutine.
         """
         def decorator(func):
-            if not asyncio.iscoroutinefunction(func):
-                raise TypeError('event registered must be a coroutine function')
+            return self._add_component_listener('raw_selection_select', custom_id, func)
 
-            _custom_id = custom_id if custom_id is not None else func.__name__
+        return decorator
 
-            try:
-                listeners = self._listeners['raw_selection_select']
-            except KeyError:
-                listeners = []
-                self._listeners['raw_selection_select'] = listeners
+    def _add_component_listener(self, event, custom_id, func):
+        if not asyncio.iscoroutinefunction(func):
+            raise TypeError('event registered must be a coroutine function')
 
-            listeners.append((func, lambda i, c: str(c.custom_id) == str(_custom_id)))
-            return func
+        handler, condition = _component_listener(custom_id, func)
 
-        return decorator
+        try:
+            listeners = self._listeners[event]
+        except KeyError:
+            listeners = []
+            self._listeners[event] = listeners
+
+        listeners.append((handler, condition))
+        return func
         
 
 
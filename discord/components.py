@@ -25,6 +25,8 @@ DEALINGS IN THE SOFTWARE.
 """
 
 import typing
+from collections import OrderedDict
+from . import utils
 from .enums import ComponentType, ButtonStyle
 from .emoji import Emoji
 from typing import Union
@@ -34,7 +36,61 @@ from .errors import InvalidArgument, InvalidButtonUrl, URLAndCustomIDNotAlowed,
 __all__ = ('Button', 'SelectMenu', 'ActionRow', 'SelectOption')
 
 
-class Button:
+class _Component:
+    __slots__ = ('_frozen',)
+
+    def __setattr__(self, name, value):
+        if getattr(self, '_frozen', False):
+            raise AttributeError('%s is frozen, use copy() to get a modifiable copy' % self.__class__.__name__)
+        object.__setattr__(self, name, value)
+
+    def _public_items(self):
+        for name in utils._get_slots(self.__class__):
+            if not name.startswith('_'):
+                yield name, getattr(self, name, None)
+
+    def freeze(self):
+        """
+        Makes this component and the components it contains immutable, so it can be shared
+        between messages. Modifying a frozen component raises :exc:`AttributeError`.
+
+        :return: self
+        """
+        for name in utils._get_slots(self.__class__):
+            value = getattr(self, name, None)
+            if isinstance(value, list):
+                for item in value:
+                    if isinstance(item, _Component):
+                        item.freeze()
+                object.__setattr__(self, name, tuple(value))
+        object.__setattr__(self, '_frozen', True)
+        return self
+
+    def is_frozen(self) -> bool:
+        """Whether the component is frozen."""
+        return getattr(self, '_frozen', False)
+
+    def copy(self):
+        """
+        Returns a modifiable copy of this component and the components it contains.
+        """
+        cls = self.__class__
+        new = cls.__new__(cls)
+        for name in utils._get_slots(cls):
+            if name == '_frozen':
+                continue
+            try:
+                value = getattr(self, name)
+            except AttributeError:
+                continue
+            # the values of the library's enums are tuples as well
+            if type(value) in (list, tuple):
+                value = [item.copy() if isinstance(item, _Component) else item for item in value]
+            object.__setattr__(new, name, value)
+        return new
+
+
+class Button(_Component):
     """
     Represents an `Discord-Button <https://discord.com/developers/docs/interactions/message-components#button-object>`_
 
@@ -57,6 +113,8 @@ class Button:
 
     """
 
+    __slots__ = ('url', 'style', 'custom_id', 'label', 'emoji', 'disabled')
+
     def __init__(self, label: str = None,
                  custom_id: Union[str, int] = None,
                  style: Union[ButtonStyle, int] = ButtonStyle.grey,
@@ -105,7 +163,7 @@ class Button:
         self.disabled = disabled
 
     def __repr__(self) -> str:
-        return f'<Button {", ".join(["%s=%s" % (k, str(v)) for k, v in self.__dict__.items()])}>'
+        return f'<Button {", ".join(["%s=%s" % (k, str(v)) for k, v in self._public_items()])}>'
 
     def __len__(self):
         if self.label:
@@ -144,7 +202,9 @@ class Button:
         return self
 
     def update(self, **kwargs):
-        self.__dict__.update((k, v) for k, v in kwargs.items() if k in self.__dict__.keys())
+        for k, v in kwargs.items():
+            if k in self.__slots__:
+                setattr(self, k, v)
         return self
 
     def set_custom_id(self, custom_id: Union[str, int]):
@@ -238,7 +298,7 @@ class Button:
         return cls(style=style, label=label, emoji=emoji, custom_id=custom_id, url=url, disabled=disabled)
 
 
-class SelectOption:
+class SelectOption(_Component):
     """
     A class that creates an option for a :class:`SelectMenu`
     and represents it in a :class:`SelectMenu` in the components of a :class:`discord.Message`.
@@ -260,6 +320,8 @@ class SelectOption:
 
     """
 
+    __slots__ = ('label', 'value', 'description', 'emoji', 'default')
+
     def __init__(self, label: str,
                  value: str,
                  description: str = None,
@@ -288,7 +350,7 @@ class SelectOption:
         self.default = default
 
     def __repr__(self):
-        return f'<SelectOption {", ".join(["%s=%s" % (k, v) for (k, v) in self.__dict__.items()])}>'
+        return f'<SelectOption {", ".join(["%s=%s" % (k, v) for (k, v) in self._public_items()])}>'
 
     def set_default(self, value: bool):
         self.default = value
@@ -306,17 +368,17 @@ class SelectOption:
 
     @classmethod
     def from_dict(cls, data):
-        emoji = data.pop('emoji', None)
+        emoji = data.get('emoji', None)
         if emoji:
             emoji = PartialEmoji.from_dict(emoji)
-        return cls(label=data.pop('label'),
-                   value=data.pop('value'),
-                   description=data.pop('description', None),
+        return cls(label=data['label'],
+                   value=data['value'],
+                   description=data.get('description', None),
                    emoji=emoji,
-                   default=data.pop('default', False))
+                   default=data.get('default', False))
 
 
-class SelectMenu:
+class SelectMenu(_Component):
     """
     Represents a `Select-Menu <https://discord.com/developers/docs/interactions/message-components#select-menus>`_
 
@@ -338,6 +400,8 @@ class SelectMenu:
         disable the SelectMenu, default False
     """
 
+    __slots__ = ('options', 'custom_id', 'placeholder', 'min_values', 'max_values', 'disabled', '_values')
+
     def __init__(self, custom_id: Union[str, int],
                  options: typing.List[SelectOption],
                  placeholder: str = None,
@@ -372,7 +436,7 @@ class SelectMenu:
         self._values = None
 
     def __repr__(self):
-        return f'<SelectMenu {", ".join(["%s=%s" % (k, v) for k, v in self.__dict__.items()])}>'
+        return f'<SelectMenu {", ".join(["%s=%s" % (k, v) for k, v in self._public_items()])}>'
 
     @property
     def all_option_values(self):
@@ -424,7 +488,7 @@ class SelectMenu:
         :return: List[Union[int, str]]
         """
         values = []
-        _values = getattr(self, '_values', [])
+        _values = getattr(self, '_values', None) or []
         for value in _values:
             if value.isdigit():
                 values.append(int(value))
@@ -452,7 +516,9 @@ class SelectMenu:
         return _not_selected
 
     def update(self, **kwargs):
-        self.__dict__.update((k, v) for k, v in kwargs.items() if k in self.__dict__.keys())
+        for k, v in kwargs.items():
+            if k in self.__slots__:
+                setattr(self, k, v)
         return self
 
     def set_custom_id(self, custom_id: Union[str, int]):
@@ -497,14 +563,15 @@ class SelectMenu:
 
     @classmethod
     def from_dict(cls, data: dict):
-        return cls(custom_id=data.pop('custom_id'),
-                   options=[SelectOption.from_dict(o) for o in data.pop('options')],
-                   placeholder=data.pop('placeholder', None),
-                   min_values=data.pop('min_values', 1),
-                   max_values=data.pop('max_values', 1))
+        return cls(custom_id=data['custom_id'],
+                   options=[SelectOption.from_dict(o) for o in data['options']],
+                   placeholder=data.get('placeholder', None),
+                   min_values=data.get('min_values', 1),
+                   max_values=data.get('max_values', 1),
+                   disabled=data.get('disabled', False))
 
 
-class ActionRow:
+class ActionRow(_Component):
     """
     Represents an ActionRow-Part for the components of an :class:`discord.Message`.
 
@@ -519,6 +586,8 @@ class ActionRow:
         For more information about ActionRow's visit the `Discord-APIMethodes Documentation <https://discord.com/developers/docs/interactions/message-components#actionrow>`_.
     """
 
+    __slots__ = ('components',)
+
     def __init__(self, *components):
         self.components = []
         for component in components:
@@ -771,6 +840,39 @@ class ActionRow:
             return cls(*components)
 
 
+class _ComponentCache:
+    # Deduplicates the action rows of received messages. Identical payloads share
+    # one frozen ActionRow, the least recently used rows are dropped first.
+
+    __slots__ = ('max_size', '_rows')
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        # OrderedDict[str, ActionRow] by serialized payload
+        self._rows = OrderedDict()
+
+    def __len__(self):
+        return len(self._rows)
+
+    def get(self, data):
+        key = utils.to_json(data)
+        rows = self._rows
+        try:
+            row = rows[key]
+        except KeyError:
+            pass
+        else:
+            rows.move_to_end(key)
+            return row
+
+        row = ActionRow.from_dict(data)
+        if isinstance(row, ActionRow):
+            rows[key] = row.freeze()
+            if len(rows) > self.max_size:
+                rows.popitem(last=False)
+        return row
+
+
 def _component_factory(data):
     component_type = data.get('type', None)
     if component_type == ComponentType.ActionRow:
@@ -781,3 +883,16 @@ def _component_factory(data):
         return SelectMenu.from_dict(data)
     else:
         return None
+
+
+def _components_to_dict(components):
+    # flattens the components passed to send into the action rows of the payload
+    result = []
+    for component in ([components] if not isinstance(components, list) else components):
+        if isinstance(component, (Button, SelectMenu)):
+            result.extend(ActionRow(component).to_dict())
+        elif isinstance(component, ActionRow):
+            result.extend(component.to_dict())
+        elif isinstance(component, list):
+            result.extend(ActionRow(*[obj for obj in component if isinstance(obj, (Button, SelectMenu))]).to_dict())
+    return result
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import enum
+
+from . import enums
+
+__all__ = (
+    'CustomID',
+)
+
+_DIGITS = '0123456789abcdefghijklmnopqrstuvwxyz'
+
+def _to_base36(number):
+    if number < 0:
+        return '-' + _to_base36(-number)
+    if number < 36:
+        return _DIGITS[number]
+    result = []
+    while number:
+        number, digit = divmod(number, 36)
+        result.append(_DIGITS[digit])
+    return ''.join(reversed(result))
+
+def _escape(value):
+    return value.replace('%', '%25').replace(':', '%3A')
+
+def _unescape(value):
+    return value.replace('%3A', ':').replace('%25', '%')
+
+def _encode_scalar(value):
+    if isinstance(value, bool):
+        return '1' if value else '0'
+    if isinstance(value, int):
+        return _to_base36(value)
+    return _escape(str(value))
+
+class _Field:
+    __slots__ = ('name', 'type', 'encode', 'decode')
+
+    def __init__(self, name, tp):
+        self.name = name
+        self.type = tp
+        if tp is bool:
+            self.encode = lambda value: '1' if value else '0'
+            self.decode = self._decode_bool
+        elif tp is int:
+            # snowflakes can be passed as models
+            self.encode = lambda value: _to_base36(getattr(value, 'id', value))
+            self.decode = lambda raw: int(raw, 36)
+        elif tp is str:
+            self.encode = lambda value: _escape(str(value))
+            self.decode = _unescape
+        elif isinstance(tp, type) and issubclass(tp, (enum.Enum, enums.Enum)):
+            members = {_encode_scalar(member.value): member for member in tp}
+            values = {member: raw for raw, member in members.items()}
+            self.encode = values.__getitem__
+            self.decode = members.__getitem__
+        else:
+            raise TypeError('unsupported custom_id field type %r for %r' % (tp, name))
+
+    @staticmethod
+    def _decode_bool(raw):
+        if raw == '1':
+            return True
+        if raw == '0':
+            return False
+        raise ValueError('invalid boolean %r' % raw)
+
+class CustomID:
+    """A template for ``custom_id``\\s that carry typed arguments.
+
+    The arguments are packed into the ``custom_id`` itself, so a click can be handled
+    without the message being cached and without storing any state per message.
+    It is formatted as ``name:version:argument:...`` where integers are encoded in
+    base 36, so a snowflake takes up 13 characters.
+
+    Passing it as the ``custom_id`` of :meth:`Client.on_click` or :meth:`Client.on_select`
+    only calls the handler for matching components and passes the decoded arguments
+    to it as keyword arguments.
+
+    .. code-block:: python3
+
+        vote = discord.CustomID('vote', poll=int, choice=str)
+
+        Button(label='Yes', custom_id=vote.encode(poll=poll_id, choice='yes'))
+
+        @client.on_click(custom_id=vote)
+        async def on_vote(i: discord.Interaction, button, poll, choice):
+            ...
+
+    Parameters
+    -----------
+    name: :class:`str`
+        The name that identifies the template, it must not contain ``:``.
+    version: :class:`int`
+        The version of the template. Custom ids of another version do not match,
+        so old components stop being routed to a handler whose arguments changed.
+        Defaults to ``1``.
+    \\*\\*fields
+        The arguments in the order they are packed and their types. Supported
+        types are :class:`int` (which also accepts models with an ``id``), :class:`str`,
+        :class:`bool` and enums.
+
+    Raises
+    -------
+    TypeError
+        A field has an unsupported type.
+    ValueError
+        The name contains ``:``.
+    """
+
+    __slots__ = ('name', 'version', '_fields', '_prefix', '_separators')
+
+    def __init__(self, name, *, version=1, **fields):
+        if ':' in name:
+            raise ValueError('the name of a CustomID must not contain ":"')
+        self.name = name
+        self.version = version
+        self._fields = tuple(_Field(key, tp) for key, tp in fields.items())
+        self._prefix = '%s:%s:' % (name, _to_base36(version))
+        self._separators = self._prefix.count(':') + max(len(self._fields) - 1, 0)
+
+    def __repr__(self):
+        fields = ' '.join('%s=%s' % (f.name, getattr(f.type, '__name__', f.type)) for f in self._fields)
+        return '<CustomID name={0.name!r} version={0.version} {1}>'.format(self, fields)
+
+    def encode(self, *args, **kwargs):
+        """Packs the arguments into a ``custom_id``.
+
+        The arguments can be passed positionally in the order of the fields or by name.
+
+        Raises
+        -------
+        TypeError
+            An argument is missing or unknown.
+        ValueError
+            The ``custom_id`` would be longer than 100 characters.
+
+        Returns
+        --------
+        :class:`str`
+            The ``custom_id``.
+        """
+        fields = self._fields
+        if len(args) > len(fields):
+            raise TypeError('%s takes %d arguments but %d were given' % (self.name, len(fields), len(args)))
+
+        parts = [field.encode(value) for field, value in zip(fields, args)]
+        for field in fields[len(args):]:
+            try:
+                value = kwargs.pop(field.name)
+            except KeyError:
+                raise TypeError('missing argument %r for %s' % (field.name, self.name)) from None
+            parts.append(field.encode(value))
+
+        if kwargs:
+            raise TypeError('unknown arguments for %s: %s' % (self.name, ', '.join(kwargs)))
+
+        custom_id = self._prefix + ':'.join(parts)
+        if len(custom_id) > 100:
+            raise ValueError('custom_id %r is longer than 100 characters' % custom_id)
+        return custom_id
+
+    def matches(self, custom_id):
+        """Whether ``custom_id`` was created by this template.
+
+        Returns
+        --------
+        :class:`bool`
+        """
+        custom_id = str(custom_id)
+        return custom_id.startswith(self._prefix) and custom_id.count(':') == self._separators
+
+    def decode(self, custom_id):
+        """Unpacks the arguments of a ``custom_id``.
+
+        Raises
+        -------
+        ValueError
+            The ``custom_id`` was not created by this template or is malformed.
+
+        Returns
+        --------
+        Dict[:class:`str`, Any]
+            The arguments by name.
+        """
+        custom_id = str(custom_id)
+        if not self.matches(custom_id):
+            raise ValueError('custom_id %r does not match %r' % (custom_id, self))
+
+        raw = custom_id[len(self._prefix):].split(':') if self._fields else ()
+        try:
+            return {field.name: field.decode(value) for field, value in zip(self._fields, raw)}
+        except (KeyError, ValueError):
+            raise ValueError('malformed custom_id %r for %r' % (custom_id, self)) from None
@@ -66,6 +66,8 @@ def _create_value_cls(name):
     cls = namedtuple('_EnumValue_' + name, 'name value')
     cls.__repr__ = lambda self: '<%s.%s: %r>' % (name, self.name, self.value)
     cls.__str__ = lambda self: '%s.%s' % (name, self.name)
+    # the value classes are not importable, so pickle them by their enum member
+    cls.__reduce__ = lambda self: (getattr, (self._actual_enum_cls_, self.name))
     return cls
 
 
@@ -40,6 +40,7 @@ from .context import Context
 from . import errors
 from .help import HelpCommand, DefaultHelpCommand
 from .cog import Cog
+from discord.client import _component_listener
 
 def when_mentioned(bot, msg):
     """A callable that implements a command prefix equivalent to being mentioned.
@@ -139,6 +140,10 @@ class BotBase(GroupMixin):
                 self._schedule_event(func, ev, *args, **kwargs)
 
 
+    def _has_listeners(self, event_name):
+        return (super()._has_listeners(event_name) or bool(self.extra_events.get('on_' + event_name))
+                or bool(self.extra_interaction_events.get(event_name)))
+
     async def close(self):
         for extension in tuple(self.__extensions):
             try:
@@ -428,8 +433,7 @@ class BotBase(GroupMixin):
         def decorator(func):
             if not asyncio.iscoroutinefunction(func):
                 raise TypeError('event registered must be a coroutine function')
-            _custom_id = custom_id if custom_id is not None else func.__name__
-            self.add_interaction_listener('raw_button_click', func, _custom_id)
+            self.add_interaction_listener('raw_button_click', func, custom_id)
             return func
         return decorator
     
@@ -446,9 +450,11 @@ class BotBase(GroupMixin):
         Parameters
         ----------
         
-        :attr:`custom_id`: Optional[str]
+        :attr:`custom_id`: Optional[Union[str, :class:`discord.CustomID`]]
 
             If the :attr:`custom_id` of the SelectMenu could not use as an function name or you want to give the function a diferent name then the custom_id use this one to set the custom_id.
+            If a :class:`discord.CustomID` is passed, the function is called for every custom_id created by it
+            and gets the decoded arguments passed as keyword arguments.
 
 
         Example
@@ -477,8 +483,7 @@ class BotBase(GroupMixin):
         def decorator(func):
             if not asyncio.iscoroutinefunction(func):
                 raise TypeError('event registered must be a coroutine function')
-            _custom_id = custom_id if custom_id is not None else func.__name__
-            self.add_interaction_listener('raw_selection_select', func, _custom_id)
+            self.add_interaction_listener('raw_selection_select', func, custom_id)
             return func
 
         return decorator
@@ -500,7 +505,7 @@ class BotBase(GroupMixin):
             listeners = []
             self.extra_interaction_events[_type] = listeners
         
-        listeners.append((func, lambda i, c: c.custom_id == custom_id))
+        listeners.append(_component_listener(custom_id, func))
 
     def remove_interaction_listener(self, _type,  func, custom_id):
         """
@@ -510,11 +515,11 @@ class BotBase(GroupMixin):
             This should not use manuel; only cogs use this to remove them.
             
         """
-        try:
-            if _type in self.extra_interaction_events:
-                self.extra_interaction_events[_type].remove((func, lambda i, c: c.custom_id == custom_id))
-        except ValueError:
-            pass
+        for entry in self.extra_interaction_events.get(_type, []):
+            handler, condition = entry
+            if getattr(handler, '__wrapped__', handler) == func and condition.custom_id == custom_id:
+                self.extra_interaction_events[_type].remove(entry)
+                break
 
     def add_listener(self, func, name=None):
         """The non decorator alternative to :meth:`.listen`.
@@ -325,9 +325,11 @@ class Cog(metaclass=CogMeta):
 
         Parameters
         ----------
-        custom_id: Optional[str]
+        custom_id: Optional[Union[str, :class:`discord.CustomID`]]
             If the :attr:`custom_id` of the :class:`discord.Button` could not use as an function name
             or you want to give the function a different name then the custom_id use this one to set the custom_id.
+            If a :class:`discord.CustomID` is passed, the function is called for every custom_id created by it
+            and gets the decoded arguments passed as keyword arguments.
 
         Example
         -------
@@ -355,7 +357,7 @@ class Cog(metaclass=CogMeta):
             if not inspect.iscoroutinefunction(actual):
                 raise TypeError('event registered must be a coroutine function')
             actual.__cog_interaction_listener__ = True
-            name = custom_id if custom_id else actual.__name__
+            name = custom_id if custom_id is not None else actual.__name__
             try:
                 actual.__interaction_listener_names__.append(('raw_button_click', name))
             except AttributeError:
@@ -376,9 +378,11 @@ class Cog(metaclass=CogMeta):
 
         Parameters
         -----------
-        custom_id: Optional[str]
+        custom_id: Optional[Union[str, :class:`discord.CustomID`]]
             If the :attr:`custom_id` of the :class:`discord.SelectMenu` could not use as an function name
             or you want to give the function a different name then the custom_id use this one to set the custom_id.
+            If a :class:`discord.CustomID` is passed, the function is called for every custom_id created by it
+            and gets the decoded arguments passed as keyword arguments.
 
         Example
         -------
@@ -410,7 +414,7 @@ class Cog(metaclass=CogMeta):
             if not inspect.iscoroutinefunction(actual):
                 raise TypeError('event registered must be a coroutine function')
             actual.__cog_interaction_listener__ = True
-            name = custom_id if custom_id else actual.__name__
+            name = custom_id if custom_id is not None else actual.__name__
             try:
                 actual.__interaction_listener_names__.append(('raw_selection_select', name))
             except AttributeError:
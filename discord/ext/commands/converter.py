@@ -199,7 +199,8 @@ class MemberConverter(IDConverter):
 class UserConverter(IDConverter):
     """Converts to a :class:`~discord.User`.
 
-    All lookups are via the global user cache.
+    All lookups are via the global user cache. Lookups by name check the members
+    of the local guild first, if there is one.
 
     The lookup strategy is as follows (in order):
 
@@ -238,6 +239,12 @@ class UserConverter(IDConverter):
             # Remove first character
             arg = arg[1:]
 
+        # the member name index of the guild is checked first to avoid scanning the user cache
+        if ctx.guild is not None:
+            member = ctx.guild._get_member_named(arg, nick=False)
+            if member is not None:
+                return member._user
+
         # check for discriminator if it exists,
         if len(arg) > 5 and arg[-5] == '#':
             discrim = arg[-4:]
@@ -340,7 +347,7 @@ class TextChannelConverter(IDConverter):
         if match is None:
             # not a mention
             if guild:
-                result = discord.utils.get(guild.text_channels, name=argument)
+                result = guild._get_channel_named(argument, discord.TextChannel)
             else:
                 def check(c):
                     return isinstance(c, discord.TextChannel) and c.name == argument
@@ -381,7 +388,7 @@ class VoiceChannelConverter(IDConverter):
         if match is None:
             # not a mention
             if guild:
-                result = discord.utils.get(guild.voice_channels, name=argument)
+                result = guild._get_channel_named(argument, discord.VoiceChannel)
             else:
                 def check(c):
                     return isinstance(c, discord.VoiceChannel) and c.name == argument
@@ -421,7 +428,7 @@ class StageChannelConverter(IDConverter):
         if match is None:
             # not a mention
             if guild:
-                result = discord.utils.get(guild.stage_channels, name=argument)
+                result = guild._get_channel_named(argument, discord.StageChannel)
             else:
                 def check(c):
                     return isinstance(c, discord.StageChannel) and c.name == argument
@@ -463,7 +470,7 @@ class CategoryChannelConverter(IDConverter):
         if match is None:
             # not a mention
             if guild:
-                result = discord.utils.get(guild.categories, name=argument)
+                result = guild._get_channel_named(argument, discord.CategoryChannel)
             else:
                 def check(c):
                     return isinstance(c, discord.CategoryChannel) and c.name == argument
@@ -504,7 +511,7 @@ class StoreChannelConverter(IDConverter):
         if match is None:
             # not a mention
             if guild:
-                result = discord.utils.get(guild.channels, name=argument)
+                result = guild._get_channel_named(argument, discord.StoreChannel)
             else:
                 def check(c):
                     return isinstance(c, discord.StoreChannel) and c.name == argument
@@ -629,7 +636,7 @@ class RoleConverter(IDConverter):
         if match:
             result = guild.get_role(int(match.group(1)))
         else:
-            result = discord.utils.get(guild._roles.values(), name=argument)
+            result = guild._get_role_named(argument)
 
         if result is None:
             raise RoleNotFound(argument)
@@ -34,6 +34,7 @@ __all__ = (
     'PublicUserFlags',
     'Intents',
     'MemberCacheFlags',
+    'CacheFlags',
 )
 
 class flag_value:
@@ -964,3 +965,132 @@ class MemberCacheFlags(BaseFlags):
     @property
     def _online_only(self):
         return self.value == 1
+
+@fill_with_flags()
+class CacheFlags(BaseFlags):
+    """Controls the library's cache policy for entities other than members.
+
+    This allows bots to opt out of storing data they never use. Disabled
+    entities are not constructed from gateway events at all. This class is
+    passed to the ``cache_flags`` parameter in :class:`Client`, see
+    :class:`MemberCacheFlags` to control which members are cached.
+
+    To construct an object you can pass keyword arguments denoting the flags
+    to enable or disable.
+
+    The default value is all flags enabled.
+
+    .. container:: operations
+
+        .. describe:: x == y
+
+            Checks if two flags are equal.
+        .. describe:: x != y
+
+            Checks if two flags are not equal.
+        .. describe:: hash(x)
+
+               Return the flag's hash.
+        .. describe:: iter(x)
+
+               Returns an iterator of ``(name, value)`` pairs. This allows it
+               to be, for example, constructed as a dict or a list of pairs.
+
+    Attributes
+    -----------
+    value: :class:`int`
+        The raw value. You should query flags via the properties
+        rather than using this raw value.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, **kwargs):
+        bits = max(self.VALID_FLAGS.values()).bit_length()
+        self.value = (1 << bits) - 1
+        for key, value in kwargs.items():
+            if key not in self.VALID_FLAGS:
+                raise TypeError('%r is not a valid flag name.' % key)
+            setattr(self, key, value)
+
+    @classmethod
+    def all(cls):
+        """A factory method that creates a :class:`CacheFlags` with everything enabled."""
+        bits = max(cls.VALID_FLAGS.values()).bit_length()
+        value = (1 << bits) - 1
+        self = cls.__new__(cls)
+        self.value = value
+        return self
+
+    @classmethod
+    def none(cls):
+        """A factory method that creates a :class:`CacheFlags` with everything disabled."""
+        self = cls.__new__(cls)
+        self.value = self.DEFAULT_VALUE
+        return self
+
+    @flag_value
+    def emojis(self):
+        """:class:`bool`: Whether to cache the custom emojis of guilds.
+
+        If disabled :attr:`Guild.emojis` and :attr:`Client.emojis` are empty and
+        :meth:`Client.get_emoji` always returns ``None``.
+        """
+        return 1
+
+    @flag_value
+    def voice_states(self):
+        """:class:`bool`: Whether to cache the voice states of guild members.
+
+        The voice state of the bot itself is always cached. If disabled
+        :attr:`Member.voice` returns ``None`` for other members,
+        :attr:`VoiceChannel.members` is empty and the ``before`` argument of
+        :func:`on_voice_state_update` does not reflect the previous state.
+        """
+        return 2
+
+    @flag_value
+    def presences(self):
+        """:class:`bool`: Whether to cache the status and activities of members.
+
+        If disabled :attr:`Member.status` is always :attr:`Status.offline`,
+        :attr:`Member.activities` is empty and presence updates only dispatch
+        :func:`on_user_update`.
+        """
+        return 4
+
+    @flag_value
+    def private_channels(self):
+        """:class:`bool`: Whether to cache DM and group channels.
+
+        If disabled :attr:`Client.private_channels` is empty and :attr:`User.dm_channel`
+        is always ``None``, so :meth:`User.create_dm` has to request the channel every time.
+        """
+        return 8
+
+    @flag_value
+    def stickers(self):
+        """:class:`bool`: Whether to create the stickers of messages.
+
+        If disabled :attr:`Message.stickers` is always empty.
+        """
+        return 16
+
+    @flag_value
+    def member_roles(self):
+        """:class:`bool`: Whether to store the roles of members.
+
+        The roles of the bot's own member are always stored. If disabled
+        :attr:`Member.roles` only contains the default role and permissions
+        computed for other members do not take their roles into account.
+        """
+        return 32
+
+    @flag_value
+    def referenced_messages(self):
+        """:class:`bool`: Whether to create the message a message replies to.
+
+        If disabled :attr:`MessageReference.resolved` is always ``None`` for
+        received messages and has to be fetched instead.
+        """
+        return 64
@@ -82,6 +82,15 @@ class GatewayRatelimiter:
             return False
         return self.remaining == 0
 
+    def get_remaining(self):
+        current = time.time()
+        if current > self.window + self.per:
+            return self.max
+        return self.remaining
+
+    def get_reset_after(self):
+        return max(0.0, self.window + self.per - time.time())
+
     def get_delay(self):
         current = time.time()
 
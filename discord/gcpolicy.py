@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import gc
+import logging
+import time
+
+log = logging.getLogger(__name__)
+
+__all__ = (
+    'GCPolicy',
+)
+
+# gc.freeze was added in Python 3.7
+_CAN_FREEZE = hasattr(gc, 'freeze')
+
+class GCPolicy:
+    """A class that controls how the library interacts with the garbage collector.
+
+    The internal cache of large bots consists of millions of long-lived objects
+    that the cyclic garbage collector keeps traversing, which can cause pauses
+    long enough to delay heartbeats. This can be passed to :class:`Client` as
+    ``gc_policy`` to move the cache out of the collector's reach once it is built.
+    Closing the client undoes this, the objects are unfrozen and pauses are no
+    longer tracked.
+
+    .. note::
+
+        Freezing requires Python 3.7 or higher, on older versions ``freeze``
+        and ``freeze_after_chunk`` have no effect.
+
+    Parameters
+    -----------
+    freeze: :class:`bool`
+        Whether to :func:`gc.freeze` all objects once :func:`on_ready` is dispatched,
+        so they are ignored by future collections. Defaults to ``True``.
+    ready_thresholds: Optional[Tuple[:class:`int`, :class:`int`, :class:`int`]]
+        The :func:`gc.set_threshold` values used while the READY burst is processed.
+        The previous thresholds are restored once the client is ready or closed. ``None``
+        leaves the thresholds untouched. Defaults to ``(50000, 20, 100)``.
+    freeze_after_chunk: Optional[:class:`int`]
+        Freeze all objects after a guild with at least this many members has been
+        chunked. Guilds chunked while the client gets ready are frozen once the
+        client is ready instead. ``None`` disables this. Defaults to ``1000``.
+    track_pauses: :class:`bool`
+        Whether to measure the time spent in every garbage collection using
+        :data:`gc.callbacks`. Defaults to ``False``.
+    pause_warning: Optional[:class:`float`]
+        The number of seconds a collection may take before a warning is logged.
+        Only used when ``track_pauses`` is enabled. Defaults to ``0.1``.
+
+    Attributes
+    -----------
+    collections: :class:`int`
+        The number of collections measured so far.
+    total_pause: :class:`float`
+        The total number of seconds spent in the measured collections.
+    max_pause: :class:`float`
+        The longest measured collection in seconds.
+    last_pause: :class:`float`
+        The duration of the last measured collection in seconds.
+    """
+
+    __slots__ = ('freeze', 'ready_thresholds', 'freeze_after_chunk', 'track_pauses', 'pause_warning',
+                 'collections', 'total_pause', 'max_pause', 'last_pause', '_saved_thresholds',
+                 '_frozen', '_started', '_in_ready', '_freeze_pending')
+
+    def __init__(self, *, freeze=True, ready_thresholds=(50000, 20, 100), freeze_after_chunk=1000,
+                 track_pauses=False, pause_warning=0.1):
+        self.freeze = freeze
+        self.ready_thresholds = ready_thresholds
+        self.freeze_after_chunk = freeze_after_chunk
+        self.track_pauses = track_pauses
+        self.pause_warning = pause_warning
+        self.collections = 0
+        self.total_pause = 0.0
+        self.max_pause = 0.0
+        self.last_pause = 0.0
+        self._saved_thresholds = None
+        self._frozen = False
+        self._started = None
+        self._in_ready = False
+        self._freeze_pending = False
+
+    def __repr__(self):
+        return '<GCPolicy freeze={0.freeze} ready_thresholds={0.ready_thresholds} ' \
+               'freeze_after_chunk={0.freeze_after_chunk} track_pauses={0.track_pauses}>'.format(self)
+
+    @property
+    def frozen_count(self):
+        """:class:`int`: The number of objects that are currently frozen."""
+        return gc.get_freeze_count() if _CAN_FREEZE else 0
+
+    @property
+    def average_pause(self):
+        """:class:`float`: The average duration of the measured collections in seconds."""
+        return self.total_pause / self.collections if self.collections else 0.0
+
+    def _attach(self):
+        if self.track_pauses and self._on_gc not in gc.callbacks:
+            gc.callbacks.append(self._on_gc)
+
+    def _detach(self):
+        # called when the client is closed, undoes everything the policy changed
+        try:
+            gc.callbacks.remove(self._on_gc)
+        except ValueError:
+            pass
+
+        if self._saved_thresholds is not None:
+            gc.set_threshold(*self._saved_thresholds)
+            self._saved_thresholds = None
+        self._in_ready = False
+        self._freeze_pending = False
+
+        if self._frozen:
+            # the cache of a closed client should be collectable again
+            gc.unfreeze()
+            self._frozen = False
+
+    def _on_gc(self, phase, info):
+        if phase == 'start':
+            self._started = time.perf_counter()
+            return
+
+        if self._started is None:
+            return
+
+        self.last_pause = pause = time.perf_counter() - self._started
+        self._started = None
+        self.collections += 1
+        self.total_pause += pause
+        if pause > self.max_pause:
+            self.max_pause = pause
+
+        if self.pause_warning is not None and pause > self.pause_warning:
+            log.warning('Garbage collection of generation %s took %.3fs (%s collected, %s uncollectable).',
+                        info['generation'], pause, info['collected'], info['uncollectable'])
+
+    def _freeze(self):
+        if _CAN_FREEZE:
+            # collect first so garbage does not end up in the permanent generation
+            gc.collect()
+            gc.freeze()
+            self._frozen = True
+            log.debug('Froze %d objects.', gc.get_freeze_count())
+
+    def _collect(self):
+        # called after a large part of the cache has been deallocated,
+        # frozen objects are never collected so they have to be unfrozen first
+        if self._frozen:
+            gc.unfreeze()
+            gc.collect()
+            gc.freeze()
+        else:
+            gc.collect()
+
+    def _ready_started(self):
+        self._in_ready = True
+        if self.ready_thresholds is not None and self._saved_thresholds is None:
+            self._saved_thresholds = gc.get_threshold()
+            gc.set_threshold(*self.ready_thresholds)
+
+    def _ready_finished(self):
+        if self._saved_thresholds is not None:
+            gc.set_threshold(*self._saved_thresholds)
+            self._saved_thresholds = None
+
+        if self.freeze or self._freeze_pending:
+            self._freeze()
+        self._in_ready = False
+        self._freeze_pending = False
+
+    def _chunked(self, member_count):
+        if self.freeze_after_chunk is not None and member_count >= self.freeze_after_chunk:
+            if self._in_ready:
+                # every freeze collects the whole heap, so the guilds chunked
+                # during startup are frozen together once the client is ready
+                self._freeze_pending = True
+            else:
+                self._freeze()
@@ -45,6 +45,7 @@ from .widget import Widget
 from .asset import Asset
 from .flags import SystemChannelFlags
 from .integrations import BotIntegration, StreamIntegration, _integration_factory
+from .member_index import MemberNameIndex, MemberRoleIndex
 
 
 BanEntry = namedtuple('BanEntry', 'reason user')
@@ -172,7 +173,8 @@ class Guild(Hashable):
                  'description', 'max_presences', 'max_members', 'max_video_channel_users',
                  'premium_tier', 'premium_subscription_count', '_system_channel_flags',
                  'preferred_locale', 'discovery_splash', '_rules_channel_id',
-                 '_public_updates_channel_id')
+                 '_public_updates_channel_id', '_member_names', '_role_members', '_channels_version', '_roles_version',
+                 '_views')
 
     _PREMIUM_GUILD_LIMITS = {
         None: _GuildLimit(emoji=50, bitrate=96e3, filesize=8388608),
@@ -184,25 +186,143 @@ class Guild(Hashable):
 
     def __init__(self, *, data, state):
         self._channels = {}
+        # the derived views of the channels and roles, see _cached_view
+        self._views = {}
+        self._channels_version = 0
+        self._roles_version = 0
         self._members = {}
+        # the MemberNameIndex, built on the first lookup by name
+        self._member_names = None
+        # the MemberRoleIndex, built on the first lookup by role
+        self._role_members = None
         self._voice_states = {}
         self._state = state
         self._from_data(data)
 
     def _add_channel(self, channel):
         self._channels[channel.id] = channel
+        self._channels_version += 1
 
     def _remove_channel(self, channel):
         self._channels.pop(channel.id, None)
+        self._views.pop(('permissions', channel.id), None)
+        self._channels_version += 1
+
+    def _channels_changed(self):
+        # called after a cached channel was updated in place
+        self._channels_version += 1
+
+    def _roles_changed(self):
+        # called after a cached role was updated in place
+        self._roles_version += 1
+
+    def _cached_view(self, key, version, build):
+        # the views are stamped with the version of the channels or roles they
+        # were built from and are rebuilt once that version has changed
+        try:
+            built_version, view = self._views[key]
+        except KeyError:
+            pass
+        else:
+            if built_version == version:
+                return view
+
+        view = build()
+        self._views[key] = (version, view)
+        return view
+
+    def _sorted_channels(self, cls):
+        def build():
+            r = [ch for ch in self._channels.values() if isinstance(ch, cls)]
+            r.sort(key=lambda c: (c.position, c.id))
+            return r
+
+        return self._cached_view(cls, self._channels_version, build)
+
+    def _get_channel_named(self, name, cls):
+        # the first channel of the type in UI order with the name
+        def build():
+            names = {}
+            for channel in self._sorted_channels(cls):
+                names.setdefault(channel.name, channel)
+            return names
+
+        return self._cached_view(('names', cls), self._channels_version, build).get(name)
+
+    def _get_role_named(self, name):
+        def build():
+            names = {}
+            for role in self._roles.values():
+                names.setdefault(role.name, role)
+            return names
+
+        return self._cached_view('role_names', self._roles_version, build).get(name)
 
     def _voice_state_for(self, user_id):
         return self._voice_states.get(user_id)
 
     def _add_member(self, member):
         self._members[member.id] = member
+        self._index_member(member)
+
+    def _index_member(self, member):
+        if self._member_names is not None:
+            self._member_names.add(member)
+        if self._role_members is not None:
+            self._role_members.add(member)
+
+    def _add_members(self, members):
+        # Merges a batch of members (e.g. a GUILD_MEMBERS_CHUNK) into the cache.
+        # Members that are already fully cached are kept, since the cached
+        # instance may be referenced elsewhere.
+        # Returns a tuple of (added, updated) counts.
+        cache = self._members
+        added = updated = 0
+        for member in members:
+            existing = cache.get(member.id)
+            if existing is None:
+                added += 1
+            elif existing.joined_at is None:
+                updated += 1
+            else:
+                continue
+            cache[member.id] = member
+            self._index_member(member)
+        return added, updated
 
     def _remove_member(self, member):
         self._members.pop(member.id, None)
+        if self._member_names is not None:
+            self._member_names.remove(member.id)
+        if self._role_members is not None:
+            self._role_members.remove(member.id)
+
+    def _reindex_member(self, member):
+        # called after the name, nickname or roles of a cached member may have changed
+        if self._members.get(member.id) is member:
+            self._index_member(member)
+
+    def _member_name_index(self):
+        index = self._member_names
+        if index is None:
+            self._member_names = index = MemberNameIndex(self._members.values())
+            # renamed users are only reindexed in the guilds that have an index
+            self._state._name_index_built(self)
+        return index
+
+    def _role_member_index(self):
+        index = self._role_members
+        if index is None:
+            self._role_members = index = MemberRoleIndex(self._members.values())
+        return index
+
+    def _prune_members(self, member_ids):
+        # Removes every cached member that is not in member_ids.
+        # Returns the number of removed members.
+        removed = [member for member_id, member in self._members.items() if member_id not in member_ids]
+        for member in removed:
+            self._remove_member(member)
+        return len(removed)
 
     def __str__(self):
         return self.name or ''
@@ -231,7 +351,8 @@ class Guild(Hashable):
             # if we're here then we're getting added into the cache
             after = VoiceState(data=data, channel=channel)
             before = VoiceState(data=data, channel=None)
-            self._voice_states[user_id] = after
+            if self._state.cache_flags.voice_states or user_id == self._state.self_id:
+                self._voice_states[user_id] = after
 
         member = self.get_member(user_id)
         if member is None:
@@ -252,10 +373,14 @@ class Guild(Hashable):
             r.position += (not r.is_default())
 
         self._roles[role.id] = role
+        self._roles_version += 1
 
     def _remove_role(self, role_id):
         # this raises KeyError if it fails..
         role = self._roles.pop(role_id)
+        self._roles_version += 1
+        if self._role_members is not None:
+            self._role_members.remove_role(role_id)
 
         # since it didn't, we can change the positions now
         # basically the same as above except we only decrement
@@ -265,7 +390,10 @@ class Guild(Hashable):
 
         return role
 
-    def _from_data(self, guild):
+    def _from_data(self, guild, *, reconcile=False):
+        # When reconciling, the roles, channels and members that are already cached
+        # get updated in place so references to them stay valid.
+
         # according to Stan, this is always available even if the guild is unavailable
         # I don't have this guarantee when someone updates the guild.
         member_count = guild.get('member_count', None)
@@ -282,14 +410,23 @@ class Guild(Hashable):
         self.banner = guild.get('banner')
         self.unavailable = guild.get('unavailable', False)
         self.id = int(guild['id'])
+        old_roles = self._roles if reconcile else {}
         self._roles = {}
         state = self._state # speed up attribute access
         for r in guild.get('roles', []):
-            role = Role(guild=self, data=r, state=state)
+            role = old_roles.get(int(r['id']))
+            if role is not None:
+                role._update(r)
+            else:
+                role = Role(guild=self, data=r, state=state)
             self._roles[role.id] = role
+        self._roles_version += 1
 
         self.mfa_level = guild.get('mfa_level')
-        self.emojis = tuple(map(lambda d: state.store_emoji(self, d), guild.get('emojis', [])))
+        if state.cache_flags.emojis:
+            self.emojis = tuple(map(lambda d: state.store_emoji(self, d), guild.get('emojis', [])))
+        else:
+            self.emojis = ()
         self.features = guild.get('features', [])
         self.splash = guild.get('splash')
         self._system_channel_id = utils._get_as_snowflake(guild, 'system_channel_id')
@@ -309,20 +446,34 @@ class Guild(Hashable):
         cache_joined = self._state.member_cache_flags.joined
         self_id = self._state.self_id
         for mdata in guild.get('members', []):
+            if reconcile:
+                member = self.get_member(int(mdata['user']['id']))
+                if member is not None:
+                    member._update(mdata)
+                    member._update_inner_user(mdata['user'])
+                    self._reindex_member(member)
+                    continue
+
             member = Member(data=mdata, guild=self, state=state)
             if cache_joined or (cache_online_members and member.raw_status != 'offline') or member.id == self_id:
                 self._add_member(member)
 
-        self._sync(guild)
+        self._sync(guild, reconcile=reconcile)
         self._large = None if member_count is None else self._member_count >= 250
 
         self.owner_id = utils._get_as_snowflake(guild, 'owner_id')
         self.afk_channel = self.get_channel(utils._get_as_snowflake(guild, 'afk_channel_id'))
 
-        for obj in guild.get('voice_states', []):
+        voice_states = guild.get('voice_states', [])
+        for obj in voice_states:
             self._update_voice_state(obj, int(obj['channel_id']))
 
-    def _sync(self, data):
+        if reconcile:
+            user_ids = {int(obj['user_id']) for obj in voice_states}
+            for user_id in [user_id for user_id in self._voice_states if user_id not in user_ids]:
+                del self._voice_states[user_id]
+
+    def _sync(self, data, *, reconcile=False):
         try:
             self._large = data['large']
         except KeyError:
@@ -340,7 +491,17 @@ class Guild(Hashable):
             for c in channels:
                 factory, ch_type = _channel_factory(c['type'])
                 if factory:
-                    self._add_channel(factory(guild=self, data=c, state=self._state))
+                    channel = self._channels.get(int(c['id'])) if reconcile else None
+                    if channel is not None and channel.__class__ is factory:
+                        channel._update(self, c)
+                    else:
+                        self._add_channel(factory(guild=self, data=c, state=self._state))
+
+            if reconcile:
+                channel_ids = {int(c['id']) for c in channels}
+                for channel in [channel for channel in self._channels.values() if channel.id not in channel_ids]:
+                    self._remove_channel(channel)
+                self._channels_changed()
 
     @property
     def channels(self):
@@ -367,9 +528,7 @@ class Guild(Hashable):
 
         This is sorted by the position and are in UI order from top to bottom.
         """
-        r = [ch for ch in self._channels.values() if isinstance(ch, VoiceChannel)]
-        r.sort(key=lambda c: (c.position, c.id))
-        return r
+        return list(self._sorted_channels(VoiceChannel))
 
     @property
     def stage_channels(self):
@@ -379,9 +538,7 @@ class Guild(Hashable):
 
         This is sorted by the position and are in UI order from top to bottom.
         """
-        r = [ch for ch in self._channels.values() if isinstance(ch, StageChannel)]
-        r.sort(key=lambda c: (c.position, c.id))
-        return r
+        return list(self._sorted_channels(StageChannel))
 
     @property
     def me(self):
@@ -402,9 +559,7 @@ class Guild(Hashable):
 
         This is sorted by the position and are in UI order from top to bottom.
         """
-        r = [ch for ch in self._channels.values() if isinstance(ch, TextChannel)]
-        r.sort(key=lambda c: (c.position, c.id))
-        return r
+        return list(self._sorted_channels(TextChannel))
 
     @property
     def categories(self):
@@ -412,9 +567,7 @@ class Guild(Hashable):
 
         This is sorted by the position and are in UI order from top to bottom.
         """
-        r = [ch for ch in self._channels.values() if isinstance(ch, CategoryChannel)]
-        r.sort(key=lambda c: (c.position, c.id))
-        return r
+        return list(self._sorted_channels(CategoryChannel))
 
     def by_category(self):
         """Returns every :class:`CategoryChannel` and their associated channels.
@@ -429,6 +582,10 @@ class Guild(Hashable):
         List[Tuple[Optional[:class:`CategoryChannel`], List[:class:`abc.GuildChannel`]]]:
             The categories and their associated channels.
         """
+        return [(category, list(channels)) for category, channels in
+                self._cached_view('by_category', self._channels_version, self._by_category)]
+
+    def _by_category(self):
         grouped = {}
         for channel in self._channels.values():
             if isinstance(channel, CategoryChannel):
@@ -554,7 +711,7 @@ class Guild(Hashable):
         The first element of this list will be the lowest role in the
         hierarchy.
         """
-        return sorted(self._roles.values())
+        return list(self._cached_view('roles', self._roles_version, lambda: sorted(self._roles.values())))
 
     def get_role(self, role_id):
         """Returns a role with the given ID.
@@ -807,24 +964,54 @@ class Guild(Hashable):
             then ``None`` is returned.
         """
 
-        result = None
-        members = self.members
+        return self._get_member_named(name)
+
+    def _get_member_named(self, name, *, nick=True):
+        index = self._member_name_index()
+        members = self._members
         if len(name) > 5 and name[-5] == '#':
             # The 5 length is checking to see if #0000 is in the string,
             # as a#0000 has a length of 6, the minimum for a potential
             # discriminator lookup.
-            potential_discriminator = name[-4:]
-
-            # do the actual lookup and return if found
             # if it isn't found then we'll do a full name lookup below.
-            result = utils.get(members, name=name[:-5], discriminator=potential_discriminator)
-            if result is not None:
-                return result
+            for member_id in index.tagged(name):
+                member = members.get(member_id)
+                if member is not None and str(member._user) == name:
+                    return member
+
+        for member_id in index.named(name):
+            member = members.get(member_id)
+            if member is not None and (member.name == name or (nick and member.nick == name)):
+                return member
 
-        def pred(m):
-            return m.nick == name or m.name == name
+    def get_members_by_prefix(self, prefix, *, limit=None):
+        """Returns the members whose name or nickname starts with the prefix provided,
+        ignoring case.
 
-        return utils.find(pred, members)
+        The members are looked up in an index of the member cache, which is built
+        on the first lookup by name and then kept up to date.
+
+        Parameters
+        -----------
+        prefix: :class:`str`
+            The prefix of the names or nicknames to look for.
+        limit: Optional[:class:`int`]
+            The maximum number of members to return. ``None`` returns all matches.
+
+        Returns
+        --------
+        List[:class:`Member`]
+            The matching members, ordered by the name or nickname that matched.
+        """
+        members = self._members
+        result = {}
+        for member_id in self._member_name_index().startswith(prefix):
+            if limit is not None and len(result) >= limit:
+                break
+            member = members.get(member_id)
+            if member is not None:
+                result[member_id] = member
+        return list(result.values())
 
     def _create_channel(self, name, overwrites, channel_type, category=None, **options):
         if overwrites is None:
@@ -949,7 +1136,7 @@ class Guild(Hashable):
         channel = TextChannel(state=self._state, guild=self, data=data)
 
         # temporarily add to the cache
-        self._channels[channel.id] = channel
+        self._add_channel(channel)
         return channel
 
     async def create_voice_channel(self, name, *, overwrites=None, category=None, reason=None, **options):
@@ -988,7 +1175,7 @@ class Guild(Hashable):
         channel = VoiceChannel(state=self._state, guild=self, data=data)
 
         # temporarily add to the cache
-        self._channels[channel.id] = channel
+        self._add_channel(channel)
         return channel
 
     async def create_stage_channel(self, name, *, topic=None, category=None, overwrites=None, reason=None, position=None):
@@ -1020,7 +1207,7 @@ class Guild(Hashable):
         channel = StageChannel(state=self._state, guild=self, data=data)
 
         # temporarily add to the cache
-        self._channels[channel.id] = channel
+        self._add_channel(channel)
         return channel
 
     async def create_category(self, name, *, overwrites=None, reason=None, position=None):
@@ -1051,7 +1238,7 @@ class Guild(Hashable):
         channel = CategoryChannel(state=self._state, guild=self, data=data)
 
         # temporarily add to the cache
-        self._channels[channel.id] = channel
+        self._add_channel(channel)
         return channel
 
     create_category_channel = create_category
@@ -1968,6 +2155,7 @@ class Guild(Hashable):
             role = Role(guild=self, data=d, state=self._state)
             roles.append(role)
             self._roles[role.id] = role
+        self._roles_changed()
 
         return roles
 
@@ -116,6 +116,9 @@ class HTTPClient:
         self.proxy = proxy
         self.proxy_auth = proxy_auth
         self.use_clock = not unsync_clock
+        # Dict[int, _InlineResponse] of interactions received by an InteractionServer,
+        # their initial response is sent in the reply to Discord's request instead
+        self._inline_responses = {}
 
         user_agent = 'DiscordBot (https://github.com/Rapptz/discord.py {0}) Python/{1[0]}.{1[1]} aiohttp/{2}'
         self.user_agent = user_agent.format(__version__, sys.version_info, aiohttp.__version__)
@@ -357,8 +360,12 @@ class HTTPClient:
 
         return self.request(Route('POST', '/users/@me/channels'), json=payload)
 
-    def send_message(self, channel_id, content, *, tts=False, embeds=None, components=None, nonce=None, allowed_mentions=None, message_reference=None):
+    def send_message(self, channel_id, content, *, tts=False, embeds=None, components=None, nonce=None, allowed_mentions=None, message_reference=None, payload=None):
         r = Route('POST', '/channels/{channel_id}/messages', channel_id=channel_id)
+        if payload is not None:
+            # already serialized by a PreparedMessage
+            return self.request(r, json=payload)
+
         payload = {}
 
         if content:
@@ -387,23 +394,24 @@ class HTTPClient:
     def send_typing(self, channel_id):
         return self.request(Route('POST', '/channels/{channel_id}/typing', channel_id=channel_id))
 
-    def send_files(self, channel_id, *, files, content=None, tts=False, embeds=None, components=None, nonce=None, allowed_mentions=None, message_reference=None):
+    def send_files(self, channel_id, *, files, content=None, tts=False, embeds=None, components=None, nonce=None, allowed_mentions=None, message_reference=None, payload=None):
         r = Route('POST', '/channels/{channel_id}/messages', channel_id=channel_id)
         form = []
 
-        payload = {'tts': tts}
-        if content:
-            payload['content'] = content
-        if embeds:
-            payload['embeds'] = embeds
-        if components:
-            payload['components'] = components
-        if nonce:
-            payload['nonce'] = nonce
-        if allowed_mentions:
-            payload['allowed_mentions'] = allowed_mentions
-        if message_reference:
-            payload['message_reference'] = message_reference
+        if payload is None:
+            payload = {'tts': tts}
+            if content:
+                payload['content'] = content
+            if embeds:
+                payload['embeds'] = embeds
+            if components:
+                payload['components'] = components
+            if nonce:
+                payload['nonce'] = nonce
+            if allowed_mentions:
+                payload['allowed_mentions'] = allowed_mentions
+            if message_reference:
+                payload['message_reference'] = message_reference
 
         form.append({'name': 'payload_json', 'value': utils.to_json(payload)})
         if len(files) == 1:
@@ -444,18 +452,33 @@ class HTTPClient:
         }
         return self.request(r, json=payload, reason=reason)
 
-    def edit_message(self, channel_id, message_id, **fields):
+    def edit_message(self, channel_id, message_id, *, payload=None, **fields):
         r = Route('PATCH', '/channels/{channel_id}/messages/{message_id}', channel_id=channel_id, message_id=message_id)
-        return self.request(r, json=fields)
+        return self.request(r, json=fields if payload is None else payload)
+
+    async def _respond_inline(self, interaction_id, payload, form=None):
+        reply = self._inline_responses.pop(interaction_id)
+        reply.set(payload, form)
+        # the response has to be delivered before follow-up requests are made
+        await reply.wait_sent()
 
     def post_initial_response(self, use_webhook, _resp, interaction_id, token, application_id):
+        if interaction_id in self._inline_responses:
+            return self._respond_inline(interaction_id, _resp)
         r_url = f"/webhooks/{application_id}/{token}/callback" if use_webhook is True else f"/interactions/{interaction_id}/{token}/callback"
         r = Route("POST", r_url)
         return self.request(r, json=_resp)
 
-    def edit_interaction_response(self, use_webhook, interaction_id, token, application_id, deferred, files=None, **fields):
+    def edit_interaction_response(self, use_webhook, interaction_id, token, application_id, deferred, files=None, payload=None, **fields):
+        if payload is not None:
+            # already serialized by a PreparedMessage
+            fields = payload
+        inline = not deferred and interaction_id in self._inline_responses
         if not deferred:
-            fields = {'data': fields, 'type': 7}
+            if payload is not None:
+                fields = utils._JSONPayload('{"data":' + payload + ',"type":7}')
+            else:
+                fields = {'data': fields, 'type': 7}
             r = Route('POST', f'/webhooks/{application_id}/{token}/callback' if use_webhook is True else f"/interactions/{interaction_id}/{token}/callback")
         else:
             r = Route('PATCH', f'/webhooks/{application_id}/{token}/messages/@original')
@@ -479,31 +502,40 @@ class HTTPClient:
                         'content_type': 'application/octet-stream'
                     })
 
+            if inline:
+                return self._respond_inline(interaction_id, fields, form)
             return self.request(r, form=form, files=files)
+        elif inline:
+            return self._respond_inline(interaction_id, fields)
         else:
             return self.request(r, json=fields)
 
     def send_interaction_response(self, use_webhook, interaction_id, token, application_id, deferred, followup,
                                   *, content=None, tts=False, embeds=None, components=None, files=None, nonce=None,
-                                  allowed_mentions=None, message_reference=None, flags=None):
+                                  allowed_mentions=None, message_reference=None, flags=None, payload=None):
         form = []
-        payload = {'tts': tts}
-        if content:
-            payload['content'] = content
-        if embeds:
-            payload['embeds'] = embeds
-        if components:
-            payload['components'] = components
-        if nonce:
-            payload['nonce'] = nonce
-        if allowed_mentions:
-            payload['allowed_mentions'] = allowed_mentions
-        if message_reference:
-            payload['message_reference'] = message_reference
-        if flags:
-            payload['flags'] = flags
+        if payload is None:
+            payload = {'tts': tts}
+            if content:
+                payload['content'] = content
+            if embeds:
+                payload['embeds'] = embeds
+            if components:
+                payload['components'] = components
+            if nonce:
+                payload['nonce'] = nonce
+            if allowed_mentions:
+                payload['allowed_mentions'] = allowed_mentions
+            if message_reference:
+                payload['message_reference'] = message_reference
+            if flags:
+                payload['flags'] = flags
+        inline = not deferred and not followup and interaction_id in self._inline_responses
         if not deferred and not followup:
-            payload = {'type': 4, 'data': payload}
+            if isinstance(payload, utils._JSONPayload):
+                payload = utils._JSONPayload('{"type":4,"data":' + payload + '}')
+            else:
+                payload = {'type': 4, 'data': payload}
             r = Route('POST', f'/webhooks/{application_id}/{token}/callback' if use_webhook is True else f"/interactions/{interaction_id}/{token}/callback")
         else:
             r = Route('POST', f'/webhooks/{application_id}/{token}')
@@ -526,7 +558,11 @@ class HTTPClient:
                         'content_type': 'application/octet-stream'
                     })
 
+            if inline:
+                return self._respond_inline(interaction_id, payload, form)
             return self.request(r, form=form, files=files)
+        elif inline:
+            return self._respond_inline(interaction_id, payload)
         else:
             return self.request(r, json=payload)
 
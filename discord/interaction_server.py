@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+import json
+import logging
+
+import aiohttp
+from aiohttp import web
+
+from . import utils
+from .enums import InteractionCallbackType
+from .interactions import InteractionType
+
+try:
+    import nacl.signing
+    import nacl.exceptions
+    has_nacl = True
+except ImportError:
+    has_nacl = False
+
+log = logging.getLogger(__name__)
+
+__all__ = (
+    'InteractionServer',
+)
+
+class _InlineResponse:
+    # the initial response of an interaction received over HTTP, which
+    # HTTPClient hands over instead of sending it to the callback endpoint
+
+    __slots__ = ('response', 'sent')
+
+    def __init__(self, loop):
+        self.response = loop.create_future()
+        self.sent = loop.create_future()
+
+    def set(self, payload, form):
+        if not self.response.done():
+            self.response.set_result((payload, form))
+
+    async def wait_sent(self):
+        await asyncio.shield(self.sent)
+
+    def set_sent(self):
+        if not self.sent.done():
+            self.sent.set_result(None)
+
+
+class InteractionServer:
+    """An aiohttp server that receives interactions over HTTP instead of the gateway.
+
+    Discord sends every interaction as a signed POST request to the interactions
+    endpoint URL of the application. The signature is verified, the interaction is
+    dispatched to the same events (and with that :meth:`Client.on_click` and
+    :meth:`Client.on_select`) as one that was received over the gateway, and its
+    initial response (:meth:`Interaction.respond`, :meth:`Interaction.edit` or
+    :meth:`Interaction.defer`) is sent in the reply to the request.
+
+    Since no gateway connection is needed, any number of these servers can run behind
+    a load balancer. The guilds, channels and members of interactions received this
+    way are only resolved if they are cached, so :attr:`Interaction.guild`,
+    :attr:`Interaction.member` and :attr:`Interaction.channel` may be ``None``.
+
+    The client has to be logged in with :meth:`Client.login` for any request
+    besides the initial response.
+
+    .. note::
+
+        This requires the PyNaCl library, which is installed with the ``voice`` extra.
+
+    Parameters
+    -----------
+    client: :class:`Client`
+        The client whose events the interactions are dispatched to.
+    public_key: :class:`str`
+        The hex encoded public key of the application, used to verify the requests.
+    path: :class:`str`
+        The path the interactions are received on. Defaults to ``'/interactions'``.
+    response_timeout: :class:`float`
+        The number of seconds to wait for the initial response. Discord invalidates
+        the interaction if there is no reply after 3 seconds, so if no response was
+        made by then the interaction is deferred. Defaults to ``2.5``.
+
+    Attributes
+    -----------
+    app: :class:`aiohttp.web.Application`
+        The application the endpoint is registered on. It can be added to
+        another application with :meth:`aiohttp.web.Application.add_subapp`.
+
+    Raises
+    -------
+    RuntimeError
+        PyNaCl is not installed.
+    """
+
+    def __init__(self, client, public_key, *, path='/interactions', response_timeout=2.5):
+        if not has_nacl:
+            raise RuntimeError('PyNaCl library needed in order to use the InteractionServer')
+
+        self.client = client
+        self.path = path
+        self.response_timeout = response_timeout
+        self._verify_key = nacl.signing.VerifyKey(bytes.fromhex(public_key))
+        self._runner = None
+        self.app = web.Application()
+        self.app.router.add_post(path, self.handle)
+
+    def __repr__(self):
+        return '<InteractionServer path={0.path!r} response_timeout={0.response_timeout}>'.format(self)
+
+    async def start(self, host='0.0.0.0', port=8080):
+        """|coro|
+
+        Starts listening for interactions on the given host and port.
+        """
+        if self._runner is not None:
+            raise RuntimeError('The InteractionServer is already running')
+
+        self._runner = runner = web.AppRunner(self.app)
+        await runner.setup()
+        await web.TCPSite(runner, host, port).start()
+        log.info('Receiving interactions on %s:%s%s.', host, port, self.path)
+
+    async def close(self):
+        """|coro|
+
+        Stops listening for interactions.
+        """
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def verify(self, signature, timestamp, body):
+        """Whether the ed25519 ``signature`` of a request is valid.
+
+        Parameters
+        -----------
+        signature: :class:`str`
+            The hex encoded ``X-Signature-Ed25519`` header.
+        timestamp: :class:`str`
+            The ``X-Signature-Timestamp`` header.
+        body: :class:`bytes`
+            The body of the request.
+        """
+        try:
+            self._verify_key.verify(timestamp.encode('utf-8') + body, bytes.fromhex(signature))
+        except (ValueError, TypeError, nacl.exceptions.BadSignatureError):
+            return False
+        return True
+
+    async def handle(self, request):
+        """|coro|
+
+        The request handler of the endpoint.
+        """
+        body = await request.read()
+        signature = request.headers.get('X-Signature-Ed25519')
+        timestamp = request.headers.get('X-Signature-Timestamp')
+        if signature is None or timestamp is None or not self.verify(signature, timestamp, body):
+            return web.Response(status=401, text='invalid request signature')
+
+        try:
+            data = json.loads(body)
+            interaction_type = data['type']
+        except (ValueError, KeyError, TypeError):
+            return web.Response(status=400, text='invalid interaction')
+
+        if interaction_type == 1:
+            return self._json_response({'type': InteractionCallbackType.pong.value})
+
+        state = self.client._connection
+        interaction_id = int(data['id'])
+        reply = _InlineResponse(state.loop)
+        state.http._inline_responses[interaction_id] = reply
+        try:
+            interaction = state._receive_interaction(data)
+            await asyncio.wait((reply.response,), timeout=self.response_timeout)
+            state.http._inline_responses.pop(interaction_id, None)
+            if reply.response.done():
+                payload, form = reply.response.result()
+            else:
+                # nothing was sent in time, so a response is promised to keep the interaction alive
+                if interaction_type == InteractionType.Component:
+                    callback_type = InteractionCallbackType.deferred_update_msg
+                else:
+                    callback_type = InteractionCallbackType.deferred_msg_with_source
+                payload, form = {'type': callback_type.value}, None
+                if interaction is not None:
+                    interaction.deferred = True
+                log.debug('Interaction ID %s was not responded to in time, deferring it.', interaction_id)
+
+            if form is None:
+                response = self._json_response(payload)
+            else:
+                form_data = aiohttp.FormData()
+                for params in form:
+                    form_data.add_field(**params)
+                response = web.Response(body=form_data())
+
+            await response.prepare(request)
+            await response.write_eof()
+        finally:
+            state.http._inline_responses.pop(interaction_id, None)
+            reply.set_sent()
+        return response
+
+    @staticmethod
+    def _json_response(payload):
+        return web.Response(text=utils.to_json(payload), content_type='application/json')
@@ -1,21 +1,26 @@
+import time
 import typing
+import asyncio
 import logging
 from . import utils
 from .user import User
 from .member import Member
 from .http import HTTPClient
 from .message import Message
-from .errors import NotFound
-from .channel import DMChannel
+from .file import File
+from .errors import NotFound, InvalidArgument
+from .prepared import PreparedMessage
+from .channel import DMChannel, PartialMessageable
 from typing_extensions import Literal
 from typing import Union, List, Optional
-from .components import Button, SelectMenu
+from .components import Button, SelectMenu, _component_factory
 from .enums import ComponentType, InteractionCallbackType
 
 log = logging.getLogger(__name__)
 
 __all__ = ('EphemeralMessage',
            'Interaction',
+           'InteractionLatency',
            'ButtonClick',
            'SelectionSelect')
 
@@ -28,6 +33,54 @@ class EphemeralMessage:
     """
 
 
+class InteractionLatency:
+    """Statistics of the time an interaction handler took to respond.
+
+    The time is measured from when the interaction was received to the first
+    :meth:`Interaction.respond`, :meth:`Interaction.edit` or :meth:`Interaction.defer`
+    call of the handler.
+
+    Attributes
+    -----------
+    responses: :class:`int`
+        The number of responses measured so far.
+    late: :class:`int`
+        The number of responses made after the interaction was deferred automatically.
+    total: :class:`float`
+        The total number of seconds measured.
+    max: :class:`float`
+        The longest response time in seconds.
+    last: :class:`float`
+        The last response time in seconds.
+    """
+
+    __slots__ = ('responses', 'late', 'total', 'max', 'last')
+
+    def __init__(self):
+        self.responses = 0
+        self.late = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+
+    def __repr__(self):
+        return '<InteractionLatency responses={0.responses} late={0.late} average={0.average:.3f} ' \
+               'max={0.max:.3f}>'.format(self)
+
+    @property
+    def average(self):
+        """:class:`float`: The average response time in seconds."""
+        return self.total / self.responses if self.responses else 0.0
+
+    def _record(self, latency, late):
+        self.responses += 1
+        self.late += late
+        self.total += latency
+        self.last = latency
+        if latency > self.max:
+            self.max = latency
+
+
 class ButtonClick:
     """Represents a :class:`discord.Button` that was pressed in an ephemeral Message(contains its custom_id and its hash)."""
     def __init__(self, data):
@@ -62,8 +115,17 @@ class Interaction:
 
     For more general information's about Interactions visit the Documentation of the
     `Discord-API <https://discord.com/developers/docs/interactions/slash-commands#interaction-object>`_
+
+    The :attr:`user`, :attr:`member`, :attr:`guild`, :attr:`channel` and :attr:`message`
+    are resolved from the cache or the payload when they are accessed first.
     """
 
+    __slots__ = ('_state', '_http', '_interaction_type', '__token', '_message', 'message_id', 'message_flags',
+                 '_data', '_member_data', '_user_data', 'user_id', '__interaction_id', 'guild_id', 'channel_id',
+                 '__application_id', '_guild', '_channel', '_member', '_user', 'deferred', 'deferred_hidden',
+                 'callback_message', '_component', 'component_type', '_cached_message', '_original_message',
+                 '_received', '_auto_defer_handle', '_auto_defer_task', 'auto_deferred', '_timed_handlers')
+
     def __init__(self, state, data):
         self._state = state
         self._http: HTTPClient = state.http
@@ -73,23 +135,28 @@ class Interaction:
         self.message_id = int(self._message.get('id'))
         self.message_flags = self._message.get('flags', 0)
         self._data = data.get('data', None)
-        self._member = data.get('member', None)
-        self._user = data.get('user', self._member.get('user', None) if self._member else None)
-        self.user_id = int(self._user['id'])
+        # the user, member, guild and channel are resolved when they are accessed first
+        self._member_data = data.get('member', None)
+        self._user_data = data.get('user', self._member_data.get('user', None) if self._member_data else None)
+        self.user_id = int(self._user_data['id'])
         self.__interaction_id = int(data.get('id'))
         self.guild_id = int(data.get('guild_id', 0))
-        self._guild = None
-        self._channel = None
         self.channel_id = int(data.get('channel_id', 0))
         self.__application_id = int(data.get('application_id'))
-        self.member: typing.Optional[Member] = None
-        self.user: typing.Optional[User] = None
         self.deferred = False
         self.deferred_hidden = False
         self.callback_message = None
         self._component = None
         self.component_type: typing.Optional[int] = self._data.get('component_type', None)
-        self.message = EphemeralMessage() if self.message_is_hidden else None #Message(state=self._state, channel=self.channel, data=self._message)
+        # the Message is only created when it is accessed and not in the cache
+        self._cached_message = None
+        self._original_message = None
+        self._received = time.monotonic()
+        self._auto_defer_handle = None
+        self._auto_defer_task = None
+        self.auto_deferred = False
+        # the handlers whose response time was recorded already
+        self._timed_handlers = set()
         # maybe ``later`` this library will also supports Slash-Commands
         # self.command = None
 
@@ -130,7 +197,10 @@ class Interaction:
             response_type = InteractionCallbackType.from_value(response_type)
         if response_type not in (InteractionCallbackType.deferred_msg_with_source, InteractionCallbackType.deferred_update_msg):
             raise ValueError('response_type has to bee discord.InteractionCallbackType.deferred_msg_with_source or discord.InteractionCallbackType.deferred_update_msg (e.g. 5 or 6), not %s.__class__.__name__' % response_type)
+        await self._before_response()
         if self.deferred:
+            if self.auto_deferred:
+                return
             return log.warning("\033[91You have already responded to this Interaction!\033[0m")
         base = {"type": response_type.value, "data": {'flags': 64 if hidden else None}}
         try:
@@ -149,8 +219,7 @@ class Interaction:
 
         'Defers' if it isn't yet and edit the message
         """
-        if not self.channel:
-            self._channel = self._state.add_dm_channel(data=await self._http.get_channel(self.channel_id))
+        await self._before_response()
         await self.message.edit(__is_interaction_response=True, __deferred=False if (not self.deferred or self.callback_message) else True, __use_webhook=False,
                                 __interaction_id=self.__interaction_id, __interaction_token=self.__token,
                                 __application_id=self.__application_id, **fields)
@@ -160,21 +229,70 @@ class Interaction:
     async def respond(self, content=None, *, tts=False, embed=None, embeds=None, components=None, file=None,
                       files=None, delete_after=None, nonce=None,
                       allowed_mentions=None, reference=None,
-                      mention_author=None, hidden=False) -> typing.Union[Message, EphemeralMessage]:
+                      mention_author=None, hidden=False, prepared=None,
+                      fetch_message=True) -> typing.Union[Message, EphemeralMessage, None]:
         """|coro|
 
         Responds to an interaction by sending a message that can be made visible only to the person who performed the
          interaction by setting the `hidden` parameter to :bool:`True`.
+
+        If the interaction was deferred, e.g. automatically, the message is sent as a follow-up.
+
+        The response is sent to the interaction's callback or webhook route directly, the channel is not resolved.
+
+        :param fetch_message: bool
+            Whether to fetch the message of an initial response, which Discord does not return, with an additional request.
+            If ``False`` ``None`` is returned for it instead and it can still be fetched with :meth:`original_message`.
+            Follow-up messages are always returned.
         """
-        if not self.channel:
-            self._channel = self._state.add_dm_channel(data=await self._http.get_channel(self.channel_id))
-        msg = await self.channel.send(content, tts=tts, embed=embed, embeds=embeds, components=components, file=file,
-                                      files=files, delete_after=delete_after, nonce=nonce,
-                                      allowed_mentions=allowed_mentions, reference=reference,
-                                      mention_author=mention_author, hidden=hidden, __is_interaction_response=True,
-                                      __deferred=self.deferred, __use_webhook=False, __interaction_id=self.__interaction_id,
-                                      __interaction_token=self.__token, __application_id=self.__application_id,
-                                      followup=True if self.callback_message else False)
+        await self._before_response()
+        if file is not None and files is not None:
+            raise InvalidArgument('cannot pass both file and files parameter to respond()')
+        if file is not None:
+            files = [file]
+        if files is not None:
+            if len(files) > 10:
+                raise InvalidArgument('files parameter must be a list of up to 10 elements')
+            elif not all(isinstance(f, File) for f in files):
+                raise InvalidArgument('files parameter must be a list of File')
+            if hidden:
+                raise AttributeError('An ephemeral(hidden) Message could not contain file(s)')
+
+        if reference is not None:
+            try:
+                reference = reference.to_message_reference_dict()
+            except AttributeError:
+                raise InvalidArgument('reference parameter must be Message or MessageReference') from None
+
+        if prepared is None:
+            prepared = PreparedMessage(content, tts=tts, embed=embed, embeds=embeds, components=components,
+                                       allowed_mentions=allowed_mentions)
+            content = None
+        elif tts or embed is not None or embeds or components or allowed_mentions is not None:
+            raise InvalidArgument('cannot mix prepared with tts, embed, embeds, components or allowed_mentions')
+        payload = prepared._to_payload(self._state.allowed_mentions, content=content, mention_author=mention_author,
+                                       nonce=nonce or None, message_reference=reference,
+                                       flags=64 if hidden is True else None)
+
+        try:
+            data = await self._http.send_interaction_response(use_webhook=False, interaction_id=self.__interaction_id,
+                                                              token=self.__token, application_id=self.__application_id,
+                                                              deferred=self.deferred, followup=bool(self.callback_message),
+                                                              files=files, payload=payload)
+        finally:
+            if files is not None:
+                for f in files:
+                    f.close()
+
+        msg = None
+        if isinstance(data, dict):
+            # follow-up messages are returned by Discord
+            msg = self._state.create_message(channel=self._response_channel, data=data)
+        elif hidden is not True and (fetch_message or delete_after is not None):
+            msg = await self.original_message()
+
+        if msg is not None and delete_after is not None and hidden is not True:
+            await msg.delete(delay=delete_after)
 
         if hidden is True:
             self.deferred_hidden = True
@@ -183,6 +301,75 @@ class Interaction:
         self.deferred = True
         return msg
 
+    def set_auto_defer(self, deadline):
+        """
+        Defers the interaction automatically if there was no response ``deadline`` seconds after
+        it was received, so a slow handler does not let the interaction fail.
+        Later :meth:`respond` calls send follow-up messages then.
+
+        This is set up for every interaction if the ``auto_defer`` option of the :class:`Client` is set.
+
+        :param deadline: Optional[float]
+            The number of seconds after which the interaction is deferred, should be lower than 3.
+            ``None`` disables the automatic deferral.
+        """
+        if self._auto_defer_handle is not None:
+            self._auto_defer_handle.cancel()
+            self._auto_defer_handle = None
+        if deadline is None or self.deferred:
+            return
+        delay = max(0.0, deadline - (time.monotonic() - self._received))
+        self._auto_defer_handle = self._state.loop.call_later(delay, self._start_auto_defer)
+
+    def _start_auto_defer(self):
+        self._auto_defer_handle = None
+        if not self.deferred:
+            self._auto_defer_task = self._state.loop.create_task(self._auto_defer())
+
+    async def _auto_defer(self):
+        try:
+            await self.defer()
+        except Exception:
+            log.exception('Could not defer interaction ID %s automatically.', self.__interaction_id)
+        else:
+            self.auto_deferred = self.deferred
+
+    async def _before_response(self):
+        # stops a pending automatic deferral or waits for a running one,
+        # so the handler's response is sent as a follow-up instead
+        if self._auto_defer_handle is not None:
+            self._auto_defer_handle.cancel()
+            self._auto_defer_handle = None
+
+        task = self._auto_defer_task
+        current = asyncio.current_task()
+        if task is not None and task is not current:
+            await asyncio.shield(task)
+
+        handler = getattr(current, 'handler', None)
+        if handler not in self._timed_handlers:
+            self._timed_handlers.add(handler)
+            latency = time.monotonic() - self._received
+            self._state._record_interaction_latency(handler, latency, late=self.auto_deferred)
+
+    @property
+    def _response_channel(self):
+        return self._resolve_channel() or PartialMessageable(state=self._state, id=self.channel_id)
+
+    async def original_message(self) -> Message:
+        """|coro|
+
+        Fetches the message of the initial response to this interaction.
+        The message is only fetched once.
+
+        .. warning::
+            This is a API-Call and should use carefully"""
+        if self._original_message is None:
+            data = await self._http.get_original_interaction_response(interaction_token=self.__token,
+                                                                       application_id=self.__application_id)
+            self._original_message = self._state.create_message(channel=self._response_channel, data=data)
+        return self._original_message
+
     async def get_original_callback(self):
         """|coro|
 
@@ -205,43 +392,121 @@ class Interaction:
     def author(self) -> typing.Union[Member, User]:
         return self.member if self.member is not None else self.user
 
+    @property
+    def user(self) -> User:
+        try:
+            return self._user
+        except AttributeError:
+            self._user = user = self._state.store_user(self._user_data)
+            return user
+
+    @user.setter
+    def user(self, value):
+        self._user = value
+
+    @property
+    def member(self) -> typing.Optional[Member]:
+        """
+        The member that performed the interaction, ``None`` in DMs and for guilds that are not cached.
+        """
+        try:
+            return self._member
+        except AttributeError:
+            pass
+
+        guild = self.guild
+        member = None
+        if guild is not None:
+            member = guild.get_member(self.user_id)
+            if member is None and self._member_data is not None:
+                # This can only be the case if member-intents are not activated. or the member is not in the guild-cache right now
+                member = Member(guild=guild, data=self._member_data, state=self._state)
+        self._member = member
+        return member
+
+    @member.setter
+    def member(self, value):
+        self._member = value
+
+    def _resolve_channel(self):
+        try:
+            return self._channel
+        except AttributeError:
+            pass
+
+        guild = self.guild
+        if guild is not None:
+            channel = guild.get_channel(self.channel_id)
+        elif not self.guild_id:
+            channel = self._state._get_private_channel(self.channel_id)
+        else:
+            # the guild is not cached when interactions are received without a gateway connection
+            channel = None
+        self._channel = channel
+        return channel
+
     @property
     def channel(self):
-        return self._channel if self._channel else self.message.channel
+        channel = self._resolve_channel()
+        return channel if channel else self.message.channel
 
     @property
     def guild(self):
-        return self._guild
+        try:
+            return self._guild
+        except AttributeError:
+            self._guild = guild = self._state._get_guild(self.guild_id) if self.guild_id else None
+            return guild
 
     @property
     def message_is_dm(self) -> bool:
         return not self.guild_id
 
-    #@property
-    #def message(self) -> typing.Union[Message, EphemeralMessage]:
-    #    message = self._state._get_message(self.message_id)
-    #    if not message:
-    #        message = EphemeralMessage() if self.message_is_hidden else Message(state=self._state, channel=self.channel, data=self._message)
-    #    return message
+    @property
+    def message(self) -> Message:
+        if self._cached_message is None:
+            message = self._state._get_message(self.message_id)
+            if message is None:
+                channel = self._resolve_channel() or PartialMessageable(state=self._state, id=self.channel_id)
+                message = Message(state=self._state, channel=channel, data=self._message)
+            self._cached_message = message
+        return self._cached_message
+
+    @message.setter
+    def message(self, value):
+        self._cached_message = value
 
     @property
     def message_is_hidden(self) -> bool:
         return self.message_flags == 64
 
+    def _component_from_payload(self, custom_id):
+        # only creates the clicked component instead of the whole message
+        for action_row in self._message.get('components', []):
+            for component in action_row.get('components', []):
+                if component.get('custom_id') == custom_id:
+                    return _component_factory(component)
+
     @property
     def component(self) -> Union[Button, SelectMenu, ButtonClick, SelectionSelect, None]:
         if self._component is None:
             custom_id = self._data.get('custom_id')
             if custom_id is not None:
-                if custom_id.isdigit():
-                    custom_id = int(custom_id)
-                if self._data.get('component_type') == 2:
-                    self._component = utils.get(self.message.all_buttons, custom_id=custom_id)
-                elif self._data.get('component_type') == 3:
-                    select_menu = utils.get(self.message.all_select_menus, custom_id=custom_id)
-                    if select_menu is not None:
-                        setattr(select_menu, '_values', self._data['values'])
-                    self._component = select_menu
+                message = self._cached_message or self._state._get_message(self.message_id)
+                if message is not None:
+                    self._cached_message = message
+                    component = message.get_component(custom_id)
+                else:
+                    component = self._component_from_payload(custom_id)
+
+                if self.component_type == 2:
+                    self._component = component if isinstance(component, Button) else None
+                elif self.component_type == 3:
+                    if isinstance(component, SelectMenu):
+                        if component.is_frozen():
+                            component = component.copy()
+                        setattr(component, '_values', self._data['values'])
+                        self._component = component
         return self._component
 
 
@@ -299,7 +299,10 @@ class Member(discord.abc.Messageable, _BaseUser):
         return ch
 
     def _update_roles(self, data):
-        self._roles = utils.SnowflakeList(map(int, data['roles']))
+        if self._state.cache_flags.member_roles or self._user.id == self._state.self_id:
+            self._roles = utils.SnowflakeList(map(int, data['roles']))
+        else:
+            self._roles = utils.SnowflakeList(())
 
     def _update(self, data):
         # the nickname change is optional,
@@ -318,12 +321,13 @@ class Member(discord.abc.Messageable, _BaseUser):
         self._update_roles(data)
 
     def _presence_update(self, data, user):
-        self.activities = tuple(map(create_activity, data.get('activities', [])))
-        self._client_status = {
-            sys.intern(key): sys.intern(value)
-            for key, value in data.get('client_status', {}).items()
-        }
-        self._client_status[None] = sys.intern(data['status'])
+        if self._state.cache_flags.presences:
+            self.activities = tuple(map(create_activity, data.get('activities', [])))
+            self._client_status = {
+                sys.intern(key): sys.intern(value)
+                for key, value in data.get('client_status', {}).items()
+            }
+            self._client_status[None] = sys.intern(data['status'])
 
         if len(user) > 1:
             return self._update_inner_user(user)
@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from bisect import bisect_left, insort
+
+def _insert(mapping, key, member_id):
+    # the IDs of a key are stored as an int while the key is unique, which is
+    # the common case, and as an insertion ordered dict otherwise
+    # returns whether the key is new
+    ids = mapping.get(key)
+    if ids is None:
+        mapping[key] = member_id
+        return True
+    if type(ids) is int:
+        if ids != member_id:
+            mapping[key] = {ids: None, member_id: None}
+    else:
+        ids[member_id] = None
+    return False
+
+def _delete(mapping, key, member_id):
+    # returns whether the key was removed
+    ids = mapping.get(key)
+    if ids is None:
+        return False
+    if type(ids) is int:
+        if ids != member_id:
+            return False
+        del mapping[key]
+        return True
+    ids.pop(member_id, None)
+    if len(ids) == 1:
+        mapping[key] = next(iter(ids))
+    return False
+
+def _ids(ids):
+    if ids is None:
+        return ()
+    if type(ids) is int:
+        return (ids,)
+    return tuple(ids)
+
+def _member_keys(member):
+    user = member._user
+    return user.name, member.nick, '{0}#{1}'.format(user.name, user.discriminator)
+
+class MemberNameIndex:
+    """Maps the names, nicknames and name#discriminator tags of the members of
+    a guild to their IDs.
+
+    The index is kept up to date by the guild and the state whenever a member
+    is added, updated or removed, so looking a member up by name does not have
+    to scan the whole member cache. Case-insensitive prefix searches use a
+    sorted list of the casefolded names and nicknames.
+    """
+
+    __slots__ = ('_indexed', '_names', '_tags', '_folded', '_sorted', '_pending', '_stale')
+
+    def __init__(self, members=()):
+        # Dict[int, Tuple[str, Optional[str], str]] of the keys every member is indexed by
+        self._indexed = {}
+        # the IDs of the members by name and by nickname
+        self._names = {}
+        # the IDs of the members by name#discriminator
+        self._tags = {}
+        # the IDs of the members by casefolded name and nickname
+        self._folded = {}
+        # the sorted keys of _folded, which may contain keys that were removed since
+        self._sorted = []
+        # the keys added to _folded since _sorted was last sorted
+        self._pending = []
+        self._stale = 0
+        for member in members:
+            self.add(member)
+
+    def __len__(self):
+        return len(self._indexed)
+
+    def __contains__(self, member_id):
+        return member_id in self._indexed
+
+    def add(self, member):
+        """Indexes a member or updates the keys of an indexed member."""
+        keys = _member_keys(member)
+        member_id = member.id
+        old = self._indexed.get(member_id)
+        if old == keys:
+            return
+        if old is not None:
+            self._unindex(member_id, old)
+
+        self._indexed[member_id] = keys
+        name, nick, tag = keys
+        _insert(self._names, name, member_id)
+        _insert(self._tags, tag, member_id)
+        folded = name.casefold()
+        if _insert(self._folded, folded, member_id):
+            self._pending.append(folded)
+        if nick is not None:
+            if nick != name:
+                _insert(self._names, nick, member_id)
+            folded_nick = nick.casefold()
+            if folded_nick != folded and _insert(self._folded, folded_nick, member_id):
+                self._pending.append(folded_nick)
+
+    def remove(self, member_id):
+        """Removes a member from the index."""
+        keys = self._indexed.pop(member_id, None)
+        if keys is not None:
+            self._unindex(member_id, keys)
+
+    def _unindex(self, member_id, keys):
+        name, nick, tag = keys
+        _delete(self._names, name, member_id)
+        _delete(self._tags, tag, member_id)
+        folded = name.casefold()
+        self._stale += _delete(self._folded, folded, member_id)
+        if nick is not None:
+            if nick != name:
+                _delete(self._names, nick, member_id)
+            folded_nick = nick.casefold()
+            if folded_nick != folded:
+                self._stale += _delete(self._folded, folded_nick, member_id)
+
+    def named(self, name):
+        """Returns the IDs of the members whose name or nickname is ``name``."""
+        return _ids(self._names.get(name))
+
+    def tagged(self, tag):
+        """Returns the IDs of the members whose name#discriminator is ``tag``."""
+        return _ids(self._tags.get(tag))
+
+    def _sorted_keys(self):
+        keys = self._sorted
+        pending = self._pending
+        if pending:
+            if len(pending) <= 32:
+                for key in pending:
+                    insort(keys, key)
+            else:
+                # both runs are sorted then, so this is a linear merge
+                pending.sort()
+                keys.extend(pending)
+                keys.sort()
+            self._pending = []
+        if self._stale:
+            # a removed key is added to _pending again if it is reused
+            folded = self._folded
+            self._sorted = keys = [key for key in dict.fromkeys(keys) if key in folded]
+            self._stale = 0
+        return keys
+
+    def startswith(self, prefix):
+        """Yields the IDs of the members whose name or nickname starts with
+        ``prefix``, ignoring case, ordered by that name or nickname.
+
+        A member is yielded twice if both its name and nickname match.
+        """
+        prefix = prefix.casefold()
+        keys = self._sorted_keys()
+        folded = self._folded
+        index = bisect_left(keys, prefix)
+        while index < len(keys):
+            key = keys[index]
+            if not key.startswith(prefix):
+                break
+            yield from _ids(folded.get(key))
+            index += 1
+
+class MemberRoleIndex:
+    """Maps the role IDs of a guild to the IDs of the cached members that have them.
+
+    Like :class:`MemberNameIndex`, this is kept up to date by the guild and the
+    state whenever a member is added, updated or removed. The roles of a member
+    are replaced rather than modified in place when they change, so an update
+    that does not touch them is detected by identity.
+    """
+
+    __slots__ = ('_indexed', '_members')
+
+    def __init__(self, members=()):
+        # Dict[int, SnowflakeList] of the roles every member is indexed by
+        self._indexed = {}
+        # Dict[int, Dict[int, None]] of the member IDs by role ID, in insertion order
+        self._members = {}
+        for member in members:
+            self.add(member)
+
+    def __contains__(self, member_id):
+        return member_id in self._indexed
+
+    def add(self, member):
+        """Indexes a member or updates the roles of an indexed member."""
+        roles = member._roles
+        member_id = member.id
+        old = self._indexed.get(member_id)
+        if old is roles:
+            return
+
+        self._indexed[member_id] = roles
+        if old is None:
+            added = roles
+        else:
+            old, roles = set(old), set(roles)
+            added = roles - old
+            self._unindex(member_id, old - roles)
+
+        mapping = self._members
+        for role_id in added:
+            try:
+                mapping[role_id][member_id] = None
+            except KeyError:
+                mapping[role_id] = {member_id: None}
+
+    def remove(self, member_id):
+        """Removes a member from the index."""
+        roles = self._indexed.pop(member_id, None)
+        if roles is not None:
+            self._unindex(member_id, roles)
+
+    def _unindex(self, member_id, role_ids):
+        mapping = self._members
+        for role_id in role_ids:
+            ids = mapping.get(role_id)
+            if ids is not None:
+                ids.pop(member_id, None)
+                if not ids:
+                    del mapping[role_id]
+
+    def remove_role(self, role_id):
+        """Removes a deleted role from the index."""
+        self._members.pop(role_id, None)
+
+    def members(self, role_id):
+        """Returns the IDs of the members with the role."""
+        return tuple(self._members.get(role_id, ()))
+
+    def count(self, role_id):
+        """Returns the number of members with the role."""
+        return len(self._members.get(role_id, ()))
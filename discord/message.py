@@ -409,6 +409,32 @@ class MessageReference:
     to_message_reference_dict = to_dict
 
 
+def lazy_field(key):
+    # A field that is created from the raw payload stored in Message._data
+    # when it is first accessed, the result is stored in the private slot.
+    slot = '_' + key
+    build = '_build_' + key
+
+    def fget(self):
+        try:
+            return getattr(self, slot)
+        except AttributeError:
+            pass
+
+        value = getattr(self, build)(self._data)
+        try:
+            setattr(self, slot, value)
+        except AttributeError:
+            # an UpdateDiff resolving the value from before an update
+            pass
+        return value
+
+    def fset(self, value):
+        setattr(self, slot, value)
+
+    return property(fget, fset)
+
+
 def flatten_handlers(cls):
     prefix = len('_handle_')
     handlers = [
@@ -544,21 +570,29 @@ class Message(Hashable):
     """
 
     __slots__ = ('_edited_timestamp', 'tts', 'content', 'channel', 'webhook_id',
-                 'mention_everyone', 'embeds', 'components', 'id', 'mentions', 'author',
-                 '_cs_channel_mentions', '_cs_raw_mentions', 'attachments',
+                 'mention_everyone', '_embeds', '_components', 'id', '_mentions', 'author',
+                 '_cs_channel_mentions', '_cs_raw_mentions', '_attachments',
                  '_cs_clean_content', '_cs_raw_channel_mentions', 'nonce', 'pinned',
-                 'role_mentions', '_cs_raw_role_mentions', 'type', 'call', 'flags',
-                 '_cs_system_content', '_cs_guild', '_state', 'reactions', 'reference',
-                 'application', 'activity', 'stickers')
+                 '_role_mentions', '_cs_raw_role_mentions', 'type', 'call', 'flags',
+                 '_cs_system_content', '_cs_guild', '_state', '_reactions', '_reference',
+                 'application', 'activity', '_stickers', '_data', '_component_index')
+
+    # These are created from the raw payload when they are first accessed,
+    # most handlers never look at them.
+    reactions = lazy_field('reactions')
+    attachments = lazy_field('attachments')
+    embeds = lazy_field('embeds')
+    components = lazy_field('components')
+    stickers = lazy_field('stickers')
+    mentions = lazy_field('mentions')
+    role_mentions = lazy_field('role_mentions')
+    reference = lazy_field('reference')
 
     def __init__(self, *, state, channel, data):
         self._state = state
+        self._data = data
         self.id = utils._get_as_snowflake(data, 'id')
         self.webhook_id = utils._get_as_snowflake(data, 'webhook_id')
-        self.reactions = [Reaction(message=self, data=d) for d in data.get('reactions', [])]
-        self.attachments = [Attachment(data=a, state=self._state) for a in data.get('attachments', [])]
-        self.embeds = [Embed.from_dict(a) for a in data.get('embeds', [])]
-        self.components = [ActionRow.from_dict(d) for d in data.get('components', [])]
         self.application = data.get('application')
         self.activity = data.get('activity')
         self.channel = channel
@@ -571,31 +605,8 @@ class Message(Hashable):
         self.tts = data['tts']
         self.content = data['content']
         self.nonce = data.get('nonce')
-        self.stickers = [Sticker(data=data, state=state) for data in data.get('stickers', [])]
 
-        try:
-            ref = data['message_reference']
-        except KeyError:
-            self.reference = None
-        else:
-            self.reference = ref = MessageReference.with_state(state, ref)
-            try:
-                resolved = data['referenced_message']
-            except KeyError:
-                pass
-            else:
-                if resolved is None:
-                    ref.resolved = DeletedReferencedMessage(ref)
-                else:
-                    # Right now the channel IDs match but maybe in the future they won't.
-                    if ref.channel_id == channel.id:
-                        chan = channel
-                    else:
-                        chan, _ = state._get_guild_channel(resolved)
-
-                    ref.resolved = self.__class__(channel=chan, data=resolved, state=state)
-
-        for handler in ('author', 'member', 'mentions', 'mention_roles', 'call', 'flags'):
+        for handler in ('author', 'member', 'call', 'flags'):
             try:
                 getattr(self, '_handle_%s' % handler)(data[handler])
             except KeyError:
@@ -615,6 +626,84 @@ class Message(Hashable):
             else:
                 setattr(self, key, transform(value))
 
+    def _build_reactions(self, data):
+        return [Reaction(message=self, data=d) for d in data.get('reactions', [])]
+
+    def _build_attachments(self, data):
+        return [Attachment(data=a, state=self._state) for a in data.get('attachments', [])]
+
+    def _build_embeds(self, data):
+        return [Embed.from_dict(a) for a in data.get('embeds', [])]
+
+    def _build_components(self, data):
+        cache = self._state._component_cache
+        if cache is not None:
+            return [cache.get(d) for d in data.get('components', [])]
+        return [ActionRow.from_dict(d) for d in data.get('components', [])]
+
+    def _build_stickers(self, data):
+        state = self._state
+        if not state.cache_flags.stickers:
+            return []
+        return [Sticker(data=d, state=state) for d in data.get('stickers', [])]
+
+    def _build_reference(self, data):
+        try:
+            ref = data['message_reference']
+        except KeyError:
+            return None
+
+        state = self._state
+        ref = MessageReference.with_state(state, ref)
+        if state.cache_flags.referenced_messages and 'referenced_message' in data:
+            resolved = data['referenced_message']
+            if resolved is None:
+                ref.resolved = DeletedReferencedMessage(ref)
+            else:
+                # Right now the channel IDs match but maybe in the future they won't.
+                if ref.channel_id == self.channel.id:
+                    chan = self.channel
+                else:
+                    chan, _ = state._get_guild_channel(resolved)
+
+                ref.resolved = self.__class__(channel=chan, data=resolved, state=state)
+        return ref
+
+    def _build_mentions(self, data):
+        mentions = data.get('mentions', [])
+        guild = self.guild
+        state = self._state
+        if not isinstance(guild, Guild):
+            return [state.store_user(m) for m in mentions]
+
+        r = []
+        for mention in filter(None, mentions):
+            id_search = int(mention['id'])
+            member = guild.get_member(id_search)
+            if member is not None:
+                r.append(member)
+            else:
+                r.append(Member._try_upgrade(data=mention, guild=guild, state=state))
+        return r
+
+    def _build_role_mentions(self, data):
+        role_mentions = []
+        if isinstance(self.guild, Guild):
+            for role_id in map(int, data.get('mention_roles', [])):
+                role = self.guild.get_role(role_id)
+                if role is not None:
+                    role_mentions.append(role)
+        return role_mentions
+
+    def _set_raw(self, key, value, field):
+        # the payload may be shared, so it is copied rather than updated in place
+        self._data = data = self._data.copy()
+        data[key] = value
+        try:
+            delattr(self, '_' + field)
+        except AttributeError:
+            pass
+
     def _add_reaction(self, data, emoji, user_id):
         reaction = utils.find(lambda r: r.emoji == emoji, self.reactions)
         is_me = data['me'] = user_id == self._state.self_id
@@ -708,13 +797,13 @@ class Message(Hashable):
         self.content = value
 
     def _handle_attachments(self, value):
-        self.attachments = [Attachment(data=a, state=self._state) for a in value]
+        self._set_raw('attachments', value, 'attachments')
 
     def _handle_embeds(self, value):
-        self.embeds = [Embed.from_dict(data) for data in value]
+        self._set_raw('embeds', value, 'embeds')
 
     def _handle_components(self, value):
-        self.components = [ActionRow.from_dict(data) for data in value]
+        self._set_raw('components', value, 'components')
 
     def _handle_nonce(self, value):
         self.nonce = value
@@ -741,30 +830,15 @@ class Message(Hashable):
             # It's a user here
             # TODO: consider adding to cache here
             self.author = Member._from_message(message=self, data=member)
+        else:
+            # the nickname may have changed
+            self.guild._reindex_member(author)
 
     def _handle_mentions(self, mentions):
-        self.mentions = r = []
-        guild = self.guild
-        state = self._state
-        if not isinstance(guild, Guild):
-            self.mentions = [state.store_user(m) for m in mentions]
-            return
-
-        for mention in filter(None, mentions):
-            id_search = int(mention['id'])
-            member = guild.get_member(id_search)
-            if member is not None:
-                r.append(member)
-            else:
-                r.append(Member._try_upgrade(data=mention, guild=guild, state=state))
+        self._set_raw('mentions', mentions, 'mentions')
 
     def _handle_mention_roles(self, role_mentions):
-        self.role_mentions = []
-        if isinstance(self.guild, Guild):
-            for role_id in map(int, role_mentions):
-                role = self.guild.get_role(role_id)
-                if role is not None:
-                    self.role_mentions.append(role)
+        self._set_raw('mention_roles', role_mentions, 'role_mentions')
 
     def _handle_call(self, call):
         if call is None or self.type is not MessageType.call:
@@ -1020,6 +1094,38 @@ class Message(Hashable):
                 if isinstance(component, SelectMenu):
                     yield component
 
+    def get_component(self, custom_id):
+        """Returns the :class:`Button` or :class:`SelectMenu` with the given ``custom_id``.
+
+        The lookup uses an index of the components that is built on first use
+        and rebuilt when the components of the message change.
+
+        Parameters
+        -----------
+        custom_id: Union[:class:`str`, :class:`int`]
+            The custom_id of the component.
+
+        Returns
+        --------
+        Optional[Union[:class:`Button`, :class:`SelectMenu`]]
+            The component or ``None`` if not found.
+        """
+        components = self.components
+        try:
+            indexed, index = self._component_index
+        except AttributeError:
+            indexed = None
+
+        if indexed is not components:
+            index = {}
+            for action_row in components:
+                for component in action_row:
+                    if component.custom_id is not None:
+                        index[str(component.custom_id)] = component
+            self._component_index = (components, index)
+
+        return index.get(str(custom_id))
+
     async def delete(self, *, delay=None):
         """|coro|
 
@@ -1100,6 +1206,12 @@ class Message(Hashable):
 
             .. versionadded:: 1.4
 
+        prepared: Optional[:class:`PreparedMessage`]
+            A message whose embeds, components and allowed mentions were serialized
+            beforehand. The edited message is replaced by it, if ``content`` is passed
+            it replaces the content of the prepared message. This cannot be mixed
+            with ``embed``, ``embeds``, ``components`` or ``allowed_mentions``.
+
         Raises
         -------
         HTTPException
@@ -1109,6 +1221,10 @@ class Message(Hashable):
             edited a message's content or embed that isn't yours.
         """
 
+        prepared = fields.pop('prepared', None)
+        if prepared is not None and any(key in fields for key in ('embed', 'embeds', 'components', 'allowed_mentions')):
+            raise InvalidArgument('cannot mix prepared with embed, embeds, components or allowed_mentions')
+
         try:
             content = fields['content']
         except KeyError:
@@ -1176,6 +1292,10 @@ class Message(Hashable):
                     allowed_mentions = allowed_mentions.to_dict()
                 fields['allowed_mentions'] = allowed_mentions
 
+        if prepared is not None:
+            prepared = prepared._to_payload(self._state.allowed_mentions, edit=True,
+                                            content=fields.pop('content', None), flags=fields.pop('flags', None))
+
         is_interaction_response = fields.pop('__is_interaction_response', None)
         if is_interaction_response is True:
             deferred = fields.pop('__deferred', False)
@@ -1186,23 +1306,24 @@ class Message(Hashable):
             files = fields.pop('files', fields.pop('file', None))
             if files and not isinstance(files, list):
                 files = [files]
-            if fields:
+            if fields or prepared is not None:
                 try:
                     payload = await self._state.http.edit_interaction_response(use_webhook=use_webhook,
                                                                             interaction_id=interaction_id,
                                                                             token=interaction_token,
                                                                             application_id=application_id,
-                                                                            deferred=deferred, files=files, **fields)
+                                                                            deferred=deferred, files=files,
+                                                                            payload=prepared, **fields)
                 except NotFound:
                     is_interaction_response = None
                 else:
                     if payload:
                         self._update(payload)
-                    else:
+                    elif prepared is None:
                         [self.__setattr__(k, v) for k, v in fields.items()]
 
         if is_interaction_response is None:
-            payload = await self._state.http.edit_message(self.channel.id, self.id, **fields)
+            payload = await self._state.http.edit_message(self.channel.id, self.id, payload=prepared, **fields)
             self._update(payload)
 
         if delete_after is not None:
@@ -1662,6 +1783,12 @@ class PartialMessage(Hashable):
             If no object is passed at all then the defaults given by :attr:`~discord.Client.allowed_mentions`
             are used instead.
 
+        prepared: Optional[:class:`PreparedMessage`]
+            A message whose embeds, components and allowed mentions were serialized
+            beforehand. The edited message is replaced by it, if ``content`` is passed
+            it replaces the content of the prepared message. This cannot be mixed
+            with ``embed``, ``embeds``, ``components`` or ``allowed_mentions``.
+
         Raises
         -------
         NotFound
@@ -1678,6 +1805,10 @@ class PartialMessage(Hashable):
             The message that was edited.
         """
 
+        prepared = fields.pop('prepared', None)
+        if prepared is not None and any(key in fields for key in ('embed', 'embeds', 'components', 'allowed_mentions')):
+            raise InvalidArgument('cannot mix prepared with embed, embeds, components or allowed_mentions')
+
         try:
             content = fields['content']
         except KeyError:
@@ -1746,6 +1877,10 @@ class PartialMessage(Hashable):
                     allowed_mentions = allowed_mentions.to_dict()
                 fields['allowed_mentions'] = allowed_mentions
 
+        if prepared is not None:
+            prepared = prepared._to_payload(self._state.allowed_mentions, edit=True,
+                                            content=fields.pop('content', None), flags=fields.pop('flags', None))
+
         is_interaction_response = fields.pop('__is_interaction_response', None)
         if is_interaction_response is True:
             deferred = fields.pop('__deferred', False)
@@ -1756,23 +1891,24 @@ class PartialMessage(Hashable):
             files = fields.pop('files', fields.pop('file', None))
             if files and not isinstance(files, list):
                 files = [files]
-            if fields:
+            if fields or prepared is not None:
                 try:
                     payload = await self._state.http.edit_interaction_response(use_webhook=use_webhook,
                                                                                interaction_id=interaction_id,
                                                                                token=interaction_token,
                                                                                application_id=application_id,
-                                                                               deferred=deferred, files=files, **fields)
+                                                                               deferred=deferred, files=files,
+                                                                               payload=prepared, **fields)
                 except NotFound:
                     is_interaction_response = None
                 else:
                     if payload:
                         self._update(payload)
-                    else:
+                    elif prepared is None:
                         [self.__setattr__(k, v) for k, v in fields.items()]
 
         if is_interaction_response is None:
-            payload = await self._state.http.edit_message(self.channel.id, self.id, **fields)
+            payload = await self._state.http.edit_message(self.channel.id, self.id, payload=prepared, **fields)
             self._update(payload)
 
         if delete_after is not None:
@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import collections.abc
+import itertools
+import json
+import logging
+import sys
+import time
+import zlib
+from collections import deque, OrderedDict
+
+from . import utils
+
+log = logging.getLogger(__name__)
+
+def _expires_before(ttl):
+    # the smallest snowflake that is not older than ttl seconds
+    if ttl is None:
+        return None
+    return int(time.time() * 1000 - ttl * 1000 - utils.DISCORD_EPOCH) << 22
+
+class MessageCache:
+    """The message cache of a :class:`ConnectionState`.
+
+    The most recent messages are kept as :class:`Message` objects (the hot tier),
+    partitioned by channel. Besides the global ``max_messages`` ceiling the number
+    of messages per channel and per guild can be limited, in which case the oldest
+    message of the partition is evicted, so a busy channel cannot evict the
+    history of every other channel. Messages older than ``ttl`` seconds are
+    dropped entirely.
+
+    If ``max_bytes`` is given, messages that are evicted from the hot tier are
+    demoted to their compressed gateway payloads (the cold tier) instead of being
+    dropped and are turned back into :class:`Message` objects when they are
+    looked up again. The cold tier drops the oldest payloads once it exceeds
+    ``max_bytes``.
+
+    Sequence operations only cover the hot tier.
+    """
+
+    __slots__ = ('_state', 'max_messages', 'max_bytes', 'max_channel_messages', 'max_guild_messages', 'ttl',
+                 '_hot', '_channels', '_guilds', '_raw', '_cold', 'cold_bytes')
+
+    def __init__(self, state, *, max_messages, max_bytes=None, max_channel_messages=None,
+                 max_guild_messages=None, ttl=None):
+        self._state = state
+        self.max_messages = max_messages
+        self.max_bytes = max_bytes
+        self.max_channel_messages = max_channel_messages
+        self.max_guild_messages = max_guild_messages
+        self.ttl = ttl
+        # OrderedDict[int, Message] of the hot tier, oldest first
+        self._hot = OrderedDict()
+        # Dict[int, Deque[Message]] of the hot tier by channel ID
+        self._channels = {}
+        # Dict[int, Deque[Message]] of the hot tier by guild ID, only kept with a guild quota
+        self._guilds = {}
+        # Dict[int, dict] of the payloads of the hot tier, only kept with a cold tier
+        self._raw = {}
+        # OrderedDict[int, Tuple[Optional[int], bytes]] of compressed payloads by message ID
+        self._cold = OrderedDict()
+        self.cold_bytes = 0
+
+    def __getitem__(self, idx):
+        hot = self._hot
+        size = len(hot)
+        if isinstance(idx, slice):
+            start, stop, step = idx.indices(size)
+            if step != 1 or start >= stop:
+                return list(hot.values())[idx]
+            # walk in from whichever end is closer
+            if start < size - stop:
+                return list(itertools.islice(hot.values(), start, stop))
+            keys = list(itertools.islice(reversed(hot), size - stop, size - start))
+            return [hot[key] for key in reversed(keys)]
+
+        if idx < 0:
+            idx += size
+        if not 0 <= idx < size:
+            raise IndexError('message cache index out of range')
+        if idx < size // 2:
+            return next(itertools.islice(hot.values(), idx, None))
+        return hot[next(itertools.islice(reversed(hot), size - 1 - idx, None))]
+
+    def __len__(self):
+        return len(self._hot)
+
+    def __contains__(self, message):
+        return self._hot.get(message.id) is message
+
+    def __iter__(self):
+        return iter(self._hot.values())
+
+    def __reversed__(self):
+        hot = self._hot
+        return (hot[message_id] for message_id in reversed(hot))
+
+    def index(self, message):
+        for index, cached in enumerate(self._hot.values()):
+            if cached is message:
+                return index
+        raise ValueError('message is not in the message cache')
+
+    def count(self, message):
+        return int(message in self)
+
+    def __repr__(self):
+        return '<MessageCache messages={0} channels={1} cold_messages={2} cold_bytes={3}>' \
+               .format(len(self), len(self._channels), len(self._cold), self.cold_bytes)
+
+    @property
+    def cold_count(self):
+        return len(self._cold)
+
+    def channel_view(self, channel_id):
+        """Returns a sequence of the cached messages of a channel that stays up to date."""
+        return _ChannelMessages(self, channel_id)
+
+    def channel_messages(self, channel_id):
+        """Returns the deque of cached messages of a channel, oldest first."""
+        self._expire()
+        expires_before = _expires_before(self.ttl)
+        channel = self._channels.get(channel_id, ())
+        # messages promoted from the cold tier are not ordered by age globally
+        while expires_before is not None and channel and channel[0].id < expires_before:
+            self._discard(channel[0])
+            channel = self._channels.get(channel_id, ())
+        return channel
+
+    def append(self, message, data=None):
+        channel_id = message.channel.id
+        guild_id = getattr(message.guild, 'id', None)
+
+        cached = self._hot.get(message.id)
+        if cached is not None:
+            self._discard(cached)
+
+        self._expire()
+        if self.max_channel_messages is not None:
+            channel = self._channels.get(channel_id)
+            if channel is not None and len(channel) >= self.max_channel_messages:
+                self._evict(channel[0])
+
+        if self.max_guild_messages is not None:
+            guild = self._guilds.get(guild_id)
+            if guild is not None and len(guild) >= self.max_guild_messages:
+                self._evict(guild[0])
+
+        if len(self._hot) >= self.max_messages:
+            self._evict(next(iter(self._hot.values())))
+
+        self._hot[message.id] = message
+        try:
+            self._channels[channel_id].append(message)
+        except KeyError:
+            self._channels[channel_id] = deque((message,))
+
+        if self.max_guild_messages is not None and guild_id is not None:
+            try:
+                self._guilds[guild_id].append(message)
+            except KeyError:
+                self._guilds[guild_id] = deque((message,))
+
+        if self.max_bytes is not None and data is not None:
+            self._raw[message.id] = data
+
+    def _discard(self, message):
+        # removes a message from the hot tier and returns its payload
+        del self._hot[message.id]
+        channel_id = message.channel.id
+        channel = self._channels[channel_id]
+        if channel[0] is message:
+            channel.popleft()
+        else:
+            channel.remove(message)
+        if not channel:
+            del self._channels[channel_id]
+
+        guild_id = getattr(message.guild, 'id', None)
+        guild = self._guilds.get(guild_id)
+        if guild is not None:
+            if guild[0] is message:
+                guild.popleft()
+            else:
+                guild.remove(message)
+            if not guild:
+                del self._guilds[guild_id]
+
+        return self._raw.pop(message.id, None)
+
+    def remove(self, message):
+        if self._hot.get(message.id) is not message:
+            raise ValueError('message is not in the message cache')
+        self._discard(message)
+
+    def get(self, message_id):
+        try:
+            return self._hot[message_id]
+        except KeyError:
+            pass
+
+        try:
+            _, blob = self._cold.pop(message_id)
+        except KeyError:
+            return None
+
+        self.cold_bytes -= sys.getsizeof(blob)
+        data = json.loads(zlib.decompress(blob))
+        try:
+            channel, _ = self._state._get_guild_channel(data)
+            message = self._state.create_message(channel=channel, data=data)
+        except Exception:
+            log.exception('Could not rehydrate cached message ID %s.', message_id)
+            return None
+
+        # the message is likely going to be used again so it is promoted back
+        self.append(message, data)
+        return message
+
+    def update(self, message_id, data):
+        # keeps the payload of an edited message up to date for when it is demoted,
+        # the payload is shared with the message so it is replaced rather than updated
+        try:
+            raw = self._raw[message_id]
+        except KeyError:
+            return
+        self._raw[message_id] = {**raw, **data}
+
+    def remove_guilds(self, guild_ids):
+        removed = [m for m in self._hot.values() if getattr(m.guild, 'id', None) in guild_ids]
+        for message in removed:
+            self._discard(message)
+
+        for message_id, (guild_id, blob) in list(self._cold.items()):
+            if guild_id in guild_ids:
+                del self._cold[message_id]
+                self.cold_bytes -= sys.getsizeof(blob)
+
+    def _expire(self):
+        expires_before = _expires_before(self.ttl)
+        if expires_before is None:
+            return
+
+        hot = self._hot
+        while hot:
+            message_id, message = next(iter(hot.items()))
+            if message_id >= expires_before:
+                break
+            self._discard(message)
+
+        cold = self._cold
+        while cold:
+            message_id, (_, blob) = next(iter(cold.items()))
+            if message_id >= expires_before:
+                break
+            del cold[message_id]
+            self.cold_bytes -= sys.getsizeof(blob)
+
+    def _evict(self, message):
+        data = self._discard(message)
+        if data is None:
+            return
+
+        try:
+            blob = zlib.compress(utils.to_json(data).encode('utf-8'))
+        except (TypeError, ValueError):
+            log.debug('Could not demote message ID %s to the cold message cache.', message.id)
+            return
+
+        self._cold[message.id] = (utils._get_as_snowflake(data, 'guild_id'), blob)
+        self.cold_bytes += sys.getsizeof(blob)
+        while self.cold_bytes > self.max_bytes and self._cold:
+            _, (_, dropped) = self._cold.popitem(last=False)
+            self.cold_bytes -= sys.getsizeof(dropped)
+
+class _ChannelMessages(collections.abc.Sequence):
+    # The partition of a channel is replaced once it runs empty,
+    # so it is looked up again for every access.
+
+    __slots__ = ('_cache', '_channel_id')
+
+    def __init__(self, cache, channel_id):
+        self._cache = cache
+        self._channel_id = channel_id
+
+    def __getitem__(self, idx):
+        messages = self._cache.channel_messages(self._channel_id)
+        if isinstance(idx, slice):
+            return list(messages)[idx]
+        return messages[idx]
+
+    def __len__(self):
+        return len(self._cache.channel_messages(self._channel_id))
+
+    def __contains__(self, message):
+        return message in self._cache.channel_messages(self._channel_id)
+
+    def __iter__(self):
+        return iter(self._cache.channel_messages(self._channel_id))
+
+    def __reversed__(self):
+        return reversed(self._cache.channel_messages(self._channel_id))
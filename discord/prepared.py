@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from . import utils
+from .components import _components_to_dict
+from .errors import InvalidArgument
+from .mentions import AllowedMentions
+
+__all__ = (
+    'PreparedMessage',
+)
+
+class PreparedMessage:
+    """Represents a message whose payload is built once and reused.
+
+    Sending the same embeds and components over and over again converts and
+    serializes them on every call. A :class:`PreparedMessage` does this once and
+    caches the serialized JSON, which is then reused by
+    :meth:`abc.Messageable.send`, :meth:`Message.edit`, :meth:`Interaction.respond`,
+    :meth:`Interaction.edit` and :meth:`Webhook.send` when passed as ``prepared``.
+
+    Per-call arguments such as ``content``, ``nonce`` or ``reference`` are still
+    accepted alongside ``prepared`` and are merged into the cached payload.
+
+    .. note::
+
+        The embeds and components are converted when the message is prepared,
+        changing them afterwards does not change the prepared message.
+
+    .. code-block:: python3
+
+        panel = discord.PreparedMessage(embed=embed, components=[row])
+        await channel.send('Pick one', prepared=panel)
+
+    Parameters
+    ------------
+    content: Optional[:class:`str`]
+        The default content of the message.
+    tts: :class:`bool`
+        Indicates if the message should be sent using text-to-speech.
+    embed: Optional[:class:`Embed`]
+        The rich embed of the message.
+    embeds: Optional[List[:class:`Embed`]]
+        A list containing up to ten embeds.
+    components: List[Union[:class:`ActionRow`, List[Union[:class:`Button`, :class:`SelectMenu`]]]]
+        The components of the message.
+    allowed_mentions: Optional[:class:`AllowedMentions`]
+        Controls the mentions being processed in this message. This is merged
+        with :attr:`Client.allowed_mentions` the same way :meth:`abc.Messageable.send` does.
+
+    Raises
+    -------
+    InvalidArgument
+        More than ten embeds were passed.
+    """
+
+    __slots__ = ('_content', '_tts', '_embeds', '_components', '_allowed_mentions', '_payloads')
+
+    def __init__(self, content=None, *, tts=False, embed=None, embeds=None, components=None, allowed_mentions=None):
+        self._content = str(content) if content is not None else None
+        self._tts = bool(tts)
+
+        embed_list = []
+        if embed is not None:
+            embed_list.append(embed.to_dict())
+        if embeds:
+            embed_list.extend([e.to_dict() for e in embeds])
+        if len(embed_list) > 10:
+            raise InvalidArgument(f'The maximum number of embeds that can be send with a message is 10, got: {len(embed_list)}')
+
+        self._embeds = embed_list
+        self._components = _components_to_dict(components) if components else []
+        self._allowed_mentions = allowed_mentions
+        # Dict[Tuple[Optional[AllowedMentions], Optional[bool], bool], str] of the serialized payloads
+        self._payloads = {}
+
+    def __repr__(self):
+        return '<PreparedMessage content={0._content!r} embeds={1} components={2}>' \
+               .format(self, len(self._embeds), len(self._components))
+
+    @property
+    def content(self):
+        """Optional[:class:`str`]: The default content of the message."""
+        return self._content
+
+    def _serialize(self, default_mentions, mention_author, edit):
+        key = (default_mentions, mention_author, edit)
+        try:
+            return self._payloads[key]
+        except KeyError:
+            pass
+
+        payload = {}
+        if self._tts and not edit:
+            payload['tts'] = True
+
+        # an edit replaces the whole message, so empty lists are sent to clear it
+        if self._embeds or edit:
+            payload['embeds'] = self._embeds
+        if self._components or edit:
+            payload['components'] = self._components
+
+        allowed_mentions = self._allowed_mentions
+        if allowed_mentions is not None:
+            if default_mentions is not None:
+                allowed_mentions = default_mentions.merge(allowed_mentions).to_dict()
+            else:
+                allowed_mentions = allowed_mentions.to_dict()
+        else:
+            allowed_mentions = default_mentions and default_mentions.to_dict()
+
+        if mention_author is not None:
+            allowed_mentions = allowed_mentions or AllowedMentions().to_dict()
+            allowed_mentions['replied_user'] = bool(mention_author)
+
+        if allowed_mentions:
+            payload['allowed_mentions'] = allowed_mentions
+
+        self._payloads[key] = serialized = utils.to_json(payload)
+        return serialized
+
+    def _to_payload(self, default_mentions, *, content=None, mention_author=None, edit=False, **fields):
+        # fields are the per-call keys, those that are None are left out
+        dynamic = {k: v for k, v in fields.items() if v is not None}
+        if content is None:
+            content = self._content
+        if content is not None:
+            dynamic['content'] = str(content)
+        elif edit:
+            dynamic['content'] = None
+
+        return utils._merge_json(dynamic, self._serialize(default_mentions, mention_author, edit))
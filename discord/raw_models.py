@@ -32,6 +32,7 @@ from .user import User
 from .message import Message
 from .errors import NotFound, UnknowInteraction
 from .channel import DMChannel
+from . import utils
 
 
 class _RawReprMixin:
@@ -116,15 +117,19 @@ class RawMessageUpdateEvent(_RawReprMixin):
     cached_message: Optional[:class:`Message`]
         The cached message, if found in the internal message cache. Represents the message before
         it is modified by the data in :attr:`RawMessageUpdateEvent.data`.
+    diff: Optional[:class:`UpdateDiff`]
+        The changes made to the cached message, if it was found and the client was created
+        with ``update_snapshots='diff'``.
     """
 
-    __slots__ = ('message_id', 'channel_id', 'guild_id', 'data', 'cached_message')
+    __slots__ = ('message_id', 'channel_id', 'guild_id', 'data', 'cached_message', 'diff')
 
     def __init__(self, data):
         self.message_id = int(data['id'])
         self.channel_id = int(data['channel_id'])
         self.data = data
         self.cached_message = None
+        self.diff = None
 
         try:
             self.guild_id = int(data['guild_id'])
@@ -233,6 +238,87 @@ class RawReactionClearEmojiEvent(_RawReprMixin):
             self.guild_id = None
 
 
+_MISSING = object()
+
+
+class UpdateDiff:
+    """Represents the ``before`` argument of an update event when the client
+    was created with ``update_snapshots='diff'``.
+
+    Instead of a full copy of the object it only records the fields that were
+    changed by the update. Accessing an attribute returns its old value if it
+    was changed and the current value of the updated object otherwise.
+    Properties are evaluated against the old values.
+
+    .. container:: operations
+
+        .. describe:: iter(x)
+
+            Returns an iterator of ``(name, (old, new))`` tuples of the changed fields.
+
+        .. describe:: len(x)
+
+            Returns the number of changed fields.
+
+    Attributes
+    ------------
+    changes: Dict[:class:`str`, Tuple[Any, Any]]
+        A mapping of the changed field names to their old and new values.
+    """
+
+    __slots__ = ('_after', '_before', '_unset', 'changes')
+
+    def __init__(self, obj):
+        self._after = obj
+        self._before = tuple(getattr(obj, name, _MISSING) for name in utils._get_slots(obj.__class__))
+        self._unset = ()
+        self.changes = {}
+
+    def _resolve(self, *, exclude=()):
+        after = self._after
+        changes = self.changes
+        unset = []
+        for name, old in zip(utils._get_slots(after.__class__), self._before):
+            # the caches of cached_slot_property are not part of the state
+            if name in exclude or name.startswith('_cs_'):
+                continue
+            if old is _MISSING:
+                # the slot was not set (e.g. filled lazily), so it must not be read from after the update
+                unset.append(name)
+                continue
+            new = getattr(after, name, _MISSING)
+            if old is not new and old != new:
+                changes[name] = (old, None if new is _MISSING else new)
+
+        self._before = None
+        self._unset = frozenset(unset)
+        return self
+
+    def __getattr__(self, name):
+        try:
+            return self.changes[name][0]
+        except KeyError:
+            pass
+
+        if name in self._unset:
+            raise AttributeError(name)
+
+        attr = getattr(self._after.__class__, name, None)
+        if isinstance(attr, property) and attr.fget is not None:
+            return attr.fget(self)
+        return getattr(self._after, name)
+
+    def __iter__(self):
+        return iter(self.changes.items())
+
+    def __len__(self):
+        return len(self.changes)
+
+    def __repr__(self):
+        values = ' '.join('%s=%r' % (name, old) for name, (old, _) in self.changes.items())
+        return '<UpdateDiff of %s %s>' % (self._after.__class__.__name__, values)
+
+
 class RawInteractionCreateEvent(_RawReprMixin):
     def __init__(self, data, http=None):
         self.http = http
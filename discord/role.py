@@ -253,12 +253,23 @@ class Role(Hashable):
     @property
     def members(self):
         """List[:class:`Member`]: Returns all the members with this role."""
-        all_members = self.guild.members
+        guild = self.guild
         if self.is_default():
-            return all_members
+            return guild.members
 
-        role_id = self.id
-        return [member for member in all_members if member._roles.has(role_id)]
+        members = guild._members
+        return [members[member_id] for member_id in guild._role_member_index().members(self.id)]
+
+    @property
+    def member_count(self):
+        """:class:`int`: Returns the number of members with this role.
+
+        Like :attr:`members`, this only counts the cached members.
+        """
+        guild = self.guild
+        if self.is_default():
+            return len(guild._members)
+        return guild._role_member_index().count(self.id)
 
     async def _move(self, position, reason):
         if position <= 0:
@@ -348,6 +359,7 @@ class Role(Hashable):
 
         data = await self._state.http.edit_role(self.guild.id, self.id, reason=reason, **payload)
         self._update(data)
+        self.guild._roles_changed()
 
     async def delete(self, *, reason=None):
         """|coro|
@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import heapq
+import logging
+
+from .components import _components_to_dict
+
+log = logging.getLogger(__name__)
+
+__all__ = (
+    'ComponentSession',
+    'ComponentSessions',
+)
+
+class ComponentSession:
+    """A message whose components are routed and expired by :class:`ComponentSessions`.
+
+    These are not created manually, use :meth:`ComponentSessions.add` instead.
+
+    Attributes
+    -----------
+    message_id: :class:`int`
+        The ID of the message.
+    channel_id: :class:`int`
+        The ID of the channel the message is in.
+    components: Tuple[:class:`ActionRow`, ...]
+        The components of the message, used to disable them when the session expires.
+    expires_at: :class:`float`
+        The :meth:`~asyncio.AbstractEventLoop.time` at which the session expires.
+    """
+
+    __slots__ = ('message_id', 'channel_id', 'components', 'expires_at', 'on_click', 'on_timeout', '_manager')
+
+    def __init__(self, manager, message_id, channel_id, components, expires_at, on_click, on_timeout):
+        self._manager = manager
+        self.message_id = message_id
+        self.channel_id = channel_id
+        self.components = components
+        self.expires_at = expires_at
+        self.on_click = on_click
+        self.on_timeout = on_timeout
+
+    def __repr__(self):
+        return '<ComponentSession message_id={0.message_id} channel_id={0.channel_id} ' \
+               'expires_at={0.expires_at}>'.format(self)
+
+    def is_active(self):
+        """:class:`bool`: Whether the session has neither expired nor been stopped."""
+        return self._manager._sessions.get(self.message_id) is self
+
+    def renew(self, timeout=None):
+        """Pushes the expiry of the session back.
+
+        Parameters
+        -----------
+        timeout: Optional[:class:`float`]
+            The number of seconds from now until the session expires.
+            Defaults to the timeout of the :class:`ComponentSessions`.
+        """
+        self._manager._renew(self, timeout)
+
+    def stop(self):
+        """Removes the session without calling its timeout callback."""
+        self._manager.remove(self.message_id)
+
+    async def disable_components(self):
+        """|coro|
+
+        Edits the message so that all of its components are disabled,
+        using :meth:`ActionRow.disable_all_components`.
+
+        Raises
+        -------
+        HTTPException
+            Editing the message failed.
+        """
+        rows = [row.copy().disable_all_components() for row in self.components]
+        http = self._manager._state.http
+        await http.edit_message(self.channel_id, self.message_id, components=_components_to_dict(rows))
+
+
+class ComponentSessions:
+    """Routes the component interactions of many messages and expires them after a timeout.
+
+    Waiting for the clicks of a message with :meth:`Client.wait_for` creates a future,
+    a timeout handle and a listener for every message, and each listener is checked
+    for every click. This keeps every message in a dictionary instead, so a click is
+    routed to its session by the message ID, and keeps the expiry times in a single
+    heap that is served by one timer, so it scales to hundreds of thousands of messages.
+
+    Clicks on the messages are still dispatched to the regular events.
+
+    Parameters
+    -----------
+    client: :class:`Client`
+        The client whose component interactions are routed.
+    timeout: :class:`float`
+        The default number of seconds after which a session expires. Defaults to ``180.0``.
+    disable_on_timeout: :class:`bool`
+        Whether the components of a session that has no timeout callback are
+        disabled once it expires, see :meth:`ComponentSession.disable_components`.
+        Defaults to ``True``.
+    """
+
+    def __init__(self, client, *, timeout=180.0, disable_on_timeout=True):
+        self.client = client
+        self.timeout = timeout
+        self.disable_on_timeout = disable_on_timeout
+        self._state = state = client._connection
+        self._loop = client.loop
+        # Dict[int, ComponentSession] by message ID
+        self._sessions = {}
+        # heap of (expires_at, message_id), entries of renewed or removed sessions are skipped
+        self._heap = []
+        self._timer = None
+        state._component_sessions = self
+
+    def __repr__(self):
+        return '<ComponentSessions sessions={0} timeout={1.timeout}>'.format(len(self._sessions), self)
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def __contains__(self, message_id):
+        return message_id in self._sessions
+
+    def get(self, message_id):
+        """Returns the active session of a message or ``None``."""
+        return self._sessions.get(message_id)
+
+    def add(self, message, *, timeout=None, on_click=None, on_timeout=None):
+        """Starts a session for a message, replacing the previous session of the message.
+
+        Parameters
+        -----------
+        message: :class:`Message`
+            The message whose components are routed.
+        timeout: Optional[:class:`float`]
+            The number of seconds until the session expires.
+            Defaults to the timeout of the :class:`ComponentSessions`.
+        on_click: Optional[:ref:`coroutine <coroutine>`]
+            Called with the :class:`Interaction` and the component for every component
+            interaction on the message.
+        on_timeout: Optional[:ref:`coroutine <coroutine>`]
+            Called with the :class:`ComponentSession` once it expires.
+
+        Returns
+        --------
+        :class:`ComponentSession`
+            The session of the message.
+        """
+        if timeout is None:
+            timeout = self.timeout
+        session = ComponentSession(self, message.id, message.channel.id, tuple(message.components),
+                                   self._loop.time() + timeout, on_click, on_timeout)
+        self._sessions[message.id] = session
+        self._push(session)
+        return session
+
+    def remove(self, message_id):
+        """Removes the session of a message without calling its timeout callback.
+
+        Returns
+        --------
+        Optional[:class:`ComponentSession`]
+            The removed session, if there was one.
+        """
+        session = self._sessions.pop(message_id, None)
+        if not self._sessions:
+            self.close()
+        return session
+
+    def close(self):
+        """Removes all sessions without calling their timeout callbacks."""
+        self._sessions.clear()
+        self._heap.clear()
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _renew(self, session, timeout):
+        if not session.is_active():
+            return
+        session.expires_at = self._loop.time() + (self.timeout if timeout is None else timeout)
+        self._push(session)
+
+    def _push(self, session):
+        heap = self._heap
+        heapq.heappush(heap, (session.expires_at, session.message_id))
+        # renewals leave stale entries behind, the heap is rebuilt once they dominate
+        if len(heap) > 2 * len(self._sessions) + 64:
+            self._heap = heap = [(s.expires_at, s.message_id) for s in self._sessions.values()]
+            heapq.heapify(heap)
+        self._schedule()
+
+    def _schedule(self):
+        heap = self._heap
+        if not heap:
+            return
+        when = heap[0][0]
+        timer = self._timer
+        if timer is not None:
+            if timer.when() <= when:
+                return
+            timer.cancel()
+        self._timer = self._loop.call_at(when, self._expire)
+
+    def _expire(self):
+        self._timer = None
+        heap = self._heap
+        sessions = self._sessions
+        now = self._loop.time()
+        while heap and heap[0][0] <= now:
+            expires_at, message_id = heapq.heappop(heap)
+            session = sessions.get(message_id)
+            if session is None or session.expires_at != expires_at:
+                continue
+            del sessions[message_id]
+            self._timed_out(session)
+        self._schedule()
+
+    def _timed_out(self, session):
+        if session.on_timeout is not None:
+            coro = session.on_timeout
+        elif self.disable_on_timeout and session.components:
+            coro = ComponentSession.disable_components
+        else:
+            return
+        self.client._schedule_event(coro, 'on_session_timeout', session)
+
+    def _route(self, interaction):
+        session = self._sessions.get(interaction.message_id)
+        if session is None or session.on_click is None:
+            return
+        if session.expires_at <= self._loop.time():
+            # the timer has not fired yet
+            return
+        self.client._schedule_event(session.on_click, 'on_session_click', interaction, interaction.component)
@@ -108,9 +108,9 @@ class Shard:
         if self._task is not None and not self._task.done():
             self._task.cancel()
 
-    async def close(self):
+    async def close(self, code=1000):
         self._cancel_task()
-        await self.ws.close(code=1000)
+        await self.ws.close(code=code)
 
     async def disconnect(self):
         await self.close()
@@ -392,9 +392,14 @@ class AutoShardedClient(Client):
             for guild in sub_guilds:
                 await self._connection.chunk_guild(guild)
 
+    def _get_gateway_sessions(self):
+        return {shard_id: (shard.ws.session_id, shard.ws.sequence) for shard_id, shard in self.__shards.items()}
+
     async def launch_shard(self, gateway, shard_id, *, initial=False):
+        session, sequence = self._connection._restored_sessions.pop(shard_id, (None, None))
         try:
-            coro = DiscordWebSocket.from_client(self, initial=initial, gateway=gateway, shard_id=shard_id)
+            coro = DiscordWebSocket.from_client(self, initial=initial, gateway=gateway, shard_id=shard_id,
+                                                session=session, sequence=sequence, resume=session is not None)
             ws = await asyncio.wait_for(coro, timeout=180.0)
         except Exception:
             log.exception('Failed to connect for shard_id: %s. Retrying...', shard_id)
@@ -462,11 +467,14 @@ class AutoShardedClient(Client):
             except Exception:
                 pass
 
-        to_close = [asyncio.ensure_future(shard.close(), loop=self.loop) for shard in self.__shards.values()]
+        # a non-1000 close code keeps the sessions resumable
+        code = 4000 if self._connection._keep_session else 1000
+        to_close = [asyncio.ensure_future(shard.close(code), loop=self.loop) for shard in self.__shards.values()]
         if to_close:
             await asyncio.wait(to_close)
 
         await self.http.close()
+        self._connection._gc_detach()
         self.__queue.put_nowait(EventItem(EventType.clean_close, None, None))
 
     async def change_presence(self, *, activity=None, status=None, afk=False, shard_id=None):
@@ -27,8 +27,9 @@ DEALINGS IN THE SOFTWARE.
 """
 
 import asyncio
+import io
 import typing
-from collections import deque, OrderedDict
+from collections import OrderedDict
 import copy
 import datetime
 import itertools
@@ -36,7 +37,10 @@ import logging
 import weakref
 import warnings
 import inspect
+import functools
 import gc
+import pickle
+import zlib
 
 import os
 
@@ -54,10 +58,14 @@ from .member import Member
 from .role import Role
 from .enums import ChannelType, try_enum, Status
 from . import utils
-from .flags import Intents, MemberCacheFlags
+from .flags import Intents, MemberCacheFlags, CacheFlags
 from .object import Object
 from .invite import Invite
-from .interactions import Interaction, InteractionType
+from .interactions import Interaction, InteractionType, InteractionLatency
+from .gcpolicy import GCPolicy
+from .message_cache import MessageCache
+from .components import _ComponentCache
+from .abc import GuildChannel, PrivateChannel
 
 
 class ChunkRequest:
@@ -77,10 +85,8 @@ class ChunkRequest:
             if guild is None:
                 return
 
-            for member in members:
-                existing = guild.get_member(member.id)
-                if existing is None or existing.joined_at is None:
-                    guild._add_member(member)
+            added, updated = guild._add_members(members)
+            log.debug('Chunk for guild ID %s added %d and updated %d members.', self.guild_id, added, updated)
 
     async def wait(self):
         future = self.loop.create_future()
@@ -104,6 +110,144 @@ class ChunkRequest:
 log = logging.getLogger(__name__)
 
 
+def _guild_size_priority(guild):
+    # smaller guilds finish chunking quicker, so they become available first
+    return getattr(guild, '_member_count', None) or 0
+
+
+class ChunkScheduler:
+    # leave some of the gateway budget for presence, voice and other requests
+    RESERVED_REQUESTS = 10
+    PROGRESS_INTERVAL = 10.0
+
+    def __init__(self, state, *, concurrency=2, priority=None, timeout=60.0):
+        self.state = state
+        self.loop = state.loop
+        self.concurrency = concurrency
+        self.priority = priority or _guild_size_priority
+        self.timeout = timeout
+        self.guilds_chunked = 0
+        self.members_chunked = 0
+        self.started_at = None
+        self._queues = {} # Dict[Optional[int], asyncio.PriorityQueue]
+        self._workers = []
+        self._counter = itertools.count()
+        self._last_progress = 0.0
+
+    def schedule(self, guild):
+        shard_id = guild.shard_id
+        try:
+            queue = self._queues[shard_id]
+        except KeyError:
+            queue = self._queues[shard_id] = asyncio.PriorityQueue()
+            for _ in range(self.concurrency):
+                self._workers.append(asyncio.ensure_future(self._worker(queue), loop=self.loop))
+
+        if self.started_at is None:
+            self.started_at = self._last_progress = self.loop.time()
+
+        queue.put_nowait((self.priority(guild), next(self._counter), guild))
+
+    def _rate(self, value):
+        elapsed = self.loop.time() - self.started_at if self.started_at is not None else 0.0
+        return value / elapsed if elapsed else 0.0
+
+    @property
+    def guilds_per_second(self):
+        return self._rate(self.guilds_chunked)
+
+    @property
+    def members_per_second(self):
+        return self._rate(self.members_chunked)
+
+    async def _wait_for_budget(self, guild):
+        ws = self.state._get_websocket(guild.id)
+        limiter = getattr(ws, '_rate_limiter', None)
+        if limiter is None:
+            return
+
+        while limiter.get_remaining() <= self.RESERVED_REQUESTS:
+            await asyncio.sleep(limiter.get_reset_after() or 1.0)
+
+    async def _worker(self, queue):
+        while True:
+            _, _, guild = await queue.get()
+            try:
+                await self._chunk(guild)
+            except Exception:
+                log.exception('Failed to chunk guild ID %s.', guild.id)
+            finally:
+                queue.task_done()
+
+    async def _chunk(self, guild):
+        await self._wait_for_budget(guild)
+        future = await self.state.chunk_guild(guild, wait=False)
+        try:
+            members = await asyncio.wait_for(future, timeout=self.timeout)
+        except asyncio.TimeoutError:
+            log.warning('Shard ID %s timed out waiting for chunks for guild_id %s.', guild.shard_id, guild.id)
+        else:
+            self.guilds_chunked += 1
+            self.members_chunked += len(members)
+            self._report_progress()
+
+        self.state._dispatch_guild_ready(guild)
+
+    def _report_progress(self):
+        now = self.loop.time()
+        if now - self._last_progress < self.PROGRESS_INTERVAL:
+            return
+
+        self._last_progress = now
+        log.info('Chunked %d guilds (%d members) so far, %.2f guilds/s, %.2f members/s.',
+                 self.guilds_chunked, self.members_chunked, self.guilds_per_second, self.members_per_second)
+
+    async def join(self, shard_id=None):
+        queue = self._queues.get(shard_id)
+        if queue is not None:
+            await queue.join()
+
+    async def join_all(self):
+        for queue in list(self._queues.values()):
+            await queue.join()
+
+        if self.guilds_chunked:
+            log.info('Finished chunking %d guilds (%d members), %.2f guilds/s, %.2f members/s.',
+                     self.guilds_chunked, self.members_chunked, self.guilds_per_second, self.members_per_second)
+
+    def close(self):
+        for worker in self._workers:
+            worker.cancel()
+        self._workers.clear()
+
+
+class _SnapshotPickler(pickle.Pickler):
+    def __init__(self, file, state):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._state = state
+
+    def persistent_id(self, obj):
+        # the state and everything hanging off of it is rebound on load
+        if obj is self._state:
+            return 'state'
+        if obj is self._state.http:
+            return 'http'
+        return None
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    def __init__(self, file, state):
+        super().__init__(file)
+        self._state = state
+
+    def persistent_load(self, pid):
+        if pid == 'state':
+            return self._state
+        if pid == 'http':
+            return self._state.http
+        raise pickle.UnpicklingError('unsupported persistent object %r' % pid)
+
+
 async def logging_coroutine(coroutine, *, info):
     try:
         await coroutine
@@ -111,6 +255,20 @@ async def logging_coroutine(coroutine, *, info):
         log.exception('Exception occurred during %s', info)
 
 
+class _RawParsers(dict):
+    # Parsers used in raw mode: events without a dedicated parser are
+    # dispatched as on_raw_<event> with the decoded payload.
+    __slots__ = ('dispatch',)
+
+    def __init__(self, dispatch, parsers):
+        super().__init__(parsers)
+        self.dispatch = dispatch
+
+    def __missing__(self, event):
+        self[event] = func = functools.partial(self.dispatch, 'raw_' + event.lower())
+        return func
+
+
 class ConnectionState:
     def __init__(self, *, dispatch, handlers, hooks, syncer, http, loop, **options):
         self.loop = loop
@@ -119,6 +277,35 @@ class ConnectionState:
         if self.max_messages is not None and self.max_messages <= 0:
             self.max_messages = 1000
 
+        self.message_cache_bytes = options.get('message_cache_bytes')
+        if self.message_cache_bytes is not None and self.message_cache_bytes <= 0:
+            raise ValueError('message_cache_bytes must be a positive integer')
+
+        self.max_channel_messages = options.get('max_channel_messages')
+        if self.max_channel_messages is not None and self.max_channel_messages <= 0:
+            raise ValueError('max_channel_messages must be a positive integer')
+
+        self.max_guild_messages = options.get('max_guild_messages')
+        if self.max_guild_messages is not None and self.max_guild_messages <= 0:
+            raise ValueError('max_guild_messages must be a positive integer')
+
+        self.message_cache_ttl = options.get('message_cache_ttl')
+        if self.message_cache_ttl is not None and self.message_cache_ttl <= 0:
+            raise ValueError('message_cache_ttl must be positive')
+
+        component_cache_size = options.get('component_cache_size')
+        if component_cache_size is not None and component_cache_size <= 0:
+            raise ValueError('component_cache_size must be a positive integer')
+        self._component_cache = component_cache_size and _ComponentCache(component_cache_size)
+
+        self._auto_defer = options.get('auto_defer')
+        if self._auto_defer is not None and self._auto_defer <= 0:
+            raise ValueError('auto_defer must be positive')
+        # Dict[Optional[str], InteractionLatency] by the qualified name of the handler
+        self.interaction_latencies = {}
+        # set by a ComponentSessions
+        self._component_sessions = None
+
         self.dispatch = dispatch
         self.syncer = syncer
         self.is_bot = None
@@ -132,13 +319,27 @@ class ConnectionState:
             raise ValueError('guild_ready_timeout cannot be negative')
 
         self.guild_subscriptions = options.get('guild_subscriptions', True)
+
+        update_snapshots = options.get('update_snapshots', 'copy')
+        if update_snapshots not in ('copy', 'diff'):
+            raise ValueError("update_snapshots must be either 'copy' or 'diff' not %r" % update_snapshots)
+        self._diff_snapshots = update_snapshots == 'diff'
+        self._reconcile_cache = options.get('reconcile_cache', False)
+
+        gc_policy = options.get('gc_policy')
+        if gc_policy is not None:
+            if not isinstance(gc_policy, GCPolicy):
+                raise TypeError('gc_policy parameter must be GCPolicy not %r' % type(gc_policy))
+            gc_policy._attach()
+        self._gc_policy = gc_policy
         allowed_mentions = options.get('allowed_mentions')
 
         if allowed_mentions is not None and not isinstance(allowed_mentions, AllowedMentions):
             raise TypeError('allowed_mentions parameter must be AllowedMentions')
 
         self.allowed_mentions = allowed_mentions
-        self._chunk_requests = {} # Dict[Union[int, str], ChunkRequest]
+        self._chunk_requests = {} # Dict[str, ChunkRequest]
+        self._guild_chunk_requests = {} # Dict[int, ChunkRequest]
 
         activity = options.get('activity', None)
         if activity:
@@ -174,6 +375,14 @@ class ConnectionState:
 
         self._chunk_guilds = chunk_guilds
 
+        self._chunk_concurrency = options.get('chunk_concurrency', 2)
+        if self._chunk_concurrency < 1:
+            raise ValueError('chunk_concurrency must be at least 1')
+
+        self._chunk_priority = options.get('chunk_priority', None)
+        if self._chunk_priority is not None and not callable(self._chunk_priority):
+            raise TypeError('chunk_priority parameter must be a callable not %r' % type(self._chunk_priority))
+
         # Ensure these two are set properly
         if not intents.members and self._chunk_guilds:
             raise ValueError('Intents.members must be enabled to chunk guilds at startup.')
@@ -188,6 +397,14 @@ class ConnectionState:
             cache_flags._verify_intents(intents)
 
         self.member_cache_flags = cache_flags
+
+        entity_cache_flags = options.get('cache_flags', None)
+        if entity_cache_flags is None:
+            entity_cache_flags = CacheFlags.all()
+        elif not isinstance(entity_cache_flags, CacheFlags):
+            raise TypeError('cache_flags parameter must be CacheFlags not %r' % type(entity_cache_flags))
+
+        self.cache_flags = entity_cache_flags
         self._activity = activity
         self._status = status
         self._intents = intents
@@ -195,10 +412,25 @@ class ConnectionState:
         if not intents.members or cache_flags._empty:
             self.store_user = self.store_user_no_intents
 
-        self.parsers = parsers = {}
-        for attr, func in inspect.getmembers(self):
-            if attr.startswith('parse_'):
-                parsers[attr[6:].upper()] = func
+        # Dict[Optional[int], Tuple[str, int]] of gateway sessions restored from a cache snapshot
+        self._restored_sessions = {}
+        # shard IDs whose session was restored from a snapshot and has not been resumed yet
+        self._restored = set()
+        self._keep_session = False
+
+        self._raw_events_only = options.get('raw_events_only', False)
+        if self._raw_events_only:
+            self.parsers = _RawParsers(dispatch, {
+                'READY': self._raw_parse_ready,
+                'RESUMED': self._raw_parse_resumed,
+                'GUILD_CREATE': self._raw_parse_guild_create,
+                'GUILD_DELETE': self._raw_parse_guild_delete,
+            })
+        else:
+            self.parsers = parsers = {}
+            for attr, func in inspect.getmembers(self):
+                if attr.startswith('parse_'):
+                    parsers[attr[6:].upper()] = func
 
         self.clear()
 
@@ -208,30 +440,167 @@ class ConnectionState:
         self._emojis = {}
         self._calls = {}
         self._guilds = {}
+        # Dict[int, Guild] of the guilds that built their member name index
+        self._name_indexed_guilds = {}
         self._voice_clients = {}
 
         # LRU of max size 128
         self._private_channels = OrderedDict()
         # extra dict to look up private channels by user id
         self._private_channels_by_user = {}
-        self._messages = self.max_messages and deque(maxlen=self.max_messages)
+        if self.max_messages:
+            self._messages = MessageCache(self, max_messages=self.max_messages, max_bytes=self.message_cache_bytes,
+                                          max_channel_messages=self.max_channel_messages,
+                                          max_guild_messages=self.max_guild_messages, ttl=self.message_cache_ttl)
+        else:
+            self._messages = None
+
+        self._raw_guild_ids = set()
+
+        # guild IDs whose cache is being reconciled with a new session
+        self._reconciling = set()
+        # guild IDs whose members are pruned once they are chunked again
+        self._pending_prune = set()
 
         # In cases of large deallocations the GC should be called explicitly
         # To free the memory more immediately, especially true when it comes
         # to reconnect loops which cause mass allocations and deallocations.
-        gc.collect()
+        self._collect_garbage()
+
+    def _collect_garbage(self):
+        if self._gc_policy is None:
+            gc.collect()
+        else:
+            self._gc_policy._collect()
+
+    def _gc_ready_started(self):
+        if self._gc_policy is not None:
+            self._gc_policy._ready_started()
+
+    def _gc_ready_finished(self):
+        if self._gc_policy is not None:
+            self._gc_policy._ready_finished()
+
+    def _gc_attach(self):
+        if self._gc_policy is not None:
+            self._gc_policy._attach()
+
+    def _gc_detach(self):
+        if self._gc_policy is not None:
+            self._gc_policy._detach()
+
+    SNAPSHOT_MAGIC = b'DPYC'
+    SNAPSHOT_VERSION = 1
+
+    def dump_snapshot(self, fp, sessions):
+        buffer = io.BytesIO()
+        _SnapshotPickler(buffer, self).dump({
+            'user': self.user,
+            'users': dict(self._users),
+            'guilds': list(self._guilds.values()),
+            'private_channels': list(self._private_channels.values()),
+            'sessions': sessions,
+        })
+        fp.write(self.SNAPSHOT_MAGIC)
+        fp.write(bytes((self.SNAPSHOT_VERSION,)))
+        fp.write(zlib.compress(buffer.getvalue()))
+
+    def load_snapshot(self, fp):
+        header = fp.read(len(self.SNAPSHOT_MAGIC) + 1)
+        if header[:-1] != self.SNAPSHOT_MAGIC:
+            raise ValueError('not a cache snapshot')
+        if header[-1] != self.SNAPSHOT_VERSION:
+            raise ValueError('unsupported cache snapshot version %d' % header[-1])
+
+        data = _SnapshotUnpickler(io.BytesIO(zlib.decompress(fp.read())), self).load()
+
+        self.clear()
+        self.user = user = data['user']
+        self._users.update(data['users'])
+        if user is not None:
+            self._users[user.id] = user
+
+        for guild in data['guilds']:
+            self._add_guild(guild)
+            for emoji in guild.emojis:
+                self._emojis[emoji.id] = emoji
+
+        for channel in data['private_channels']:
+            self._add_private_channel(channel)
+
+        self._restored_sessions = {shard_id: session for shard_id, session in data['sessions'].items()
+                                   if session[0] is not None}
+        self._restored = set(self._restored_sessions)
+        log.info('Restored %d guilds and %d users from a cache snapshot.', len(self._guilds), len(self._users))
+
+    def _cache_sections(self, guild=None):
+        if guild is not None:
+            guilds = (guild,)
+            messages = [m for m in self._messages or () if getattr(m.guild, 'id', None) == guild.id]
+        else:
+            guilds = tuple(self._guilds.values())
+            messages = self._messages or ()
+
+        sections = {}
+        if guild is None:
+            sections['users'] = list(self._users.values())
+        sections['guilds'] = guilds
+        sections['members'] = [m for g in guilds for m in g._members.values()]
+        sections['channels'] = [c for g in guilds for c in g._channels.values()]
+        sections['roles'] = [r for g in guilds for r in g._roles.values()]
+        sections['emojis'] = [e for g in guilds for e in g.emojis]
+        sections['voice_states'] = [v for g in guilds for v in g._voice_states.values()]
+        sections['messages'] = messages
+        if guild is None:
+            sections['private_channels'] = list(self._private_channels.values())
+        return sections
+
+    def cache_stats(self, *, guild=None, sample=None):
+        # every cached model is accounted for in its own section only,
+        # references to other models are not followed
+        stop = (ConnectionState, Guild, User, ClientUser, Member, Role, Emoji, Message,
+                GuildChannel, PrivateChannel, asyncio.AbstractEventLoop)
+        seen = set()
+        stats = {}
+        for name, objects in self._cache_sections(guild).items():
+            count = len(objects)
+            size = utils._estimate_sizeof(objects, count=count, seen=seen, stop=stop, sample=sample)
+            stats[name] = {'count': count, 'size': size}
+        return stats
 
     def process_chunk_requests(self, guild_id, nonce, members, complete):
-        removed = []
-        for key, request in self._chunk_requests.items():
-            if request.guild_id == guild_id and request.nonce == nonce:
-                request.add_members(members)
-                if complete:
-                    request.done()
-                    removed.append(key)
+        request = self._chunk_requests.get(nonce)
+        if request is None or request.guild_id != guild_id:
+            return
 
-        for key in removed:
-            del self._chunk_requests[key]
+        request.add_members(members)
+        if complete:
+            request.done()
+            del self._chunk_requests[nonce]
+            if self._gc_policy is not None and request.cache:
+                self._gc_policy._chunked(len(request.buffer))
+            if self._guild_chunk_requests.get(guild_id) is request:
+                del self._guild_chunk_requests[guild_id]
+                if guild_id in self._pending_prune:
+                    self._pending_prune.discard(guild_id)
+                    if request.cache:
+                        self._prune_reconciled_members(guild_id, {member.id for member in request.buffer})
+
+    def _has_listeners(self, event):
+        # This is overwritten by the client, without one we assume
+        # that every event is consumed
+        return True
+
+    def _snapshot(self, obj, copier=copy.copy):
+        # The object must be snapshotted before it gets updated
+        if self._diff_snapshots:
+            return UpdateDiff(obj)
+        return copier(obj)
+
+    def _dispatch_update(self, event, before, after, *, exclude=()):
+        if before.__class__ is UpdateDiff:
+            before._resolve(exclude=exclude)
+        self.dispatch(event, before, after)
 
     def call_handlers(self, key, *args, **kwargs):
         try:
@@ -295,8 +664,9 @@ class ConnectionState:
         return self._users.get(id)
 
     def store_emoji(self, guild, data):
-        emoji_id = int(data['id'])
-        self._emojis[emoji_id] = emoji = Emoji(guild=guild, state=self, data=data)
+        emoji = Emoji(guild=guild, state=self, data=data)
+        if self.cache_flags.emojis:
+            self._emojis[emoji.id] = emoji
         return emoji
 
     @property
@@ -308,9 +678,15 @@ class ConnectionState:
 
     def _add_guild(self, guild):
         self._guilds[guild.id] = guild
+        # a replaced guild must not be reindexed anymore
+        if guild._member_names is not None:
+            self._name_indexed_guilds[guild.id] = guild
+        else:
+            self._name_indexed_guilds.pop(guild.id, None)
 
     def _remove_guild(self, guild):
         self._guilds.pop(guild.id, None)
+        self._name_indexed_guilds.pop(guild.id, None)
 
         for emoji in guild.emojis:
             self._emojis.pop(emoji.id, None)
@@ -319,7 +695,7 @@ class ConnectionState:
 
         # Much like clear(), if we have a massive deallocation
         # then it's better to explicitly call the GC
-        gc.collect()
+        self._collect_garbage()
 
     @property
     def emojis(self):
@@ -345,6 +721,9 @@ class ConnectionState:
         return self._private_channels_by_user.get(user_id)
 
     def _add_private_channel(self, channel):
+        if not self.cache_flags.private_channels:
+            return
+
         channel_id = channel.id
         self._private_channels[channel_id] = channel
 
@@ -367,7 +746,12 @@ class ConnectionState:
             self._private_channels_by_user.pop(channel.recipient.id, None)
 
     def _get_message(self, msg_id):
-        return utils.find(lambda m: m.id == msg_id, reversed(self._messages)) if self._messages else None
+        return self._messages.get(msg_id) if self._messages is not None else None
+
+    def _get_channel_messages(self, channel_id):
+        if self._messages is None:
+            return []
+        return utils.SequenceProxy(self._messages.channel_view(channel_id))
 
     def _add_guild_from_data(self, guild):
         guild = Guild(data=guild, state=self)
@@ -376,7 +760,10 @@ class ConnectionState:
 
     def _guild_needs_chunking(self, guild):
         # If presences are enabled then we get back the old guild.large behaviour
-        return self._chunk_guilds and not guild.chunked and not (self._intents.presences and not guild.large)
+        if not self._chunk_guilds or (self._intents.presences and not guild.large):
+            return False
+        # reconciled guilds are chunked again to find the members that left in the meantime
+        return not guild.chunked or guild.id in self._pending_prune
 
     def _get_guild_channel(self, data):
         channel_id = int(data['channel_id'])
@@ -411,11 +798,21 @@ class ConnectionState:
             log.warning('Timed out waiting for chunks with query %r and limit %d for guild_id %d', query, limit, guild_id)
             raise
 
+    def _dispatch_guild_ready(self, guild):
+        if guild.unavailable is False:
+            self.dispatch('guild_available', guild)
+        else:
+            self.dispatch('guild_join', guild)
+
+    def _get_chunk_scheduler(self):
+        return ChunkScheduler(self, concurrency=self._chunk_concurrency, priority=self._chunk_priority)
+
     async def _delay_ready(self):
+        scheduler = None
         try:
             # only real bots wait for GUILD_CREATE streaming
             if self.is_bot:
-                states = []
+                scheduler = self._get_chunk_scheduler()
                 while True:
                     # this snippet of code is basically waiting N seconds
                     # until the last GUILD_CREATE was sent
@@ -425,24 +822,12 @@ class ConnectionState:
                         break
                     else:
                         if self._guild_needs_chunking(guild):
-                            future = await self.chunk_guild(guild, wait=False)
-                            states.append((guild, future))
+                            # guild_available is dispatched by the scheduler once the guild is chunked
+                            scheduler.schedule(guild)
                         else:
-                            if guild.unavailable is False:
-                                self.dispatch('guild_available', guild)
-                            else:
-                                self.dispatch('guild_join', guild)
-
-                for guild, future in states:
-                    try:
-                        await asyncio.wait_for(future, timeout=5.0)
-                    except asyncio.TimeoutError:
-                        log.warning('Shard ID %s timed out waiting for chunks for guild_id %s.', guild.shard_id, guild.id)
+                            self._dispatch_guild_ready(guild)
 
-                    if guild.unavailable is False:
-                        self.dispatch('guild_available', guild)
-                    else:
-                        self.dispatch('guild_join', guild)
+                await scheduler.join_all()
 
             # remove the state
             try:
@@ -458,22 +843,89 @@ class ConnectionState:
             pass
         else:
             # dispatch the event
+            self._gc_ready_finished()
             self.call_handlers('ready')
             self.dispatch('ready')
         finally:
+            if scheduler is not None:
+                scheduler.close()
             self._ready_task = None
 
+    def _can_reconcile(self, data):
+        return self._reconcile_cache and self.user is not None and self.user.id == int(data['user']['id'])
+
+    def _reconcile_guilds(self, guilds, *, shard_id=None):
+        # Keeps the cached guilds that are still part of the new session.
+        # They are considered unavailable until their GUILD_CREATE arrives
+        # and updates them in place, see _get_create_guild.
+        guild_ids = set()
+        for guild_data in guilds:
+            guild_id = int(guild_data['id'])
+            guild_ids.add(guild_id)
+            guild = self._get_guild(guild_id)
+            if guild is None:
+                self._add_guild_from_data(guild_data)
+            else:
+                guild.unavailable = guild_data.get('unavailable', True)
+                self._reconciling.add(guild_id)
+
+        removed = [guild for guild in self._guilds.values()
+                   if guild.id not in guild_ids and (shard_id is None or guild.shard_id == shard_id)]
+        for guild in removed:
+            self._guilds.pop(guild.id, None)
+            self._name_indexed_guilds.pop(guild.id, None)
+            self._reconciling.discard(guild.id)
+            self._pending_prune.discard(guild.id)
+            for emoji in guild.emojis:
+                self._emojis.pop(emoji.id, None)
+
+        if removed and self._messages is not None:
+            self._messages.remove_guilds({guild.id for guild in removed})
+
+        log.debug('Reconciled %d guilds, %d guilds were removed.', len(guild_ids), len(removed))
+
+    def _reconcile_member(self, guild, data):
+        member = guild.get_member(int(data['user']['id']))
+        if member is None:
+            return Member(guild=guild, data=data, state=self)
+
+        member._update(data)
+        user_update = member._update_inner_user(data['user'])
+        guild._reindex_member(member)
+        if user_update:
+            self._reindex_user(member.id)
+        return member
+
+    def _prune_reconciled_members(self, guild_id, member_ids):
+        guild = self._get_guild(guild_id)
+        if guild is None:
+            return
+
+        member_ids.add(self.self_id)
+        removed = guild._prune_members(member_ids)
+        log.debug('Pruned %d members that left guild ID %s while reconnecting.', removed, guild_id)
+
     def parse_ready(self, data):
         if self._ready_task is not None:
             self._ready_task.cancel()
 
         self._ready_state = asyncio.Queue()
-        self.clear()
-        self.user = user = ClientUser(state=self, data=data['user'])
-        self._users[user.id] = user
+        # a new session replaces the restored cache, _delay_ready dispatches ready
+        self._restored.clear()
+        self._gc_ready_started()
+        if self._can_reconcile(data):
+            # update the cache in place instead of throwing it away
+            self.user._update(data['user'])
+            self._reconcile_guilds(data['guilds'])
+            user = self.user
+            user._relationships.clear()
+        else:
+            self.clear()
+            self.user = user = ClientUser(state=self, data=data['user'])
+            for guild_data in data['guilds']:
+                self._add_guild_from_data(guild_data)
 
-        for guild_data in data['guilds']:
-            self._add_guild_from_data(guild_data)
+        self._users[user.id] = user
 
         for relationship in data.get('relationships', []):
             try:
@@ -484,21 +936,70 @@ class ConnectionState:
                 user._relationships[r_id] = Relationship(state=self, data=relationship)
 
         for pm in data.get('private_channels', []):
+            if self._get_private_channel(int(pm['id'])) is not None:
+                continue
             factory, _ = _channel_factory(pm['type'])
             self._add_private_channel(factory(me=user, data=pm, state=self))
 
         self.dispatch('connect')
         self._ready_task = asyncio.ensure_future(self._delay_ready(), loop=self.loop)
 
+    def _dispatch_restored_ready(self, shard_id=None):
+        # A RESUME after restoring a snapshot does not send READY, so the cache
+        # restored from the snapshot is what we are going to be ready with once
+        # every restored session has been resumed.
+        restored = self._restored
+        if shard_id is None:
+            # without sharding there is only the one session
+            if not restored:
+                return
+            restored.clear()
+        else:
+            if shard_id not in restored:
+                return
+            restored.discard(shard_id)
+            if restored:
+                return
+
+        if self._ready_task is None:
+            self._gc_ready_finished()
+            self.call_handlers('ready')
+            self.dispatch('ready')
+
     def parse_resumed(self, data):
         self.dispatch('resumed')
+        self._dispatch_restored_ready()
+
+    def _raw_parse_ready(self, data):
+        self.user = user = ClientUser(state=self, data=data['user'])
+        self._users[user.id] = user
+        # a new session starts with exactly the guilds listed in READY
+        self._raw_guild_ids = {int(guild['id']) for guild in data['guilds']}
+        self.dispatch('raw_ready', data)
+        self.dispatch('connect')
+        self._gc_ready_finished()
+        self.call_handlers('ready')
+        self.dispatch('ready')
+
+    def _raw_parse_resumed(self, data):
+        self.dispatch('raw_resumed', data)
+        self.dispatch('resumed')
+
+    def _raw_parse_guild_create(self, data):
+        self._raw_guild_ids.add(int(data['id']))
+        self.dispatch('raw_guild_create', data)
+
+    def _raw_parse_guild_delete(self, data):
+        if not data.get('unavailable', False):
+            self._raw_guild_ids.discard(int(data['id']))
+        self.dispatch('raw_guild_delete', data)
 
     def parse_message_create(self, data):
         channel, _ = self._get_guild_channel(data)
         message = Message(channel=channel, data=data, state=self)
         self.dispatch('message', message)
         if self._messages is not None:
-            self._messages.append(message)
+            self._messages.append(message, data)
         if channel and channel.__class__ is TextChannel:
             channel.last_message_id = message.id
 
@@ -513,8 +1014,8 @@ class ConnectionState:
 
     def parse_message_delete_bulk(self, data):
         raw = RawBulkMessageDeleteEvent(data)
-        if self._messages:
-            found_messages = [message for message in self._messages if message.id in raw.message_ids]
+        if self._messages is not None:
+            found_messages = [message for message in map(self._messages.get, raw.message_ids) if message is not None]
         else:
             found_messages = []
         raw.cached_messages = found_messages
@@ -528,35 +1029,57 @@ class ConnectionState:
         raw = RawMessageUpdateEvent(data)
         message = self._get_message(raw.message_id)
         if message is not None:
-            older_message = copy.copy(message)
-            raw.cached_message = older_message
+            if not self._has_listeners('message_edit') and not self._has_listeners('raw_message_edit'):
+                # nobody would see the old message, so don't bother copying it
+                message._update(data)
+                self._messages.update(message.id, data)
+                return
+
+            older_message = self._snapshot(message)
+            if older_message.__class__ is UpdateDiff:
+                raw.diff = older_message
+                if self._has_listeners('raw_message_edit'):
+                    raw.cached_message = copy.copy(message)
+            else:
+                raw.cached_message = older_message
             self.dispatch('raw_message_edit', raw)
             message._update(data)
+            self._messages.update(message.id, data)
             # Coerce the `after` parameter to take the new updated Member
             # ref: #5999
-            older_message.author = message.author
-            self.dispatch('message_edit', older_message, message)
+            if older_message.__class__ is not UpdateDiff:
+                older_message.author = message.author
+            self._dispatch_update('message_edit', older_message, message, exclude=('author',))
         else:
             self.dispatch('raw_message_edit', raw)
 
+    def _record_interaction_latency(self, handler, latency, *, late):
+        name = getattr(handler, '__qualname__', None)
+        try:
+            stats = self.interaction_latencies[name]
+        except KeyError:
+            stats = self.interaction_latencies[name] = InteractionLatency()
+        stats._record(latency, late)
+
     def parse_interaction_create(self, data):
+        self._receive_interaction(data)
+
+    def _receive_interaction(self, data):
+        # also used by the InteractionServer, returns the Interaction if one was created
         self.dispatch('interaction_create', data)
         if data.get('type', data.get('t', 0)) < 3:
-            return
+            return None
+        # the user, member, guild and channel are resolved lazily by the Interaction
         interaction = Interaction(state=self, data=data)
+        if self._auto_defer is not None:
+            interaction.set_auto_defer(self._auto_defer)
 
-        interaction.user = self.store_user(interaction._user)
-        if interaction.guild_id:
-            interaction._guild = self._get_guild(interaction.guild_id)
-            interaction._channel = interaction.guild.get_channel(interaction.channel_id)
-            interaction.member = interaction.guild.get_member(interaction.user_id)
-            if interaction.member is None:
-                # This can only be the case if member-intents are not activated. or the member is not in the guild-cache right now
-                interaction.member = Member(guild=interaction.guild, data=interaction._member, state=self)
-        else:
-            interaction._channel = self._get_private_channel(interaction.channel_id)
-        interaction.message = self._get_message(interaction.message_id) if interaction.message is None else interaction.message
-        if self._get_message(interaction.message_id) is not None:
+        if self._component_sessions is not None and interaction._interaction_type == InteractionType.Component:
+            self._component_sessions._route(interaction)
+
+        message = self._get_message(interaction.message_id)
+        if message is not None:
+            interaction.message = message
             if interaction._interaction_type == InteractionType.Component:
                 if interaction.component_type == 2:
                     self.dispatch('button_click', interaction, interaction.component)
@@ -565,12 +1088,13 @@ class ConnectionState:
                     self.dispatch('selection_select', interaction, interaction.component)
                     self.dispatch('raw_selection_select', interaction, interaction.component)
         else:
-            interaction.message = Message(state=self, channel=interaction.channel, data=interaction._message)
+            # the message is only created if it is accessed
             if interaction._interaction_type == InteractionType.Component:
                 if interaction.component_type == 2:
                     self.dispatch('raw_button_click', interaction, interaction.component)
                 elif interaction.component_type == 3:
                     self.dispatch('raw_selection_select', interaction, interaction.component)
+        return interaction
 
     def parse_message_reaction_add(self, data):
         emoji = data['emoji']
@@ -642,6 +1166,23 @@ class ConnectionState:
                 if reaction:
                     self.dispatch('reaction_clear_emoji', reaction)
 
+    def _dispatch_user_update(self, user_update):
+        before, after = user_update
+        if before.name != after.name or before.discriminator != after.discriminator:
+            self._reindex_user(after.id)
+        self.dispatch('user_update', before, after)
+
+    def _name_index_built(self, guild):
+        self._name_indexed_guilds[guild.id] = guild
+
+    def _reindex_user(self, user_id):
+        # users are shared between guilds, so the name indexes of every
+        # guild of the user have to be updated, not just the one of the event
+        for guild in self._name_indexed_guilds.values():
+            member = guild._members.get(user_id)
+            if member is not None:
+                guild._reindex_member(member)
+
     def parse_presence_update(self, data):
         guild_id = utils._get_as_snowflake(data, 'guild_id')
         guild = self._get_guild(guild_id)
@@ -652,7 +1193,17 @@ class ConnectionState:
         user = data['user']
         member_id = int(user['id'])
         member = guild.get_member(member_id)
+        if not self.cache_flags.presences:
+            # presences are not cached, only the user data can change
+            if member is not None and len(user) > 1:
+                user_update = member._update_inner_user(user)
+                guild._reindex_member(member)
+                if user_update:
+                    self._dispatch_user_update(user_update)
+            return
+
         flags = self.member_cache_flags
+        listening = self._has_listeners('member_update')
         if member is None:
             if 'username' not in user:
                 # sometimes we receive 'incomplete' member data post-removal.
@@ -663,18 +1214,21 @@ class ConnectionState:
             if flags.online or (flags._online_only and member.raw_status != 'offline'):
                 guild._add_member(member)
         else:
-            old_member = Member._copy(member)
+            old_member = self._snapshot(member, Member._copy) if listening else None
             user_update = member._presence_update(data=data, user=user)
+            guild._reindex_member(member)
             if user_update:
-                self.dispatch('user_update', user_update[0], user_update[1])
+                self._dispatch_user_update(user_update)
 
             if member.id != self.self_id and flags._online_only and member.raw_status == 'offline':
                 guild._remove_member(member)
 
-        self.dispatch('member_update', old_member, member)
+        if listening:
+            self._dispatch_update('member_update', old_member, member)
 
     def parse_user_update(self, data):
         self.user._update(data)
+        self._reindex_user(self.user.id)
 
     def parse_invite_create(self, data):
         invite = Invite.from_gateway(state=self, data=data)
@@ -705,9 +1259,13 @@ class ConnectionState:
         channel_id = int(data['id'])
         if channel_type is ChannelType.group:
             channel = self._get_private_channel(channel_id)
-            old_channel = copy.copy(channel)
+            if not self._has_listeners('private_channel_update'):
+                channel._update_group(data)
+                return
+
+            old_channel = self._snapshot(channel)
             channel._update_group(data)
-            self.dispatch('private_channel_update', old_channel, channel)
+            self._dispatch_update('private_channel_update', old_channel, channel)
             return
 
         guild_id = utils._get_as_snowflake(data, 'guild_id')
@@ -715,9 +1273,15 @@ class ConnectionState:
         if guild is not None:
             channel = guild.get_channel(channel_id)
             if channel is not None:
-                old_channel = copy.copy(channel)
+                if not self._has_listeners('guild_channel_update'):
+                    channel._update(guild, data)
+                    guild._channels_changed()
+                    return
+
+                old_channel = self._snapshot(channel)
                 channel._update(guild, data)
-                self.dispatch('guild_channel_update', old_channel, channel)
+                guild._channels_changed()
+                self._dispatch_update('guild_channel_update', old_channel, channel)
             else:
                 log.debug('CHANNEL_UPDATE referencing an unknown channel ID: %s. Discarding.', channel_id)
         else:
@@ -824,13 +1388,16 @@ class ConnectionState:
 
         member = guild.get_member(user_id)
         if member is not None:
-            old_member = Member._copy(member)
+            listening = self._has_listeners('member_update')
+            old_member = self._snapshot(member, Member._copy) if listening else None
             member._update(data)
             user_update = member._update_inner_user(user)
+            guild._reindex_member(member)
             if user_update:
-                self.dispatch('user_update', user_update[0], user_update[1])
+                self._dispatch_user_update(user_update)
 
-            self.dispatch('member_update', old_member, member)
+            if listening:
+                self._dispatch_update('member_update', old_member, member)
         else:
             if self.member_cache_flags.joined:
                 member = Member(data=data, guild=guild, state=self)
@@ -838,7 +1405,7 @@ class ConnectionState:
                 # Force an update on the inner user if necessary
                 user_update = member._update_inner_user(user)
                 if user_update:
-                    self.dispatch('user_update', user_update[0], user_update[1])
+                    self._dispatch_user_update(user_update)
 
                 guild._add_member(member)
             log.debug('GUILD_MEMBER_UPDATE referencing an unknown member ID: %s. Discarding.', user_id)
@@ -849,6 +1416,12 @@ class ConnectionState:
             log.debug('GUILD_EMOJIS_UPDATE referencing an unknown guild ID: %s. Discarding.', data['guild_id'])
             return
 
+        if not self.cache_flags.emojis:
+            if self._has_listeners('guild_emojis_update'):
+                after = tuple(Emoji(guild=guild, state=self, data=d) for d in data['emojis'])
+                self.dispatch('guild_emojis_update', guild, (), after)
+            return
+
         before_emojis = guild.emojis
         for emoji in before_emojis:
             self._emojis.pop(emoji.id, None)
@@ -856,6 +1429,23 @@ class ConnectionState:
         self.dispatch('guild_emojis_update', guild, before_emojis, guild.emojis)
 
     def _get_create_guild(self, data):
+        guild_id = int(data['id'])
+        if guild_id in self._reconciling:
+            self._reconciling.discard(guild_id)
+            guild = self._get_guild(guild_id)
+            if guild is not None:
+                for emoji in guild.emojis:
+                    self._emojis.pop(emoji.id, None)
+                guild._from_data(data, reconcile=True)
+                guild.unavailable = False
+                if self._intents.presences and not guild.large:
+                    # the member list is complete, so the guild is not chunked again
+                    member_ids = {int(member['user']['id']) for member in data.get('members', [])}
+                    self._prune_reconciled_members(guild_id, member_ids)
+                elif self._chunk_guilds:
+                    self._pending_prune.add(guild_id)
+                return guild
+
         if data.get('unavailable') is False:
             # GUILD_CREATE with unavailable in the response
             # usually means that the guild has become available
@@ -873,9 +1463,10 @@ class ConnectionState:
 
     async def chunk_guild(self, guild, *, wait=True, cache=None):
         cache = cache or self.member_cache_flags.joined
-        request = self._chunk_requests.get(guild.id)
+        request = self._guild_chunk_requests.get(guild.id)
         if request is None:
-            self._chunk_requests[guild.id] = request = ChunkRequest(guild.id, self.loop, self._get_guild, cache=cache)
+            request = ChunkRequest(guild.id, self.loop, self._get_guild, cache=cache)
+            self._guild_chunk_requests[guild.id] = self._chunk_requests[request.nonce] = request
             await self.chunker(guild.id, nonce=request.nonce)
 
         if wait:
@@ -928,9 +1519,13 @@ class ConnectionState:
     def parse_guild_update(self, data):
         guild = self._get_guild(int(data['id']))
         if guild is not None:
-            old_guild = copy.copy(guild)
+            if not self._has_listeners('guild_update'):
+                guild._from_data(data)
+                return
+
+            old_guild = self._snapshot(guild)
             guild._from_data(data)
-            self.dispatch('guild_update', old_guild, guild)
+            self._dispatch_update('guild_update', old_guild, guild)
         else:
             log.debug('GUILD_UPDATE referencing an unknown guild ID: %s. Discarding.', data['id'])
 
@@ -949,7 +1544,7 @@ class ConnectionState:
 
         # do a cleanup of the messages cache
         if self._messages is not None:
-            self._messages = deque((msg for msg in self._messages if msg.guild != guild), maxlen=self.max_messages)
+            self._messages.remove_guilds({guild.id})
 
         self._remove_guild(guild)
         self.dispatch('guild_remove', guild)
@@ -1007,18 +1602,33 @@ class ConnectionState:
             role_id = int(role_data['id'])
             role = guild.get_role(role_id)
             if role is not None:
-                old_role = copy.copy(role)
+                if not self._has_listeners('guild_role_update'):
+                    role._update(role_data)
+                    guild._roles_changed()
+                    return
+
+                old_role = self._snapshot(role)
                 role._update(role_data)
-                self.dispatch('guild_role_update', old_role, role)
+                guild._roles_changed()
+                self._dispatch_update('guild_role_update', old_role, role)
         else:
             log.debug('GUILD_ROLE_UPDATE referencing an unknown guild ID: %s. Discarding.', data['guild_id'])
 
     def parse_guild_members_chunk(self, data):
         guild_id = int(data['guild_id'])
+        nonce = data.get('nonce')
+        if nonce not in self._chunk_requests:
+            log.debug('GUILD_MEMBERS_CHUNK referencing an unknown nonce: %s. Discarding.', nonce)
+            return
+
         guild = self._get_guild(guild_id)
         presences = data.get('presences', [])
 
-        members = [Member(guild=guild, data=member, state=self) for member in data.get('members', [])]
+        if guild_id in self._pending_prune:
+            # update the members that are still cached from before the reconnect in place
+            members = [self._reconcile_member(guild, member) for member in data.get('members', [])]
+        else:
+            members = [Member(guild=guild, data=member, state=self) for member in data.get('members', [])]
         log.debug('Processed a chunk for %s members in guild ID %s.', len(members), guild_id)
 
         if presences:
@@ -1030,7 +1640,7 @@ class ConnectionState:
                 member._presence_update(presence, user)
 
         complete = data.get('chunk_index', 0) + 1 == data.get('chunk_count')
-        self.process_chunk_requests(guild_id, data.get('nonce'), members, complete)
+        self.process_chunk_requests(guild_id, nonce, members, complete)
 
     def parse_guild_integrations_update(self, data):
         guild = self._get_guild(int(data['guild_id']))
@@ -1193,54 +1803,33 @@ class AutoShardedConnectionState(ConnectionState):
     async def _delay_ready(self):
         await self.shards_launched.wait()
         processed = []
-        max_concurrency = len(self.shard_ids) * 2
-        current_bucket = []
-        while True:
-            # this snippet of code is basically waiting N seconds
-            # until the last GUILD_CREATE was sent
-            try:
-                guild = await asyncio.wait_for(self._ready_state.get(), timeout=self.guild_ready_timeout)
-            except asyncio.TimeoutError:
-                break
-            else:
-                if self._guild_needs_chunking(guild):
-                    log.debug('Guild ID %d requires chunking, will be done in the background.', guild.id)
-                    if len(current_bucket) >= max_concurrency:
-                        try:
-                            await utils.sane_wait_for(current_bucket, timeout=max_concurrency * 70.0)
-                        except asyncio.TimeoutError:
-                            fmt = 'Shard ID %s failed to wait for chunks from a sub-bucket with length %d'
-                            log.warning(fmt, guild.shard_id, len(current_bucket))
-                        finally:
-                            current_bucket = []
-
-                    # Chunk the guild in the background while we wait for GUILD_CREATE streaming
-                    future = asyncio.ensure_future(self.chunk_guild(guild))
-                    current_bucket.append(future)
+        scheduler = self._get_chunk_scheduler()
+        try:
+            while True:
+                # this snippet of code is basically waiting N seconds
+                # until the last GUILD_CREATE was sent
+                try:
+                    guild = await asyncio.wait_for(self._ready_state.get(), timeout=self.guild_ready_timeout)
+                except asyncio.TimeoutError:
+                    break
                 else:
-                    future = self.loop.create_future()
-                    future.set_result([])
+                    if self._guild_needs_chunking(guild):
+                        log.debug('Guild ID %d requires chunking, will be done in the background.', guild.id)
+                        # guild_available is dispatched by the scheduler once the guild is chunked
+                        scheduler.schedule(guild)
+                    else:
+                        self._dispatch_guild_ready(guild)
 
-                processed.append((guild, future))
+                    processed.append(guild)
 
-        guilds = sorted(processed, key=lambda g: g[0].shard_id)
-        for shard_id, info in itertools.groupby(guilds, key=lambda g: g[0].shard_id):
-            children, futures = zip(*info)
-            # 110 reqs/minute w/ 1 req/guild plus some buffer
-            timeout = 61 * (len(children) / 110)
-            try:
-                await utils.sane_wait_for(futures, timeout=timeout)
-            except asyncio.TimeoutError:
-                log.warning('Shard ID %s failed to wait for chunks (timeout=%.2f) for %d guilds', shard_id,
-                                                                                                  timeout,
-                                                                                                  len(guilds))
-            for guild in children:
-                if guild.unavailable is False:
-                    self.dispatch('guild_available', guild)
-                else:
-                    self.dispatch('guild_join', guild)
+            shard_ids = sorted(set(guild.shard_id for guild in processed))
+            for shard_id in shard_ids:
+                await scheduler.join(shard_id)
+                self.dispatch('shard_ready', shard_id)
 
-            self.dispatch('shard_ready', shard_id)
+            await scheduler.join_all()
+        finally:
+            scheduler.close()
 
         # remove the state
         try:
@@ -1254,6 +1843,7 @@ class AutoShardedConnectionState(ConnectionState):
         self._ready_task = None
 
         # dispatch the event
+        self._gc_ready_finished()
         self.call_handlers('ready')
         self.dispatch('ready')
 
@@ -1261,33 +1851,75 @@ class AutoShardedConnectionState(ConnectionState):
         if not hasattr(self, '_ready_state'):
             self._ready_state = asyncio.Queue()
 
-        self.user = user = ClientUser(state=self, data=data['user'])
-        self._users[user.id] = user
+        # a new session replaces the restored cache, _delay_ready dispatches ready
+        self._restored.clear()
+        self._gc_ready_started()
+
+        reconcile = self._can_reconcile(data)
+        if reconcile:
+            # update the shard's part of the cache in place instead of replacing it
+            self.user._update(data['user'])
+            user = self.user
+            self._reconcile_guilds(data['guilds'], shard_id=data['__shard_id__'])
+        else:
+            self.user = user = ClientUser(state=self, data=data['user'])
+            for guild_data in data['guilds']:
+                self._add_guild_from_data(guild_data)
 
-        for guild_data in data['guilds']:
-            self._add_guild_from_data(guild_data)
+            if self._messages:
+                self._update_message_references()
 
-        if self._messages:
-            self._update_message_references()
+        self._users[user.id] = user
 
         for pm in data.get('private_channels', []):
+            if self._get_private_channel(int(pm['id'])) is not None:
+                continue
             factory, _ = _channel_factory(pm['type'])
             self._add_private_channel(factory(me=user, data=pm, state=self))
 
         self.dispatch('connect')
         self.dispatch('shard_connect', data['__shard_id__'])
 
-        # Much like clear(), if we have a massive deallocation
-        # then it's better to explicitly call the GC
-        # Note that in the original ready parsing code this was done
-        # implicitly via clear() but in the auto sharded client clearing
-        # the cache would have the consequence of clearing data on other
-        # shards as well.
-        gc.collect()
+        if not reconcile:
+            # Much like clear(), if we have a massive deallocation
+            # then it's better to explicitly call the GC
+            # Note that in the original ready parsing code this was done
+            # implicitly via clear() but in the auto sharded client clearing
+            # the cache would have the consequence of clearing data on other
+            # shards as well.
+            self._collect_garbage()
 
         if self._ready_task is None:
             self._ready_task = asyncio.ensure_future(self._delay_ready(), loop=self.loop)
 
+    def _raw_parse_ready(self, data):
+        self.user = user = ClientUser(state=self, data=data['user'])
+        self._users[user.id] = user
+        # only replace the guilds of this shard, the other shards keep theirs
+        shard_id = data['__shard_id__']
+        shard_count = self.shard_count
+        raw_guild_ids = {guild_id for guild_id in self._raw_guild_ids if (guild_id >> 22) % shard_count != shard_id}
+        raw_guild_ids.update(int(guild['id']) for guild in data['guilds'])
+        self._raw_guild_ids = raw_guild_ids
+        self.dispatch('raw_ready', data)
+        self.dispatch('connect')
+        self.dispatch('shard_connect', data['__shard_id__'])
+        self.dispatch('shard_ready', data['__shard_id__'])
+        if self._ready_task is None:
+            self._ready_task = asyncio.ensure_future(self._raw_delay_ready(), loop=self.loop)
+
+    async def _raw_delay_ready(self):
+        await self.shards_launched.wait()
+        self._ready_task = None
+        self._gc_ready_finished()
+        self.call_handlers('ready')
+        self.dispatch('ready')
+
+    def _raw_parse_resumed(self, data):
+        super()._raw_parse_resumed(data)
+        self.dispatch('shard_resumed', data['__shard_id__'])
+
     def parse_resumed(self, data):
         self.dispatch('resumed')
         self.dispatch('shard_resumed', data['__shard_id__'])
+        self._dispatch_restored_ready(data['__shard_id__'])
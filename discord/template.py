@@ -63,6 +63,10 @@ class _PartialTemplateState:
     def member_cache_flags(self):
         return self.__state.member_cache_flags
 
+    @property
+    def cache_flags(self):
+        return self.__state.cache_flags
+
     def store_emoji(self, guild, packet):
         return None
 
@@ -75,6 +79,9 @@ class _PartialTemplateState:
     async def query_members(self, **kwargs):
         return []
 
+    def _name_index_built(self, guild):
+        pass
+
     def __getattr__(self, attr):
         raise AttributeError('PartialTemplateState does not support {0!r}.'.format(attr))
 
@@ -34,10 +34,14 @@ import datetime
 import typing
 from .enums import TimestampStyle
 import functools
+import itertools
 from inspect import isawaitable as _isawaitable, signature as _signature
 from operator import attrgetter
 import json
+import random
 import re
+import sys
+import types
 import warnings
 
 from .errors import InvalidArgument
@@ -353,9 +357,24 @@ def _bytes_to_base64_data(data):
     return fmt.format(mime=mime, data=b64)
 
 
+class _JSONPayload(str):
+    # a payload that has already been serialized, to_json passes it through as is
+    __slots__ = ()
+
 def to_json(obj):
+    if isinstance(obj, _JSONPayload):
+        return obj
     return json.dumps(obj, separators=(',', ':'), ensure_ascii=True)
 
+def _merge_json(fields, serialized):
+    # adds the keys of fields to an already serialized JSON object
+    if not fields:
+        return _JSONPayload(serialized)
+    head = to_json(fields)
+    if serialized == '{}':
+        return _JSONPayload(head)
+    return _JSONPayload(head[:-1] + ',' + serialized[1:])
+
 
 def _parse_ratelimit_header(request, *, use_clock=False):
     reset_after = request.headers.get('X-Ratelimit-Reset-After')
@@ -460,6 +479,69 @@ class SnowflakeList(array.array):
 _IS_ASCII = re.compile(r'^[\x00-\x7f]+$')
 
 
+_SLOTS_CACHE = {}
+_ATOMIC_TYPES = (str, bytes, int, float, bool, type(None), datetime.datetime)
+_IGNORED_TYPES = (type, types.ModuleType, types.FunctionType, types.MethodType, types.BuiltinFunctionType)
+
+def _get_slots(cls):
+    try:
+        return _SLOTS_CACHE[cls]
+    except KeyError:
+        slots = []
+        for base in cls.__mro__:
+            names = base.__dict__.get('__slots__', ())
+            if isinstance(names, str):
+                names = (names,)
+            slots.extend(name for name in names if name not in ('__dict__', '__weakref__'))
+        _SLOTS_CACHE[cls] = slots = tuple(slots)
+        return slots
+
+def _deep_sizeof(obj, *, seen, stop=()):
+    # Estimates the memory used by obj and everything it references.
+    # Objects in seen are not counted (again) and references to instances
+    # of the stop types are not followed.
+    size = 0
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        if id(o) in seen:
+            continue
+
+        seen.add(id(o))
+        size += sys.getsizeof(o)
+        if isinstance(o, _ATOMIC_TYPES):
+            continue
+
+        if isinstance(o, dict):
+            children = itertools.chain(o.keys(), o.values())
+        elif isinstance(o, (list, tuple, set, frozenset, collections.deque)):
+            children = o
+        elif isinstance(o, array.array):
+            continue
+        else:
+            children = [getattr(o, name, None) for name in _get_slots(o.__class__) if not name.startswith('__')]
+            try:
+                children.append(o.__dict__)
+            except AttributeError:
+                pass
+
+        for child in children:
+            if not isinstance(child, stop) and not isinstance(child, _IGNORED_TYPES):
+                stack.append(child)
+
+    return size
+
+def _estimate_sizeof(objects, *, count, seen, stop=(), sample=None):
+    # Estimates the memory used by an iterable of count objects.
+    # If sample is given only that many randomly picked objects are measured
+    # and the result is extrapolated to the total count.
+    if sample is None or count <= sample:
+        return sum(_deep_sizeof(obj, seen=seen, stop=stop) for obj in objects)
+
+    picked = random.sample(list(objects), sample)
+    measured = sum(_deep_sizeof(obj, seen=seen, stop=stop) for obj in picked)
+    return int(measured * count / sample)
+
 def _string_width(string, *, _IS_ASCII=_IS_ASCII):
     """Returns string's width."""
     match = _IS_ASCII.match(string)
@@ -40,6 +40,7 @@ from .enums import try_enum, WebhookType
 from .user import BaseUser, User
 from .asset import Asset
 from .mixins import Hashable
+from .flags import CacheFlags
 
 __all__ = (
     'WebhookAdapter',
@@ -409,6 +410,18 @@ class _PartialWebhookState:
     def is_bot(self):
         return True
 
+    @property
+    def cache_flags(self):
+        if self.parent is not None:
+            return self.parent.cache_flags
+        return CacheFlags.all()
+
+    @property
+    def _component_cache(self):
+        if self.parent is not None:
+            return self.parent._component_cache
+        return None
+
     @property
     def http(self):
         if self.parent is not None:
@@ -883,7 +896,8 @@ class Webhook(Hashable):
         return self._adapter.edit_webhook(reason=reason, **payload)
 
     def send(self, content=None, *, wait=False, username=None, avatar_url=None, tts=False,
-                                    file=None, files=None, embed=None, embeds=None, allowed_mentions=None):
+                                    file=None, files=None, embed=None, embeds=None, allowed_mentions=None,
+                                    prepared=None):
         """|maybecoro|
 
         Sends a message using the webhook.
@@ -932,6 +946,11 @@ class Webhook(Hashable):
 
             .. versionadded:: 1.4
 
+        prepared: Optional[:class:`PreparedMessage`]
+            A message whose embeds, components and allowed mentions were serialized
+            beforehand. ``content``, ``username`` and ``avatar_url`` can still be passed.
+            This cannot be mixed with ``tts``, ``embed``, ``embeds`` or ``allowed_mentions``.
+
         Raises
         --------
         HTTPException
@@ -943,7 +962,7 @@ class Webhook(Hashable):
         InvalidArgument
             You specified both ``embed`` and ``embeds`` or the length of
             ``embeds`` was invalid or there was no token associated with
-            this webhook.
+            this webhook, or you mixed ``prepared`` with the arguments it replaces.
 
         Returns
         ---------
@@ -959,6 +978,15 @@ class Webhook(Hashable):
         if embeds is not None and embed is not None:
             raise InvalidArgument('Cannot mix embed and embeds keyword arguments.')
 
+        if prepared is not None:
+            if tts or embed is not None or embeds is not None or allowed_mentions is not None:
+                raise InvalidArgument('Cannot mix prepared with tts, embed, embeds or allowed_mentions keyword arguments.')
+
+            payload = prepared._to_payload(getattr(self._state, 'allowed_mentions', None), content=content,
+                                           avatar_url=str(avatar_url) if avatar_url else None,
+                                           username=username or None)
+            return self._adapter.execute_webhook(wait=wait, file=file, files=files, payload=payload)
+
         if embeds is not None:
             if len(embeds) > 10:
                 raise InvalidArgument('embeds has a maximum of 10 elements.')